@@ -48,6 +48,8 @@ export interface QualityFilterParams {
 export interface SourceSeparationResult {
   n_sources: number;
   sample_rate: number;
+  /** 'wav' (WAV file) or 'f32le' (raw little-endian float32 samples) */
+  encoding: 'wav' | 'f32le';
   sources: Array<{
     index: number;
     audio_base64: string;
@@ -157,9 +159,11 @@ export async function qualityFilter(
 export async function sourceSeparation(
   file: File,
   nComponents: number = 2,
+  encoding: 'wav' | 'f32le' = 'wav',
 ): Promise<SourceSeparationResult> {
   const form = new FormData();
   form.append('file', file);
   form.append('n_components', String(nComponents));
+  form.append('encoding', encoding);
   return postForm('/processing/source-separation', form);
 }
@@ -1,43 +1,75 @@
 import yt_dlp
 import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog, Tk
 
 def download_audio(url, output_path):
     """
     Downloads audio from a YouTube video and converts it to WAV.
-    
+
+    Only the direct media URL is resolved with yt_dlp; a single ffmpeg
+    process then reads the stream over HTTP and writes the WAV, so the
+    source container is never written to (and read back from) disk.
+
     Parameters:
       url (str): YouTube video URL.
       output_path (str): File path to save the downloaded audio.
     """
-    ydl_opts = {
-        'format': 'bestaudio/best',
-        'postprocessors': [{
-            'key': 'FFmpegExtractAudio',
-            'preferredcodec': 'wav',
-            'preferredquality': '192',
-        }],
-        'outtmpl': output_path
-    }
+    ydl_opts = {'format': 'bestaudio/best', 'quiet': True}
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        ydl.download([url])
+        info = ydl.extract_info(url, download=False)
+
+    media_url = info.get('url')
+    if not media_url:
+        # No single direct stream (e.g. separate audio/video formats):
+        # fall back to the download + FFmpegExtractAudio route.
+        ydl_opts = {
+            'format': 'bestaudio/best',
+            'postprocessors': [{
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': 'wav',
+                'preferredquality': '192',
+            }],
+            'outtmpl': os.path.splitext(output_path)[0] + '.%(ext)s'
+        }
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            ydl.download([url])
+        return
 
-def download_from_file(file_path):
+    cmd = ['ffmpeg', '-y', '-loglevel', 'error']
+    headers = info.get('http_headers') or {}
+    if headers:
+        cmd += ['-headers', ''.join(f"{k}: {v}\r\n" for k, v in headers.items())]
+    cmd += ['-i', media_url, '-vn', '-f', 'wav', output_path]
+    subprocess.run(cmd, check=True)
+
+def download_from_file(file_path, max_workers=4):
     """
     Reads YouTube URLs from a file and downloads each as WAV.
     The output filenames are generated based on the input file's basename.
-    
+    Downloads run concurrently – each one is network- and ffmpeg-bound.
+
     Parameters:
       file_path (str): Path to the text file containing YouTube URLs.
+      max_workers (int): Number of downloads to run at once.
     """
     with open(file_path, 'r') as file:
         urls = file.readlines()
     base_name = os.path.splitext(os.path.basename(file_path))[0]
+    jobs = []
     for i, url in enumerate(urls, start=1):
         url = url.strip()
         if url:
-            output_path = f"{base_name}_{i}.wav"
-            download_audio(url, output_path)
+            jobs.append((url, f"{base_name}_{i}.wav"))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(download_audio, url, out): url for url, out in jobs}
+        for future, url in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Failed to download {url}: {e}")
 
 if __name__ == "__main__":
     # Use a file dialog to select the file with YouTube URLs.
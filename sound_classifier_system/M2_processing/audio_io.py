@@ -0,0 +1,158 @@
+"""
+Audio Loading
+===============
+Purpose:
+    One loader for every place that needs decoded samples.  WAV / FLAC /
+    OGG are read straight from libsndfile at their native rate – no
+    audioread dispatch, no resampler, no extra float copy.  Anything
+    libsndfile cannot decode (MP3 / M4A on older builds) falls back to
+    ``librosa.load``.
+
+LOGIC NOTE:
+    Output matches ``librosa.load(..., sr=sr)`` (mono float32), so it is
+    a drop-in replacement: multi-channel files are downmixed by the
+    channel mean, and the signal is only resampled when ``sr`` is given
+    and differs from the file's rate.  ``mono=False`` keeps the channels
+    instead, as a ``(frames, channels)`` array – soundfile's layout, not
+    librosa's ``(channels, frames)``.
+"""
+
+import os
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+import librosa
+import soundfile as sf
+
+
+def load_audio(source, sr: Optional[int] = None,
+               duration: Optional[float] = None,
+               mono: bool = True) -> Tuple[np.ndarray, int]:
+    """
+    Decode ``source`` (path or binary file object) to mono float32.
+
+    Parameters
+    ----------
+    source : str or file-like
+    sr : int or None
+        Target sample rate; ``None`` keeps the native rate.
+    duration : float or None
+        Only decode the first ``duration`` seconds (as in
+        ``librosa.load``); the rest of the file is never read.
+    mono : bool
+        Downmix to mono (default).  With ``False`` a multi-channel file
+        comes back as ``(frames, channels)``; mono files stay 1-D.
+
+    Returns
+    -------
+    (audio, sr)
+    """
+    try:
+        with sf.SoundFile(source) as f:
+            frames = -1 if duration is None else int(duration * f.samplerate)
+            audio = f.read(frames, dtype="float32", always_2d=False)
+            file_sr = f.samplerate
+    except RuntimeError:
+        # libsndfile can't decode this container – let librosa/audioread try
+        if hasattr(source, "seek"):
+            source.seek(0)
+        audio, file_sr = librosa.load(source, sr=sr, duration=duration, mono=mono)
+        return audio.T, file_sr
+
+    if audio.ndim > 1 and mono:
+        audio = audio.mean(axis=1, dtype=np.float32)
+    if sr is not None and sr != file_sr:
+        audio = librosa.resample(audio, orig_sr=file_sr, target_sr=sr, axis=0)
+        file_sr = sr
+    return audio, file_sr
+
+
+def prefetch(fn: Callable, items: Iterable, ahead: int = 2) -> Iterator:
+    """
+    Yield ``fn(item)`` for each of ``items`` in order, running up to
+    ``ahead`` calls in background threads while the caller works on the
+    current result.  An exception is raised when its item's turn comes,
+    as with a plain loop.
+    """
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=ahead) as pool:
+        pending = deque(pool.submit(fn, item) for _, item in zip(range(ahead), items))
+        try:
+            while pending:
+                fut = pending.popleft()
+                for item in items:
+                    pending.append(pool.submit(fn, item))
+                    break
+                yield fut.result()
+        finally:
+            for fut in pending:
+                fut.cancel()
+
+
+def prefetch_audio(paths: Iterable[str], ahead: int = 2,
+                   **kwargs) -> Iterator[Tuple[np.ndarray, int]]:
+    """
+    Yield ``load_audio(path, **kwargs)`` for each of ``paths`` in order,
+    decoding up to ``ahead`` files in background threads while the caller
+    works on the current one.
+
+    LOGIC NOTE:
+        libsndfile releases the GIL while reading, so on a cold cache or
+        network mount the next file's open/read latency overlaps the
+        caller's (CPU-bound) processing instead of adding to it.  A decode
+        error is raised when its file's turn comes, as with a plain loop.
+    """
+    return prefetch(partial(load_audio, **kwargs), paths, ahead)
+
+
+def write_audio(path: str, data: np.ndarray, samplerate: int, **kwargs) -> str:
+    """
+    ``sf.write(path, data, samplerate, **kwargs)`` that replaces ``path``
+    instead of rewriting it.
+
+    LOGIC NOTE:
+        Dataset files may be hard links shared between ``sampled_data/``
+        and the train / validation / test splits.  ``sf.write`` on an
+        existing path truncates that shared inode, silently changing
+        every linked copy.  Writing a temp file next to ``path`` and
+        ``os.replace``-ing it gives ``path`` a new inode and leaves the
+        other links untouched; readers never see a half-written file.
+    """
+    root, ext = os.path.splitext(path)
+    tmp = f"{root}.{uuid.uuid4().hex[:8]}.tmp{ext}"   # keep ext: sf.write infers format
+    try:
+        sf.write(tmp, data, samplerate, **kwargs)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    return path
+
+
+def export_mp3(segment, path: str) -> str:
+    """
+    Write a pydub ``AudioSegment`` to ``path`` as MP3.
+
+    LOGIC NOTE:
+        ``segment.export(format="mp3")`` forks an ffmpeg process per call –
+        per *chunk* in segmentation.  libsndfile ≥ 1.1 links LAME, so the
+        samples are encoded in-process instead.  Older libsndfile builds,
+        or sample rates MP3 cannot carry, fall back to ``export``.
+    """
+    if "MP3" in sf.available_formats():
+        samples = np.array(segment.get_array_of_samples(), dtype=np.float32)
+        samples /= 1 << (8 * segment.sample_width - 1)
+        try:
+            sf.write(path, samples.reshape(-1, segment.channels), segment.frame_rate,
+                     format="MP3", subtype="MPEG_LAYER_III")
+            return path
+        except RuntimeError:
+            pass
+    segment.export(path, format="mp3")
+    return path
+
@@ -0,0 +1,52 @@
+"""
+Sample-level Kernels
+======================
+Purpose:
+    Numba-compiled inner loops for the augmentation scripts.
+
+LOGIC NOTE:
+    Kernels are serial (no ``parallel=True``): the callers already run
+    one file per process, so a thread pool per worker would only
+    oversubscribe the cores.  No ``cache=True``: numba's on-disk cache
+    records the module name it was compiled under, and this package is
+    imported both as ``M2_processing...`` (API) and under its full
+    package path, so a cache written by one fails to load in the other.
+    Each process pays the ~0.3 s JIT once instead.  If a kernel fails
+    anyway, the wrapper falls back to the NumPy it replaces.
+"""
+
+import logging
+
+import numpy as np
+from numba import njit
+
+logger = logging.getLogger(__name__)
+
+# Largest int16 sample as a float in [-1, 1] – libsndfile's PCM_16
+# full scale.
+INT16_MAX = np.float32(32767 / 32768)
+
+
+@njit(fastmath=True)
+def _gain_clip(flat, gain, lo, hi):
+    for i in range(flat.size):
+        v = flat[i] * gain
+        flat[i] = min(max(v, lo), hi)
+
+
+def apply_gain_clip(samples: np.ndarray, gain: float) -> np.ndarray:
+    """
+    Scale ``samples`` by ``gain`` and clip to int16 full scale, in place.
+
+    One fused pass instead of NumPy's multiply-then-clip (two passes over
+    the buffer).  Non-contiguous or non-float32 input (e.g. the transposed
+    librosa fallback of ``load_audio``) is copied first, so always use the
+    returned array.
+    """
+    samples = np.ascontiguousarray(samples, dtype=np.float32)
+    try:
+        _gain_clip(samples.reshape(-1), np.float32(gain), np.float32(-1.0), INT16_MAX)
+    except Exception as e:
+        logger.warning("gain kernel failed (%s); using NumPy", e)
+        np.clip(samples * np.float32(gain), -1.0, INT16_MAX, out=samples)
+    return samples
@@ -4,8 +4,12 @@ Audio Pitch Adjustment with Noise Reduction
 Purpose:
     Apply pitch shifts to audio files for data augmentation.  Each file
     is shifted by several semitone amounts and saved as a new file.
-    Optional noise reduction is applied after pitch shifting to clean
-    up any artefacts introduced by the resampling algorithm.
+    Optional noise reduction is applied once to the source signal before
+    the shifts, so every variant is shifted from the same denoised copy.
+    Shifting runs in-process with librosa's phase vocoder by default;
+    ``backend="rubberband"`` keeps the Rubber Band CLI (a fork/exec and
+    WAV temp-file round trip per shift) – the same switch as
+    ``AugmentConfig.backend`` in ``filtering_augmentation.py``.
 
 Workflow position:
     This is a *legacy* standalone augmentation script.  For new pipelines,
@@ -29,13 +33,17 @@ LOGIC NOTE on pitch_change / semitones conversion:
 
 import os
 import logging
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Optional, Tuple
 
 import numpy as np
+import librosa
 from pydub import AudioSegment
-import pyrubberband as pyrb
 import noisereduce as nr
 
+from ..audio_io import load_audio, prefetch_audio, write_audio
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +52,9 @@ def change_pitch(audio: AudioSegment, sample_rate: int,
     """
     Shift pitch of a pydub AudioSegment by ``semitones``.
 
+    Kept for API compatibility – ``adjust_pitch_and_volume`` no longer
+    calls it per shift (it converts the samples once per file).
+
     Uses ``pyrubberband`` (Rubber Band Library) for high-quality
     pitch shifting without changing duration.
 
@@ -51,6 +62,7 @@ def change_pitch(audio: AudioSegment, sample_rate: int,
         pyrubberband expects float64 samples.  pydub gives int16
         (via get_array_of_samples).  We convert and normalise.
     """
+    import pyrubberband as pyrb
     samples = np.array(audio.get_array_of_samples()).astype(np.float64)
     # Normalise int16 to [-1, 1] for pyrubberband
     samples = samples / 32768.0
@@ -69,6 +81,9 @@ def reduce_noise(audio: AudioSegment) -> AudioSegment:
     """
     Apply spectral-gating noise reduction.
 
+    Kept for API compatibility – ``adjust_pitch_and_volume`` now denoises
+    the source samples once instead of each shifted segment.
+
     LOGIC NOTE:
         ``noisereduce`` uses spectral gating with a noise profile
         estimated from the signal itself (prop_decrease controls
@@ -90,11 +105,28 @@ def reduce_noise(audio: AudioSegment) -> AudioSegment:
         return audio
 
 
+def reduce_strong_noise(audio: np.ndarray, sr: int) -> np.ndarray:
+    """
+    Spectral-gating noise reduction on a float sample array (the
+    ndarray counterpart of :func:`reduce_noise`, used by the
+    ``/data/noise-reduction`` endpoint).  Returns the input unchanged
+    if noisereduce fails.
+    """
+    try:
+        return nr.reduce_noise(y=audio, sr=sr, prop_decrease=1.0)
+    except Exception as e:
+        logger.warning("Noise reduction failed: %s", e)
+        return audio
+
+
 def adjust_pitch_and_volume(
     audio_path: str,
     output_prefix: str,
     pitch_changes: Optional[List[int]] = None,
     apply_noise_reduction: bool = True,
+    backend: str = "librosa",
+    audio: Optional[Tuple[np.ndarray, int]] = None,
+    noise_profile: Optional[np.ndarray] = None,
 ) -> List[str]:
     """
     Create multiple pitch-shifted variants of a single audio file.
@@ -105,54 +137,127 @@ def adjust_pitch_and_volume(
     output_prefix : str – output file path without extension/suffix.
     pitch_changes : list of int – Hz offsets (legacy format).
     apply_noise_reduction : bool
+    backend : str – "librosa" (in-process) or "rubberband" (CLI).
+    audio : (samples, sr) or None – ``audio_path`` already decoded with
+        ``load_audio(..., mono=False)``; skips the decode.
+    noise_profile : ndarray or None – a noise-only reference clip (same
+        sample rate as the input).  When given, noise reduction uses it
+        as a fixed stationary profile instead of estimating one from
+        each file.
 
     Returns
     -------
     list of str – paths to created files.
+
+    LOGIC NOTE:
+        The file is decoded once (libsndfile, float32 in [-1, 1], channels
+        kept as ``(frames, channels)`` – the layout pyrubberband takes;
+        librosa gets the transposed view)
+        and, when enabled, noise reduction runs once on it before the
+        shifts – the noise profile is the same for every variant, so
+        gating each shifted copy repeated the whole spectral gate
+        ``len(pitch_changes)`` times.
     """
     if pitch_changes is None:
         pitch_changes = [-50, -100, -150, -200, -250]
 
-    audio = AudioSegment.from_file(audio_path)
-    sample_rate = audio.frame_rate
+    samples, sample_rate = audio if audio is not None else load_audio(audio_path, mono=False)
     created: List[str] = []
+    if backend == "rubberband":
+        import pyrubberband as pyrb
+
+    if apply_noise_reduction:
+        try:
+            # noisereduce wants (channels, frames); .T is a no-op on mono
+            if noise_profile is None:
+                samples = nr.reduce_noise(y=samples.T, sr=sample_rate).T
+            else:
+                samples = nr.reduce_noise(y=samples.T, sr=sample_rate, stationary=True,
+                                          y_noise=noise_profile).T
+        except Exception as e:
+            logger.warning("Noise reduction failed: %s", e)
 
     for change_hz in pitch_changes:
         # Legacy approximation: Hz → semitones (see docstring)
         semitones = change_hz / 100.0
-        adjusted = change_pitch(audio, sample_rate, semitones)
-
-        if apply_noise_reduction:
-            adjusted = reduce_noise(adjusted)
+        if backend == "rubberband":
+            shifted = pyrb.pitch_shift(samples, sample_rate, semitones)
+        else:
+            shifted = librosa.effects.pitch_shift(samples.T, sr=sample_rate,
+                                                  n_steps=semitones).T
 
-        output_path = f"{output_prefix}_{change_hz:+d}Hz.mp3"
-        adjusted.export(output_path, format="mp3")
+        # 16-bit WAV straight from libsndfile (which clips to full scale)
+        # – no ffmpeg/LAME encode per variant; the training pipeline
+        # decodes these anyway.
+        output_path = f"{output_prefix}_{change_hz:+d}Hz.wav"
+        write_audio(output_path, shifted, sample_rate, subtype="PCM_16")
         created.append(output_path)
         logger.debug("Created: %s", output_path)
 
     return created
 
 
+def _process_one(file_path: str, output_prefix: str,
+                 pitch_changes: List[int], backend: str = "librosa",
+                 noise_profile: Optional[np.ndarray] = None,
+                 audio: Optional[Tuple[np.ndarray, int]] = None) -> int:
+    """Per-file worker (module level so ProcessPoolExecutor can pickle it)."""
+    created = len(adjust_pitch_and_volume(file_path, output_prefix, pitch_changes,
+                                          backend=backend, audio=audio,
+                                          noise_profile=noise_profile))
+    logger.info("Processed: %s", os.path.basename(file_path))
+    return created
+
+
 def process_all_files(
     input_folder: str,
     output_folder: str,
     pitch_changes: Optional[List[int]] = None,
-):
+    workers: Optional[int] = None,
+    backend: str = "librosa",
+    noise_sample: Optional[str] = None,
+) -> int:
     """
     Batch processing: apply pitch shifts to all audio files in a folder.
+
+    Files are independent (rubberband + noise reduction per file), so
+    they are spread over ``workers`` processes – ``None`` uses every
+    core, ``1`` runs them one by one in this process, with the next
+    files decoded in the background meanwhile.  ``backend`` is passed
+    to :func:`adjust_pitch_and_volume`.
+
+    ``noise_sample`` is an optional path to a noise-only recording of
+    the dataset's environment (e.g. a quiet stretch from the same
+    sensor, at the same sample rate).  It is decoded once and used as
+    the stationary noise profile for every file, skipping the per-file
+    noise estimation.
+
+    Returns the number of files created.
     """
     if pitch_changes is None:
         pitch_changes = [-50, -100, -150, -200, -250]
 
     os.makedirs(output_folder, exist_ok=True)
 
-    for fname in os.listdir(input_folder):
-        if fname.lower().endswith((".mp3", ".wav", ".flac", ".ogg")):
-            fpath = os.path.join(input_folder, fname)
-            base = os.path.splitext(fname)[0]
-            prefix = os.path.join(output_folder, base)
-            adjust_pitch_and_volume(fpath, prefix, pitch_changes)
-            logger.info("Processed: %s", fname)
+    paths, prefixes = [], []
+    with os.scandir(input_folder) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith((".mp3", ".wav", ".flac", ".ogg")) and entry.is_file():
+                paths.append(entry.path)
+                prefixes.append(os.path.join(output_folder, os.path.splitext(entry.name)[0]))
+
+    noise_profile = load_audio(noise_sample)[0] if noise_sample else None
+
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1:
+        return sum(map(_process_one, paths, prefixes, repeat(pitch_changes),
+                       repeat(backend), repeat(noise_profile),
+                       prefetch_audio(paths, mono=False)))
+    chunksize = max(1, len(paths) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(_process_one, paths, prefixes, repeat(pitch_changes),
+                            repeat(backend), repeat(noise_profile),
+                            chunksize=chunksize))
 
 
 if __name__ == "__main__":
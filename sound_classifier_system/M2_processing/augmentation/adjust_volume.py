@@ -16,20 +16,28 @@ Workflow position:
     of a unified class-balanced augmentation workflow.
 
 LOGIC NOTES:
-    • pydub's ``+= dB`` adjusts amplitude linearly:
+    • The gain is linear in amplitude:
         adjusted = audio × 10^(dB/20)
       So +10 dB ≈ ×3.16, -10 dB ≈ ×0.316.
-    • Increasing volume beyond 0 dBFS causes clipping.  We do NOT clip
-      here because the training pipeline should learn to handle
-      near-clipped signals.  If you want clean signals, set max_db to
-      a conservative value (e.g. +3 dB).
+    • Increasing volume beyond 0 dBFS saturates at full scale (as pydub's
+      ``+ dB`` did).  We do not limit or normalise here because the
+      training pipeline should learn to handle near-clipped signals.  If
+      you want clean signals, set max_db to a conservative value
+      (e.g. +3 dB).
+    • Outputs are 16-bit WAV written by libsndfile – no ffmpeg/LAME
+      encode per variant.
 """
 
 import os
 import logging
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Optional, Tuple
 
-from pydub import AudioSegment
+import numpy as np
+
+from ..audio_io import load_audio, prefetch_audio, write_audio
+from ._kernels import apply_gain_clip
 
 logger = logging.getLogger(__name__)
 
@@ -44,39 +52,74 @@ def adjust_volume(
 
     Returns the output file path.
     """
-    audio = AudioSegment.from_file(audio_path)
-    adjusted = audio + decibel_change
-    output_path = f"{output_prefix}_{decibel_change:+.0f}dB.mp3"
-    adjusted.export(output_path, format="mp3")
+    samples, sample_rate = load_audio(audio_path, mono=False)
+    return _write_gain(samples, sample_rate, output_prefix, decibel_change)
+
+
+def _write_gain(samples: np.ndarray, sample_rate: int,
+                output_prefix: str, decibel_change: float) -> str:
+    """Write a gain-adjusted copy of ``samples``; ``samples`` is untouched."""
+    scaled = apply_gain_clip(np.array(samples, dtype=np.float32, order="C"),
+                             10 ** (decibel_change / 20.0))
+    output_path = f"{output_prefix}_{decibel_change:+.0f}dB.wav"
+    write_audio(output_path, scaled, sample_rate, subtype="PCM_16")
     return output_path
 
 
+def _process_one(file_path: str, output_prefix: str,
+                 decibel_changes: List[float],
+                 audio: Optional[Tuple[np.ndarray, int]] = None) -> int:
+    """
+    Per-file worker (module level so ProcessPoolExecutor can pickle it).
+    The file is decoded once (or ``audio`` is used) for all gains.
+    """
+    samples, sample_rate = audio if audio is not None else load_audio(file_path, mono=False)
+    for db in decibel_changes:
+        _write_gain(samples, sample_rate, output_prefix, db)
+    logger.info("Processed: %s (%d variants)",
+                os.path.basename(file_path), len(decibel_changes))
+    return len(decibel_changes)
+
+
 def process_all_files(
     input_folder: str,
     output_folder: str,
     decibel_changes: Optional[List[float]] = None,
-):
+    workers: Optional[int] = None,
+) -> int:
     """
     Batch processing: create volume-adjusted variants for all audio
     files in ``input_folder``.
 
     LOGIC NOTE:
         Each dB value is applied independently to each file, so
-        N files × M dB values = N×M output files.
+        N files × M dB values = N×M output files.  Files are spread
+        over ``workers`` processes – ``None`` uses every core, ``1``
+        runs them one by one in this process, with the next files
+        decoded in the background meanwhile.
+
+    Returns the number of files created.
     """
     if decibel_changes is None:
         decibel_changes = [+10, +20, -10, -20]
 
     os.makedirs(output_folder, exist_ok=True)
 
-    for fname in os.listdir(input_folder):
-        if fname.lower().endswith((".mp3", ".wav", ".flac", ".ogg")):
-            fpath = os.path.join(input_folder, fname)
-            base = os.path.splitext(fname)[0]
-            for db in decibel_changes:
-                prefix = os.path.join(output_folder, base)
-                adjust_volume(fpath, prefix, db)
-            logger.info("Processed: %s (%d variants)", fname, len(decibel_changes))
+    paths, prefixes = [], []
+    with os.scandir(input_folder) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith((".mp3", ".wav", ".flac", ".ogg")) and entry.is_file():
+                paths.append(entry.path)
+                prefixes.append(os.path.join(output_folder, os.path.splitext(entry.name)[0]))
+
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1:
+        return sum(map(_process_one, paths, prefixes, repeat(decibel_changes),
+                       prefetch_audio(paths, mono=False)))
+    chunksize = max(1, len(paths) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(_process_one, paths, prefixes, repeat(decibel_changes),
+                            chunksize=chunksize))
 
 
 if __name__ == "__main__":
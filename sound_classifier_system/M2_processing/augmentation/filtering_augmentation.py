@@ -56,6 +56,8 @@ import librosa
 import soundfile as sf
 from scipy.signal import butter, sosfilt
 
+from ..audio_io import load_audio, write_audio
+
 logger = logging.getLogger(__name__)
 
 
@@ -108,6 +110,10 @@ class AugmentConfig:
     # If a class already has enough, fewer augments are generated.
     target_samples_per_class: int = 500
     max_augments_per_file: int = 5  # cap to prevent disk explosion
+    # Pitch-shift / time-stretch engine: "librosa" | "rubberband".
+    # Rubber Band (via pyrubberband + rubberband-cli) is considerably
+    # faster than librosa's Python phase vocoder and sounds cleaner.
+    backend: str = "librosa"
 
 
 # ────────────────────────────────────────────────────────────────
@@ -188,7 +194,7 @@ def filter_audio_file(
         ``sr``      – sample rate.
     """
     try:
-        audio, sr = librosa.load(file_path, sr=None)
+        audio, sr = load_audio(file_path)
     except Exception as e:
         return False, f"load_error: {e}", None, None
 
@@ -222,24 +228,34 @@ def filter_audio_file(
 # ────────────────────────────────────────────────────────────────
 
 def _pitch_shift(audio: np.ndarray, sr: int,
-                 semitones: float) -> np.ndarray:
+                 semitones: float, backend: str = "librosa") -> np.ndarray:
     """
     Shift pitch without changing duration.
 
     LOGIC NOTE:  librosa.effects.pitch_shift uses STFT-based resampling.
     For large shifts (> ±3 semitones) artefacts may appear.
+    ``backend="rubberband"`` uses the Rubber Band library instead.
     """
+    if backend == "rubberband":
+        import pyrubberband as pyrb
+        return pyrb.pitch_shift(audio, sr, semitones).astype(np.float32)
     return librosa.effects.pitch_shift(y=audio, sr=sr, n_steps=semitones)
 
 
-def _time_stretch(audio: np.ndarray, rate: float) -> np.ndarray:
+def _time_stretch(audio: np.ndarray, rate: float,
+                  sr: Optional[int] = None,
+                  backend: str = "librosa") -> np.ndarray:
     """
     Change speed without changing pitch.
     rate > 1 = faster, rate < 1 = slower.
 
     LOGIC NOTE:  rate=0.5 doubles the duration, which may create
     very long files.  The caller should clamp after stretching.
+    ``backend="rubberband"`` needs ``sr``.
     """
+    if backend == "rubberband":
+        import pyrubberband as pyrb
+        return pyrb.time_stretch(audio, sr, rate).astype(np.float32)
     return librosa.effects.time_stretch(y=audio, rate=rate)
 
 
@@ -265,6 +281,54 @@ def _scale_volume(audio: np.ndarray, db: float) -> np.ndarray:
     return audio * factor
 
 
+# ────────────────────────────────────────────────────────────────
+#  Per-file workers (module level so ProcessPoolExecutor can pickle them)
+# ────────────────────────────────────────────────────────────────
+
+def _noise_inject_file(path: str, dst_dir: str,
+                       snr_levels: List[float]) -> int:
+    """
+    Write one noisy copy of ``path`` per SNR level; returns files written.
+
+    LOGIC NOTE:  One noise vector is drawn per file and only rescaled for
+    each SNR level (the signal RMS is likewise computed once), instead of
+    a fresh draw + RMS per level as ``_inject_noise`` would do.  The
+    noise is scaled by its measured RMS, so each level hits its SNR
+    exactly.  Silent files are written unchanged, as in ``_inject_noise``.
+    """
+    audio, sr = load_audio(path)
+    base = Path(path).stem
+
+    sig_rms = np.sqrt(np.mean(np.square(audio)))
+    noisy = None
+    if sig_rms > 1e-10:
+        noise = np.random.default_rng().standard_normal(len(audio),
+                                                        dtype=np.float32)
+        noise_rms = np.sqrt(np.mean(np.square(noise)))
+        noisy = np.empty_like(noise)
+
+    for snr in snr_levels:
+        if noisy is None:
+            aug = audio
+        else:
+            scale = sig_rms / (10 ** (snr / 20.0)) / noise_rms
+            np.multiply(noise, scale, out=noisy)
+            aug = np.add(audio, noisy, out=noisy)
+        write_audio(os.path.join(dst_dir, f"{base}_noise{snr:.0f}dB.wav"), aug, sr)
+    return len(snr_levels)
+
+
+def _time_stretch_file(path: str, dst_dir: str, rates: List[float],
+                       backend: str = "librosa") -> int:
+    """Write one time-stretched copy of ``path`` per rate; returns files written."""
+    audio, sr = load_audio(path)
+    base = Path(path).stem
+    for rate in rates:
+        aug = _time_stretch(audio, rate, sr, backend)
+        write_audio(os.path.join(dst_dir, f"{base}_ts{rate:.1f}.wav"), aug, sr)
+    return len(rates)
+
+
 # ────────────────────────────────────────────────────────────────
 #  Pipeline entry points
 # ────────────────────────────────────────────────────────────────
@@ -369,7 +433,7 @@ def augment_dataset(
                 break
             fpath = os.path.join(class_in, f)
             try:
-                audio, sr = librosa.load(fpath, sr=None)
+                audio, sr = load_audio(fpath)
             except Exception:
                 continue
 
@@ -381,9 +445,9 @@ def augment_dataset(
                 for semitones in config.pitch_shift_semitones:
                     if created >= n_needed or per_file >= config.max_augments_per_file:
                         break
-                    aug = _pitch_shift(audio, sr, semitones)
+                    aug = _pitch_shift(audio, sr, semitones, config.backend)
                     out_name = f"{base}_ps{semitones:+.1f}.wav"
-                    sf.write(os.path.join(class_out, out_name), aug, sr)
+                    write_audio(os.path.join(class_out, out_name), aug, sr)
                     created += 1
                     per_file += 1
 
@@ -392,9 +456,9 @@ def augment_dataset(
                 for rate in config.time_stretch_rates:
                     if created >= n_needed or per_file >= config.max_augments_per_file:
                         break
-                    aug = _time_stretch(audio, rate)
+                    aug = _time_stretch(audio, rate, sr, config.backend)
                     out_name = f"{base}_ts{rate:.1f}.wav"
-                    sf.write(os.path.join(class_out, out_name), aug, sr)
+                    write_audio(os.path.join(class_out, out_name), aug, sr)
                     created += 1
                     per_file += 1
 
@@ -405,7 +469,7 @@ def augment_dataset(
                         break
                     aug = _inject_noise(audio, snr)
                     out_name = f"{base}_noise{snr:.0f}dB.wav"
-                    sf.write(os.path.join(class_out, out_name), aug, sr)
+                    write_audio(os.path.join(class_out, out_name), aug, sr)
                     created += 1
                     per_file += 1
 
@@ -416,7 +480,7 @@ def augment_dataset(
                         break
                     aug = _scale_volume(audio, db_change)
                     out_name = f"{base}_vol{db_change:+.0f}dB.wav"
-                    sf.write(os.path.join(class_out, out_name), aug, sr)
+                    write_audio(os.path.join(class_out, out_name), aug, sr)
                     created += 1
                     per_file += 1
 
@@ -24,15 +24,23 @@ Workflow position:
     ``filtering_augmentation.py``.
 
 LOGIC NOTE:
-    pydub's ``.reverse()`` simply reverses the sample array.  This is
-    a lossless operation (no quality degradation).  The output retains
-    the same sample rate, bit depth, and channel count.
+    Reversal is just the decoded sample array read backwards
+    (``samples[::-1]``, a view – no copy), so nothing about the signal
+    changes.  The output keeps the sample rate and channel count and is
+    encoded in-process by libsndfile; pydub/ffmpeg is only the fallback
+    for libsndfile builds without MP3.
 """
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import soundfile as sf
 from pydub import AudioSegment
 
+from ..audio_io import export_mp3, load_audio
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,32 +50,58 @@ def reverse_audio(audio_path: str, output_path: str) -> str:
 
     Returns the output path.
     """
+    if "MP3" in sf.available_formats():
+        samples, sr = load_audio(audio_path, mono=False)
+        try:
+            sf.write(output_path, samples[::-1], sr,
+                     format="MP3", subtype="MPEG_LAYER_III")
+            return output_path
+        except RuntimeError:
+            pass  # e.g. a sample rate MP3 cannot carry
     audio = AudioSegment.from_file(audio_path)
-    reversed_audio = audio.reverse()
-    reversed_audio.export(output_path, format="mp3")
-    return output_path
+    return export_mp3(audio.reverse(), output_path)
+
+
+def _reverse_one(fpath: str, out_path: str) -> str:
+    reverse_audio(fpath, out_path)
+    logger.debug("Reversed: %s", os.path.basename(fpath))
+    return out_path
 
 
-def process_all_files(input_folder: str, output_folder: str):
+def process_all_files(input_folder: str, output_folder: str,
+                      workers: Optional[int] = None) -> int:
     """
     Batch reverse all audio files in ``input_folder``.
-    """
-    os.makedirs(output_folder, exist_ok=True)
 
-    for fname in os.listdir(input_folder):
-        if fname.lower().endswith((".mp3", ".wav", ".flac", ".ogg")):
-            fpath = os.path.join(input_folder, fname)
-            base = os.path.splitext(fname)[0]
-            out_fname = f"{base}_reversed.mp3"
-            out_path = os.path.join(output_folder, out_fname)
+    Files are spread over ``workers`` threads (``None`` uses every core,
+    ``1`` runs them one by one): decode and LAME encode happen inside
+    libsndfile with the GIL released, so threads overlap them without
+    the cost of worker processes.
 
-            if os.path.exists(out_path):
-                continue  # idempotent
+    Returns the number of files created (existing outputs are skipped).
+    """
+    os.makedirs(output_folder, exist_ok=True)
 
-            reverse_audio(fpath, out_path)
-            logger.debug("Reversed: %s", fname)
+    paths, out_paths = [], []
+    with os.scandir(input_folder) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith((".mp3", ".wav", ".flac", ".ogg")):
+                base = os.path.splitext(entry.name)[0]
+                out_path = os.path.join(output_folder, f"{base}_reversed.mp3")
+                if os.path.exists(out_path):
+                    continue  # idempotent
+                paths.append(entry.path)
+                out_paths.append(out_path)
+
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1:
+        created = len(list(map(_reverse_one, paths, out_paths)))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            created = len(list(pool.map(_reverse_one, paths, out_paths)))
 
     logger.info("Reverse augmentation complete for %s", input_folder)
+    return created
 
 
 if __name__ == "__main__":
@@ -0,0 +1,47 @@
+"""
+Dataset File Placement
+========================
+Purpose:
+    Put source audio files into the class / split directories built by
+    ``rename_class.py``, ``metadata_based_class_creation.py`` and
+    ``organize_sound_samples.py``.
+
+LOGIC NOTE:
+    Files are hard-linked: one directory entry instead of reading and
+    writing every byte.  Where linking is impossible (source on another
+    filesystem, FAT/exFAT, a share without link support) the file is
+    copied as before.
+
+    A link shares the file's contents, so writing into an existing path
+    would change every linked copy.  The pipeline's audio writers go
+    through ``audio_io.write_audio``, which writes a new file and
+    ``os.replace``-s it over the old path (new inode – other links keep
+    the original).  Any new code that rewrites dataset files must do the
+    same rather than open an existing path for writing.
+"""
+
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+
+def link_or_copy(src: str, dst: str) -> None:
+    """Hard-link ``src`` to ``dst``, falling back to ``shutil.copyfile``."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def link_or_copy_files(pairs: List[Tuple[str, str]]) -> None:
+    """
+    :func:`link_or_copy` each ``(src, dst)`` pair on a thread pool.  Both
+    links and fallback copies are I/O latency bound and release the GIL,
+    so they overlap.
+    """
+    if not pairs:
+        return
+    workers = min(32, (os.cpu_count() or 1) * 2, len(pairs))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda p: link_or_copy(*p), pairs))
@@ -4,17 +4,32 @@ Advanced Feature Extraction Pipeline
 Configurable feature extraction that supports individual feature toggling
 from the frontend.  Each feature is computed per-frame and then
 aggregated with statistical moments (mean, std, skew, kurtosis).
+
+Per-class features are saved as ``<label>.npy`` – one float32
+``(n_vectors, n_features)`` matrix, which loads memory-mapped instead of
+unpickling a Python list of row arrays.  Older ``<label>.pkl`` files are
+still read (see :func:`load_feature_file`, :func:`convert_pkl_to_npy`).
+Next to each ``.npy``, ``<label>.manifest.csv`` records the source file,
+its mtime and its row, so re-runs only extract new or changed files.
 """
 
 import numpy as np
 import librosa
 import pickle
 import os
+import csv
 import gc
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from itertools import repeat
+from typing import List, Optional, Dict, Any, Tuple
 from scipy import stats
 
+from ..audio_io import load_audio, prefetch
+from ._kernels import median_filter_rows
+
 
 @dataclass
 class FeatureConfig:
@@ -57,6 +72,57 @@ def _aggregate(feature_matrix: np.ndarray, stat_funcs: List[str]) -> np.ndarray:
     return np.hstack(parts)
 
 
+@lru_cache(maxsize=32)
+def _mel_basis(sr: int, n_fft: int) -> np.ndarray:
+    """librosa's default (128-band) mel filterbank for ``(sr, n_fft)``."""
+    basis = librosa.filters.mel(sr=sr, n_fft=n_fft)
+    basis.flags.writeable = False  # shared between calls
+    return basis
+
+
+@lru_cache(maxsize=256)
+def _chroma_basis(sr: int, n_fft: int, tuning: float) -> np.ndarray:
+    """
+    12-bin chroma filterbank for ``(sr, n_fft, tuning)``.
+
+    LOGIC NOTE:
+        librosa rebuilds the bank on every ``chroma_stft`` call, but
+        ``estimate_tuning`` quantises tuning to 0.01 bin, so across a
+        dataset only a few dozen distinct banks are ever needed.
+    """
+    basis = librosa.filters.chroma(sr=sr, n_fft=n_fft, tuning=tuning)
+    basis.flags.writeable = False
+    return basis
+
+
+@lru_cache(maxsize=32)
+def _fft_freqs(sr: int, n_fft: int) -> np.ndarray:
+    """
+    STFT bin frequencies as float32.  librosa's own are float64, which
+    promotes the ``(bins, frames)`` products in centroid / bandwidth to
+    float64 although the spectrogram is float32.
+    """
+    freqs = librosa.fft_frequencies(sr=sr, n_fft=n_fft).astype(np.float32)
+    freqs.flags.writeable = False
+    return freqs
+
+
+def _harmonic(audio: np.ndarray, D: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    ``librosa.effects.harmonic(audio)`` with the HPSS median filters run
+    by :func:`median_filter_rows` – the two ``scipy.ndimage`` filters
+    were about half of ``extract_features``' time.  ``D`` may be passed
+    if ``audio``'s default STFT (n_fft 2048, hop 512) is already at hand.
+    """
+    if D is None:
+        D = librosa.stft(audio)
+    S, phase = librosa.magphase(D)
+    harm = median_filter_rows(S, 31)        # along time
+    perc = median_filter_rows(S.T, 31).T    # along frequency
+    mask = librosa.util.softmask(harm, perc, power=2.0, split_zeros=True)
+    return librosa.istft((S * mask) * phase, dtype=audio.dtype, length=len(audio))
+
+
 def extract_features(file_path: str,
                      config: Optional[FeatureConfig] = None) -> Optional[np.ndarray]:
     """
@@ -64,31 +130,59 @@ def extract_features(file_path: str,
 
     Parameters
     ----------
-    file_path : str
-        Path to the audio file.
+    file_path : str, file-like, or (np.ndarray, int)
+        Path to the audio file, an open binary file object
+        (e.g. ``io.BytesIO``) in a format libsndfile can decode, or an
+        already-decoded mono ``(audio, sr)`` pair – resampled to
+        22 050 Hz exactly as ``librosa.load`` would, so callers that
+        have decoded the audio don't decode it twice.
     config : FeatureConfig
         Which features to compute.  Defaults to all enabled.
 
     Returns
     -------
-    1-D numpy array or None on error.
+    1-D float32 numpy array or None on error.
     """
     if config is None:
         config = FeatureConfig()
 
     try:
-        audio, sr = librosa.load(file_path, res_type="kaiser_fast")
+        if isinstance(file_path, tuple):
+            audio, sr = file_path
+        else:
+            audio, sr = load_audio(file_path)
+        # Features are only comparable across files at one rate, so the
+        # resample stays (skipped when the file is already 22 050 Hz).
+        # librosa's default soxr_hq: "kaiser_fast" needs resampy, which is
+        # not a dependency, and is several times slower.
+        if sr != 22050:
+            audio = librosa.resample(audio, orig_sr=sr, target_sr=22050)
+            sr = 22050
         n_fft = min(2048, len(audio))
         if n_fft < 64:
             return None
 
         parts: List[np.ndarray] = []
 
+        # LOGIC NOTE: one STFT shared by every spectral feature below –
+        # each librosa.feature call would otherwise run its own.  Passing
+        # the magnitude (power=1 features) or its square (power=2) with
+        # the same n_fft gives exactly the values the ``y=`` calls did.
+        # zcr / rms / tonnetz work on the waveform and keep ``y``.  The
+        # features' hop is 512 whatever n_fft is (stft's own default is
+        # n_fft // 4), so it is pinned here.
+        D = librosa.stft(audio, n_fft=n_fft, hop_length=512)
+        mag = np.abs(D)
+        power = mag ** 2
+        mel = None
+        if config.mfcc or config.mel:
+            # == librosa.feature.melspectrogram(S=power), cached filterbank
+            mel = np.einsum("...ft,mf->...mt", power, _mel_basis(sr, n_fft), optimize=True)
+
         # ---- Cepstral ------------------------------------------------
         if config.mfcc:
-            mfccs = librosa.feature.mfcc(y=audio, sr=sr,
-                                          n_mfcc=config.n_mfcc,
-                                          n_fft=n_fft)
+            mfccs = librosa.feature.mfcc(S=librosa.power_to_db(mel), sr=sr,
+                                          n_mfcc=config.n_mfcc)
             parts.append(_aggregate(mfccs, config.stats))
 
             if config.delta_mfcc:
@@ -99,48 +193,60 @@ def extract_features(file_path: str,
 
         # ---- Chroma / Tonnetz ----------------------------------------
         if config.chroma:
-            chroma = librosa.feature.chroma_stft(y=audio, sr=sr,
-                                                  n_fft=n_fft)
+            # == librosa.feature.chroma_stft(S=power), cached filterbank
+            tuning = librosa.estimate_tuning(S=power, sr=sr, bins_per_octave=12)
+            chroma = np.einsum("cf,...ft->...ct", _chroma_basis(sr, n_fft, float(tuning)),
+                               power, optimize=True)
+            chroma = librosa.util.normalize(chroma, norm=np.inf, axis=-2)
             parts.append(_aggregate(chroma, config.stats))
 
         if config.tonnetz:
-            harmonic = librosa.effects.harmonic(audio)
+            # harmonic()'s own STFT is the shared one when n_fft is 2048
+            harmonic = _harmonic(audio, D if n_fft == 2048 else None)
             tonnetz = librosa.feature.tonnetz(y=harmonic, sr=sr)
             parts.append(_aggregate(tonnetz, config.stats))
 
         # ---- Mel spectrogram -----------------------------------------
         if config.mel:
-            mel = librosa.feature.melspectrogram(y=audio, sr=sr,
-                                                  n_fft=n_fft)
             parts.append(_aggregate(mel, config.stats))
 
         # ---- Spectral ------------------------------------------------
         if config.contrast:
-            contrast = librosa.feature.spectral_contrast(y=audio, sr=sr,
+            contrast = librosa.feature.spectral_contrast(S=mag, sr=sr,
                                                           n_fft=n_fft)
             parts.append(_aggregate(contrast, config.stats))
 
+        centroid = None
+        if config.spectral_centroid or config.spectral_bandwidth:
+            centroid = librosa.feature.spectral_centroid(S=mag, sr=sr, n_fft=n_fft,
+                                                         freq=_fft_freqs(sr, n_fft))
         if config.spectral_centroid:
-            centroid = librosa.feature.spectral_centroid(y=audio, sr=sr,
-                                                         n_fft=n_fft)
             parts.append(_aggregate(centroid, config.stats))
 
         if config.spectral_bandwidth:
-            bw = librosa.feature.spectral_bandwidth(y=audio, sr=sr,
-                                                      n_fft=n_fft)
+            # bandwidth would otherwise recompute the same centroid
+            bw = librosa.feature.spectral_bandwidth(S=mag, sr=sr, n_fft=n_fft,
+                                                    freq=_fft_freqs(sr, n_fft),
+                                                    centroid=centroid)
             parts.append(_aggregate(bw, config.stats))
 
         if config.spectral_rolloff:
-            rolloff = librosa.feature.spectral_rolloff(y=audio, sr=sr,
+            rolloff = librosa.feature.spectral_rolloff(S=mag, sr=sr,
                                                         n_fft=n_fft)
             parts.append(_aggregate(rolloff, config.stats))
 
         if config.spectral_flatness:
-            flatness = librosa.feature.spectral_flatness(y=audio)
+            # spectral_flatness always used its default 2048-point STFT
+            if n_fft == 2048:
+                flatness = librosa.feature.spectral_flatness(S=mag)
+            else:
+                flatness = librosa.feature.spectral_flatness(y=audio)
             parts.append(_aggregate(flatness, config.stats))
 
         if config.spectral_flux:
-            S = np.abs(librosa.stft(audio, n_fft=n_fft))
+            # flux has always used stft's default hop (n_fft // 4), which
+            # only equals the shared STFT's 512 at n_fft = 2048
+            S = mag if n_fft == 2048 else np.abs(librosa.stft(audio, n_fft=n_fft))
             flux = np.sqrt(np.sum(np.diff(S, axis=1) ** 2, axis=0))
             flux = flux.reshape(1, -1)
             parts.append(_aggregate(flux, config.stats))
@@ -157,43 +263,207 @@ def extract_features(file_path: str,
         if not parts:
             return None
 
-        return np.hstack(parts)
+        # float32 like the stored feature matrices (and half the bytes
+        # sent back from pool workers)
+        return np.hstack(parts).astype(np.float32, copy=False)
 
     except Exception as e:
-        print(f"Error processing {file_path}: {e}")
+        name = "<decoded audio>" if isinstance(file_path, tuple) else file_path
+        print(f"Error processing {name}: {e}")
         return None
 
 
+def _as_matrix(vectors) -> np.ndarray:
+    """Stack a list of feature vectors into a float32 ``(n, n_features)`` matrix."""
+    if not len(vectors):
+        return np.empty((0, 0), dtype=np.float32)
+    return np.asarray(vectors, dtype=np.float32)
+
+
+def list_feature_files(feature_folder: str) -> Dict[str, str]:
+    """
+    Map each class label in ``feature_folder`` to its feature file,
+    sorted by label.  A class saved in both formats (e.g. after
+    :func:`convert_pkl_to_npy`) resolves to its ``.npy``.
+    """
+    found: Dict[str, str] = {}
+    with os.scandir(feature_folder) as entries:
+        for entry in entries:
+            label, ext = os.path.splitext(entry.name)
+            if ext in (".npy", ".pkl") and entry.is_file():
+                if ext == ".npy" or label not in found:
+                    found[label] = entry.path
+    return dict(sorted(found.items()))
+
+
+def load_feature_file(path: str) -> np.ndarray:
+    """
+    Load one class's ``(n_vectors, n_features)`` feature matrix.
+
+    ``.npy`` files are memory-mapped read-only – nothing is read until
+    the rows are used, and the pages are shared through the OS cache
+    with any other process mapping the same file.  Legacy ``.pkl``
+    lists are unpickled and stacked into float32.
+    """
+    if path.endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+    with open(path, "rb") as f:
+        return _as_matrix(pickle.load(f))
+
+
+def convert_pkl_to_npy(feature_folder: str) -> int:
+    """
+    Write a ``.npy`` next to every ``.pkl`` feature file that has none.
+    The pickles are left in place for older tools.  Returns the number
+    of files converted.
+    """
+    converted = 0
+    for label, path in list_feature_files(feature_folder).items():
+        if path.endswith(".pkl"):
+            np.save(os.path.join(feature_folder, f"{label}.npy"), load_feature_file(path))
+            converted += 1
+    return converted
+
+
+def _limit_worker_threads():
+    """
+    Pool initializer: one BLAS/OpenMP thread per worker process, so N
+    workers don't each start N threads for librosa's matrix products.
+    """
+    from threadpoolctl import threadpool_limits
+    threadpool_limits(1)
+
+
+def _decode_or_path(path: str):
+    """
+    ``load_audio(path)``, or ``path`` itself if the decode fails – so
+    :func:`extract_features` retries it and reports the error as usual.
+    """
+    try:
+        return load_audio(path)
+    except Exception:
+        return path
+
+
+def _read_manifest(path: str) -> Dict[str, Tuple[int, int]]:
+    """``{file name: (mtime_ns, row)}`` of the files stored in the ``.npy``."""
+    with open(path, newline="") as f:
+        rows = ((r["file"], int(r["mtime_ns"]), int(r["row"])) for r in csv.DictReader(f))
+        # row -1 (failed files) came from older manifests – retry those
+        return {name: (mtime, row) for name, mtime, row in rows if row >= 0}
+
+
+def _write_manifest(path: str, manifest: Dict[str, Tuple[int, int]]) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["file", "mtime_ns", "row"])
+        writer.writerows((name, mtime, row) for name, (mtime, row) in manifest.items())
+    os.replace(tmp, path)
+
+
 def extract_and_save_features(data_path: str,
                               feature_folder: str = "../../features",
-                              config: Optional[FeatureConfig] = None):
+                              config: Optional[FeatureConfig] = None,
+                              workers: Optional[int] = None):
     """
-    Batch extraction – processes each class subfolder and saves
-    features as pickle files.
+    Batch extraction – processes each class subfolder and saves its
+    features as one ``<label>.npy`` matrix.
+
+    Files are independent, so they are spread over ``workers`` processes
+    (one pool for all classes) – ``None`` uses every core, ``1`` runs
+    them one by one in this process.
+
+    Extraction is incremental: a class whose ``.npy`` has a manifest
+    keeps the rows of files whose mtime is unchanged, drops rows of
+    deleted files and only extracts new or modified ones (appended after
+    the kept rows).  Files that fail are left out of the manifest and
+    reported on every run, so they are retried next time (a failure may
+    be transient – a locked file, memory).  A class saved without a manifest (older runs,
+    ``.pkl``) is skipped as before; delete its feature file to rebuild it,
+    e.g. after changing ``config``.
     """
     os.makedirs(feature_folder, exist_ok=True)
     if config is None:
         config = FeatureConfig()
-
-    for label in os.listdir(data_path):
-        label_path = os.path.join(data_path, label)
-        feature_file = os.path.join(feature_folder, f"{label}.pkl")
-
-        if os.path.exists(feature_file):
-            print(f"Features for '{label}' already exist. Skipping.")
-            continue
-
-        if os.path.isdir(label_path):
-            features = []
-            for fname in os.listdir(label_path):
-                fpath = os.path.join(label_path, fname)
-                feat = extract_features(fpath, config)
-                if feat is not None:
-                    features.append(feat)
-
-            with open(feature_file, "wb") as f:
-                pickle.dump(features, f)
-            print(f"Saved {len(features)} vectors for '{label}' → {feature_file}")
+    workers = workers or os.cpu_count() or 1
+
+    with (ProcessPoolExecutor(max_workers=workers, initializer=_limit_worker_threads)
+          if workers > 1 else nullcontext()) as pool:
+        for label in os.listdir(data_path):
+            label_path = os.path.join(data_path, label)
+            feature_file = os.path.join(feature_folder, f"{label}.npy")
+            manifest_file = os.path.join(feature_folder, f"{label}.manifest.csv")
+            if not os.path.isdir(label_path):
+                continue
+
+            incremental = os.path.exists(feature_file) and os.path.exists(manifest_file)
+            if not incremental and (os.path.exists(feature_file) or os.path.exists(
+                    os.path.join(feature_folder, f"{label}.pkl"))):
+                print(f"Features for '{label}' already exist. Skipping.")
+                continue
+
+            with os.scandir(label_path) as entries:
+                stamps = {e.name: e.stat().st_mtime_ns for e in entries if e.is_file()}
+
+            old: Dict[str, Tuple[int, int]] = {}
+            existing = None
+            if incremental:
+                old = _read_manifest(manifest_file)
+                existing = load_feature_file(feature_file)
+                if existing.shape[0] != len(old):
+                    # .npy and manifest out of step (interrupted write) – redo the class
+                    old, existing = {}, None
+            unchanged = {name: old[name] for name in stamps
+                         if name in old and old[name][0] == stamps[name]}
+            todo = [name for name in stamps if name not in unchanged]
+            if incremental and existing is not None and not todo and len(unchanged) == len(old):
+                print(f"Features for '{label}' are up to date. Skipping.")
+                continue
+
+            # Kept rows are renumbered in manifest order.
+            manifest: Dict[str, Tuple[int, int]] = {}
+            kept: List[int] = []
+            for name, (mtime, row) in unchanged.items():
+                manifest[name] = (mtime, len(kept))
+                kept.append(row)
+
+            paths = [os.path.join(label_path, name) for name in todo]
+            if pool is None:
+                # Decode the next files in a background thread while this
+                # one's features are computed.
+                results = map(extract_features, prefetch(_decode_or_path, paths), repeat(config))
+            else:
+                results = pool.map(extract_features, paths, repeat(config),
+                                   chunksize=max(1, len(paths) // (4 * workers)))
+            # Rows go straight into a float32 matrix sized for every
+            # file (trimmed to the successes), not into a list of
+            # float64 vectors that is then copied again.
+            features, n = _as_matrix([]), len(kept)
+            if kept:
+                features = np.empty((len(kept) + len(todo), existing.shape[1]), dtype=np.float32)
+                features[:n] = existing[kept]
+            failed: List[str] = []
+            for name, feat in zip(todo, results):
+                if feat is None:
+                    failed.append(name)
+                    continue
+                if not n:
+                    features = np.empty((len(todo), feat.shape[0]), dtype=np.float32)
+                features[n] = feat
+                manifest[name] = (stamps[name], n)
+                n += 1
+            del existing  # release the memory map before replacing the file
+
+            tmp = f"{feature_file}.tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, features[:n])
+            os.replace(tmp, feature_file)
+            _write_manifest(manifest_file, manifest)
+            print(f"Saved {n} vectors for '{label}' ({len(todo)} files extracted) → {feature_file}")
+            if failed:
+                print(f"  {len(failed)} file(s) in '{label}' failed and will be retried "
+                      f"next run: {', '.join(failed)}")
             del features
             gc.collect()
 
@@ -30,18 +30,21 @@ Logic notes:
     • This script auto-detects the column names and adapts.
     • Files that already exist in the target directory are skipped to
       allow incremental runs.
+    • "Copying" hard-links the file when source and target share a
+      filesystem (see ``_fileops.py``) and falls back to a byte copy.
     • The function is also importable from the API layer so the Electron
       UI can trigger homogenisation without a terminal.
 """
 
 import os
-import shutil
 import logging
-from typing import Optional, List, Dict, Tuple
+from typing import Iterator, Optional, List, Dict, Tuple, Union
 from pathlib import Path
 
 import pandas as pd
 
+from ._fileops import link_or_copy_files
+
 logger = logging.getLogger(__name__)
 
 # ────────────────────────────────────────────────────────────────
@@ -91,8 +94,36 @@ def _detect_columns(df: pd.DataFrame) -> Tuple[str, str]:
 #  Core helpers
 # ────────────────────────────────────────────────────────────────
 
+def _scan_files(path: str) -> Iterator[os.DirEntry]:
+    """
+    Yield every non-directory entry under ``path`` in ``os.walk`` order
+    (a directory's files before its sub-directories, symlinked
+    directories not followed, unreadable directories skipped).
+
+    LOGIC NOTE:
+        ``os.walk`` also uses ``scandir`` but copies every level into
+        name lists and re-joins the paths; walking the ``DirEntry``
+        objects directly (type from the directory listing, no extra
+        ``stat``) scans about twice as fast on large trees.
+    """
+    subdirs: List[str] = []
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            else:
+                yield entry
+    for sub in subdirs:
+        yield from _scan_files(sub)
+
+
 def find_audio_files(base_path: str,
-                     extensions: Optional[List[str]] = None) -> Dict[str, str]:
+                     extensions: Union[str, List[str], None] = None) -> Dict[str, str]:
     """
     Recursively walk ``base_path`` and return a dict mapping
     ``{basename: full_path}`` for every audio file found.
@@ -101,9 +132,9 @@ def find_audio_files(base_path: str,
     ----------
     base_path : str
         Root directory to search.
-    extensions : list of str, optional
-        File extensions to include (with leading dot, e.g. ``['.wav', '.mp3']``).
-        Defaults to ``['.wav', '.mp3', '.flac', '.ogg']``.
+    extensions : str or list of str, optional
+        File extension(s) to include (with leading dot, e.g. ``'.wav'`` or
+        ``['.wav', '.mp3']``), matched case-insensitively.  Defaults to ``['.wav', '.mp3', '.flac', '.ogg']``.
 
     Returns
     -------
@@ -117,19 +148,23 @@ def find_audio_files(base_path: str,
     """
     if extensions is None:
         extensions = [".wav", ".mp3", ".flac", ".ogg"]
+    elif isinstance(extensions, str):
+        # A bare ".wav" would otherwise be iterated character by character
+        extensions = [extensions]
+    # One C-level endswith() per file instead of a generator per file
+    suffixes = tuple(ext.lower() for ext in extensions)
 
     file_map: Dict[str, str] = {}
-    for root, _, files in os.walk(base_path):
-        for f in files:
-            if any(f.lower().endswith(ext) for ext in extensions):
-                full = os.path.join(root, f)
-                if f in file_map:
-                    logger.warning(
-                        "Duplicate basename '%s': keeping %s, ignoring %s",
-                        f, file_map[f], full,
-                    )
-                else:
-                    file_map[f] = full
+    for entry in _scan_files(base_path):
+        f = entry.name
+        if f.lower().endswith(suffixes):
+            if f in file_map:
+                logger.warning(
+                    "Duplicate basename '%s': keeping %s, ignoring %s",
+                    f, file_map[f], entry.path,
+                )
+            else:
+                file_map[f] = entry.path
     return file_map
 
 
@@ -164,28 +199,33 @@ def copy_files_to_class_directories(
     if file_col is None or class_col is None:
         file_col, class_col = _detect_columns(metadata)
 
-    counts: Dict[str, int] = {}
-    skipped = 0
-
-    for _, row in metadata.iterrows():
-        class_name = str(row[class_col]).strip()
-        file_name  = str(row[file_col]).strip()
-
-        source_file = audio_files.get(file_name)
-        if source_file is None or not os.path.isfile(source_file):
-            skipped += 1
-            continue
+    # Resolve every row at once: strip both columns, map basenames to
+    # source paths and drop the rows whose file was not found (and
+    # repeated rows).  Each class directory is then created and listed
+    # once, instead of an exists() check per row, and the links/copies
+    # run as one batch on the shared thread pool.
+    rows = pd.DataFrame({
+        "class": metadata[class_col].astype(str).str.strip(),
+        "file":  metadata[file_col].astype(str).str.strip(),
+    })
+    rows["src"] = rows["file"].map(audio_files)
+    skipped = int(rows["src"].isna().sum())
+    rows = rows.dropna(subset=["src"]).drop_duplicates(["class", "file"])
 
+    counts: Dict[str, int] = {}
+    pairs: List[Tuple[str, str]] = []
+    for class_name, group in rows.groupby("class", sort=False):
         class_dir = os.path.join(output_base_path, class_name)
-        dest_file = os.path.join(class_dir, file_name)
-
-        # Skip if already copied (idempotent)
-        if os.path.exists(dest_file):
-            continue
-
         os.makedirs(class_dir, exist_ok=True)
-        shutil.copy2(source_file, dest_file)
-        counts[class_name] = counts.get(class_name, 0) + 1
+        # Skip files already copied (idempotent)
+        existing = set(os.listdir(class_dir))
+        new = [(src, os.path.join(class_dir, f))
+               for f, src in zip(group["file"].tolist(), group["src"].tolist())
+               if f not in existing]
+        if new:
+            counts[class_name] = len(new)
+            pairs.extend(new)
+    link_or_copy_files(pairs)
 
     logger.info(
         "Copied %d files across %d classes  (%d skipped – not found)",
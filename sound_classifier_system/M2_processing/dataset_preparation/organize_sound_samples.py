@@ -24,33 +24,49 @@ Workflow position:
     split independently.
 
 LOGIC NOTES:
-    • We use scikit-learn's ``train_test_split`` with stratification
-      to ensure every class appears in every split.
-    • Default split ratios: 70 % train, 15 % validation, 15 % test.
-    • Files are **copied** (not moved) so the original ``sampled_data/``
-      remains intact for re-splitting with different ratios.
-    • Random seed is fixed (42) for reproducibility.
-    • Classes with fewer than ~7 files may fail stratification.  We
-      fall back to a simple sequential split in that case.
+    • Each class is split separately, so every class appears in every
+      split.  A file's split is decided by a keyed hash of its name, not
+      by shuffling the class: it never changes when files are added, so
+      re-running after the dataset grows cannot put a file that is
+      already in ``train/`` into ``test/`` as well.
+    • Default split ratios: 70 % train, 15 % validation, 15 % test
+      (approximate – each file falls into a split independently).
+      A split the hash leaves empty borrows the nearest file by hash
+      order from the largest split, so every class still appears in
+      every split.
+    • Files are **hard-linked** (copied where linking is impossible),
+      not moved, so the original ``sampled_data/`` remains intact for
+      re-splitting with different ratios – without duplicating every
+      byte of the dataset per split.
+    • The hash key is ``random_state`` (default 42): the same key gives
+      the same split, a different key a different one.
+    • Classes with fewer than 6 files are split by rank instead (1 test,
+      1 validation, rest train), still in hash order.
 """
 
 import os
-import shutil
+import hashlib
 import logging
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
-from sklearn.model_selection import train_test_split
+from ._fileops import link_or_copy_files
 
 logger = logging.getLogger(__name__)
 
 
+def _hash_position(fname: str, key: bytes) -> float:
+    """Stable pseudo-random position of ``fname`` in [0, 1) under ``key``."""
+    digest = hashlib.blake2b(fname.encode(), digest_size=8, key=key).digest()
+    return int.from_bytes(digest, "big") / 2 ** 64
+
+
 def organize_samples(
     input_dir: str,
     output_dir: str,
     test_size: float = 0.15,
     val_size: float = 0.15,
     random_state: int = 42,
-):
+) -> Dict[str, int]:
     """
     Split audio files from ``input_dir/<class>/`` into train / validation
     / test sets under ``output_dir/<split>/<class>/``.
@@ -61,22 +77,30 @@ def organize_samples(
     output_dir : str – e.g. ``../../sound_dataset``
     test_size : float – fraction reserved for testing (0–1)
     val_size : float  – fraction reserved for validation (0–1)
-    random_state : int – for reproducibility
-
-    LOGIC NOTE on split order:
-        We first split into train+val vs test, then split train+val
-        into train vs val.  The second split must adjust its ratio:
-            val_ratio_within_trainval = val_size / (1 - test_size)
-        So for test_size=0.15, val_size=0.15:
-            first split:  85 % trainval, 15 % test
-            second split: val_ratio = 0.15 / 0.85 ≈ 0.176
-            result:       ~70 % train, ~15 % val, ~15 % test  ✓
+    random_state : int – hash key; the same value reproduces the split
+
+    Returns
+    -------
+    dict – ``{"train": n, "validation": n, "test": n}`` files assigned to
+    each split (including ones already present from an earlier run).
+
+    LOGIC NOTE on split assignment:
+        Position ``p`` in [0, 1) comes from BLAKE2b of the file name
+        keyed with ``random_state``:
+            p < test_size                    → test
+            p < test_size + val_size         → validation
+            otherwise                        → train
+        One hash per file, no shuffle – and unlike the former two-stage
+        ``train_test_split`` the assignment of a file does not depend on
+        which other files are in the class, except when a split would
+        otherwise be empty (see the module notes).
     """
     # Create split directories
     for split in ["train", "validation", "test"]:
         os.makedirs(os.path.join(output_dir, split), exist_ok=True)
 
-    total_copied = 0
+    pairs: List[Tuple[str, str]] = []
+    split_counts = {"train": 0, "validation": 0, "test": 0}
 
     for class_name in sorted(os.listdir(input_dir)):
         class_dir = os.path.join(input_dir, class_name)
@@ -93,34 +117,47 @@ def organize_samples(
             logger.warning("Skipping empty class: %s", class_name)
             continue
 
-        # Minimum samples needed for stratified split is ~2 per split
-        # With 3 splits, we need at least 6 files.  If fewer, fall
-        # back to a simple serial assignment.
+        key = str(random_state).encode()[:64]
+        positions = {f: _hash_position(f, key) for f in audio_files}
+
+        # With fewer than 6 files independent draws would often leave a
+        # split empty, so assign by rank instead.
         if len(audio_files) < 6:
             logger.warning(
                 "Class '%s' has only %d files – using sequential split "
-                "instead of stratified random",
+                "instead of hashed",
                 class_name, len(audio_files),
             )
             # Assign 1 to test, 1 to val, rest to train
-            test_files = audio_files[:1]
-            val_files  = audio_files[1:2]
-            train_files = audio_files[2:]
+            ranked = sorted(audio_files, key=positions.__getitem__)
+            test_files = ranked[:1]
+            val_files  = ranked[1:2]
+            train_files = ranked[2:]
         else:
-            # Two-stage stratified split
-            combined_hold = test_size + val_size
-            train_files, holdout = train_test_split(
-                audio_files,
-                test_size=combined_hold,
-                random_state=random_state,
-            )
-            # Split holdout into val and test
-            val_ratio = val_size / combined_hold
-            val_files, test_files = train_test_split(
-                holdout,
-                test_size=(1 - val_ratio),
-                random_state=random_state,
-            )
+            test_files, val_files, train_files = [], [], []
+            for fname, p in positions.items():
+                if p < test_size:
+                    test_files.append(fname)
+                elif p < test_size + val_size:
+                    val_files.append(fname)
+                else:
+                    train_files.append(fname)
+
+            # Independent draws can leave a small class without a test
+            # or validation file (~1 in 3 classes of 10 at 15 %/15 %).
+            # Fill an empty split from the largest one with the file
+            # whose hash position is nearest to it: the lowest-ranked
+            # file for test/validation, the highest-ranked for train.
+            splits = {"test": (test_files, test_size),
+                      "validation": (val_files, val_size),
+                      "train": (train_files, 1.0)}
+            for split_name, (files, size) in splits.items():
+                if files or size <= 0:
+                    continue
+                donor = max((f for f, _ in splits.values()), key=len)
+                pick = (max if split_name == "train" else min)(donor, key=positions.__getitem__)
+                donor.remove(pick)
+                files.append(pick)
 
         # Copy files into split directories
         for split_name, files in [
@@ -130,20 +167,22 @@ def organize_samples(
         ]:
             split_class_dir = os.path.join(output_dir, split_name, class_name)
             os.makedirs(split_class_dir, exist_ok=True)
+            split_counts[split_name] += len(files)
             for fname in files:
                 src = os.path.join(class_dir, fname)
                 dst = os.path.join(split_class_dir, fname)
                 if not os.path.exists(dst):
-                    shutil.copy2(src, dst)
-                    total_copied += 1
+                    pairs.append((src, dst))
 
         logger.info(
             "%-20s  train=%d  val=%d  test=%d",
             class_name, len(train_files), len(val_files), len(test_files),
         )
 
-    logger.info("Dataset organization complete! %d files copied.", total_copied)
+    link_or_copy_files(pairs)
+    logger.info("Dataset organization complete! %d files placed.", len(pairs))
     print("Dataset organization complete!")
+    return split_counts
 
 
 if __name__ == "__main__":
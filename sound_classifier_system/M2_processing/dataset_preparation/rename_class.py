@@ -25,6 +25,8 @@ Logic notes:
     • Class names are normalised (lowered, spaces → underscores) to avoid
       file-system issues on Windows.
     • Files that already exist in the target are skipped (idempotent).
+    • "Copying" hard-links the file when source and target share a
+      filesystem (see ``_fileops.py``) and falls back to a byte copy.
     • The ``rename_and_copy()`` function is importable from the API layer
       so the Electron UI can call it without a terminal.
     • We validate that at least one audio file exists in each selected
@@ -38,11 +40,12 @@ KNOWN EDGE CASES:
 """
 
 import os
-import shutil
 import logging
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
+from ._fileops import link_or_copy_files
+
 logger = logging.getLogger(__name__)
 
 # Supported audio extensions (without leading dot for matching convenience)
@@ -68,16 +71,17 @@ def list_directories_with_audio(
     exts = set(extensions) if extensions else _AUDIO_EXTENSIONS
     results: List[Tuple[str, int]] = []
 
-    for entry in sorted(os.listdir(base_path)):
-        dir_path = os.path.join(base_path, entry)
-        if not os.path.isdir(dir_path):
-            continue    # skip loose files at the root level
-
-        count = sum(
-            1 for f in os.listdir(dir_path)
-            if os.path.isfile(os.path.join(dir_path, f))
-            and os.path.splitext(f)[1].lower() in exts
-        )
+    # scandir entries carry their file type from the directory listing,
+    # so no isdir()/isfile() stat per entry.
+    with os.scandir(base_path) as it:
+        dirs = sorted((e.name, e.path) for e in it if e.is_dir())   # skip loose root files
+
+    for _, dir_path in dirs:
+        with os.scandir(dir_path) as it:
+            count = sum(
+                1 for f in it
+                if os.path.splitext(f.name)[1].lower() in exts and f.is_file()
+            )
         if count > 0:
             results.append((dir_path, count))
 
@@ -104,22 +108,20 @@ def copy_directory_to_class(
     """
     exts = set(extensions) if extensions else _AUDIO_EXTENSIONS
     os.makedirs(dest_dir, exist_ok=True)
-    copied = 0
-
-    for fname in os.listdir(source_dir):
-        if os.path.splitext(fname)[1].lower() not in exts:
-            continue
-        src = os.path.join(source_dir, fname)
-        dst = os.path.join(dest_dir, fname)
-        if not os.path.isfile(src):
-            continue
-        if os.path.exists(dst):
-            # Already copied in a previous run – skip for idempotency
-            continue
-        shutil.copy2(src, dst)
-        copied += 1
-
-    return copied
+    pairs: List[Tuple[str, str]] = []
+
+    # Already copied in a previous run – skip for idempotency
+    existing = set(os.listdir(dest_dir))
+    with os.scandir(source_dir) as it:
+        for entry in it:
+            if os.path.splitext(entry.name)[1].lower() not in exts:
+                continue
+            if entry.name in existing or not entry.is_file():
+                continue
+            pairs.append((entry.path, os.path.join(dest_dir, entry.name)))
+
+    link_or_copy_files(pairs)
+    return len(pairs)
 
 
 # ────────────────────────────────────────────────────────────────
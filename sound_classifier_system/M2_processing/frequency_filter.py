@@ -273,10 +273,10 @@ def analyse_file(
     Full analysis of an audio file: frequency bands + Doppler + hybrid
     classification.  Returns a combined dict suitable for JSON response.
     """
-    import librosa
+    from .audio_io import load_audio
     from ..doppler.doppler import full_doppler_analysis
 
-    audio, sr = librosa.load(file_path, sr=sr)
+    audio, sr = load_audio(file_path, sr=sr)
 
     doppler = full_doppler_analysis(audio, sr, speed_of_sound=speed_of_sound,
                                      distance_m=distance_m)
@@ -1,7 +1,10 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pydub import AudioSegment
 import numpy as np
 
+from ..audio_io import export_mp3
+
 def split_audio_on_clicks(audio_path, output_prefix, min_duration=3000):
     audio = AudioSegment.from_file(audio_path)
     samples = np.array(audio.get_array_of_samples())
@@ -17,7 +20,7 @@ def split_audio_on_clicks(audio_path, output_prefix, min_duration=3000):
         if len(chunk) >= min_duration and chunk.dBFS > -50:
             if audio_path.lower().endswith('.mp3'):
                 print(f"Generating chunk: {output_prefix}_{chunk_count}.mp3")
-                chunk.export(f"{output_prefix}_{chunk_count}.mp3", format="mp3")
+                export_mp3(chunk, f"{output_prefix}_{chunk_count}.mp3")
             elif audio_path.lower().endswith('.wav'):
                 print(f"Generating chunk: {output_prefix}_{chunk_count}.wav")
                 chunk.export(f"{output_prefix}_{chunk_count}.wav", format="wav")
@@ -25,15 +28,36 @@ def split_audio_on_clicks(audio_path, output_prefix, min_duration=3000):
         start = end
     chunk = audio[start:]
     if len(chunk) >= min_duration and chunk.dBFS > -50:
-        chunk.export(f"{output_prefix}_{chunk_count}.mp3", format="mp3")
+        export_mp3(chunk, f"{output_prefix}_{chunk_count}.mp3")
+
+def _split_job(job):
+    # module level so ProcessPoolExecutor can pickle it
+    split_audio_on_clicks(*job)
 
-def process_all_files(input_folder, output_folder):
+def process_all_files(input_folder, output_folder, workers=None):
+    """
+    Chunk every MP3/WAV in ``input_folder`` into ``output_folder``.
+
+    ``workers`` > 1 splits files in that many processes – each file is
+    independent, so this scales with cores.  Default: one file at a time.
+    """
+    jobs = []
     for file_name in os.listdir(input_folder):
         if file_name.lower().endswith(('.mp3', '.wav')):
             file_path = os.path.join(input_folder, file_name)
             base_name = os.path.splitext(file_name)[0]
             output_prefix = os.path.join(output_folder, f"{base_name}_chunk")
-            split_audio_on_clicks(file_path, output_prefix)
+            jobs.append((file_path, output_prefix))
+
+    if not workers or workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            _split_job(job)
+        return
+    workers = min(workers, len(jobs))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # consume the iterator so worker errors are raised here
+        for _ in pool.map(_split_job, jobs, chunksize=max(1, len(jobs) // (4 * workers))):
+            pass
 
 if __name__ == "__main__":
     input_folder = "../../sound_data/raw"
@@ -1,10 +1,35 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
 SAMPLE_RATE = 44100
 
 def sliding_window(audio, window_size=1.0, step=0.5):
     """
-    Generator that yields overlapping audio windows.
+    Overlapping audio windows as a zero-copy strided view of shape
+    ``(n_windows, samples_per_window)`` – iterating it yields the same
+    windows the old generator did.
     """
     samples_per_window = int(window_size * SAMPLE_RATE)
     step_samples = int(step * SAMPLE_RATE)
-    for i in range(0, len(audio) - samples_per_window, step_samples):
-        yield audio[i:i + samples_per_window]
+    audio = np.asarray(audio)
+    if len(audio) <= samples_per_window:
+        return np.empty((0, samples_per_window), dtype=audio.dtype)
+    # Window starts run over range(0, len - window, step), as before.
+    return sliding_window_view(audio, samples_per_window)[
+        :len(audio) - samples_per_window:step_samples]
+
+
+def window_rms(audio, window_size=1.0, step=0.5):
+    """
+    RMS level of each :func:`sliding_window` window, as a float64 array
+    of length ``n_windows``.
+
+    The sum of squares is an ``einsum`` over the strided view: one pass
+    per window with no ``(n_windows, samples_per_window)`` temporary,
+    accumulated in float64 so float32 input does not lose precision.
+    """
+    windows = sliding_window(audio, window_size, step)
+    if windows.shape[0] == 0:
+        return np.empty(0)
+    sq = np.einsum("ij,ij->i", windows, windows, dtype=np.float64)
+    return np.sqrt(sq / windows.shape[1])
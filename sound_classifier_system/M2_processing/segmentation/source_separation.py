@@ -1,18 +1,28 @@
 import librosa
 import numpy as np
 from librosa import decompose
+from scipy.signal import resample_poly
 
-def separate_sources(audio_data, n_components=2):
+def separate_sources(audio_data, n_components=2, sr=None, work_sr=None):
     """
     Separates mixed audio into distinct sources using Non-negative Matrix Factorization (NMF).
     Returns a list of separated sources.
+
+    If ``sr`` and ``work_sr`` are given and ``sr > work_sr``, the mix is
+    resampled to ``work_sr`` first – NMF cost scales with the number of
+    STFT frames, i.e. with the sample rate – and each source is resampled
+    back to ``sr``.  Content above ``work_sr / 2`` is lost, so this is
+    for analysis rather than hi-fi playback.
     """
+    if sr is not None and work_sr is not None and sr > work_sr:
+        low = resample_poly(audio_data, work_sr, sr)
+        return [resample_poly(src, sr, work_sr)[:len(audio_data)]
+                for src in separate_sources(low, n_components)]
+
     stft = librosa.stft(audio_data)
     magnitude, phase = librosa.magphase(stft)
     components, activations = decompose.decompose(magnitude, n_components=n_components, sort=True)
-    sources = []
-    for i in range(n_components):
-        source_stft = components[:, i:i+1] * activations[i:i+1, :]
-        source = librosa.istft(source_stft * phase)
-        sources.append(source)
-    return sources
+    # All rank-1 source spectrograms as one (n_components, freq, frames)
+    # stack, inverted by a single batched istft call.
+    source_stfts = np.einsum("fk,kt->kft", components, activations) * phase
+    return list(librosa.istft(source_stfts))
@@ -0,0 +1,70 @@
+"""
+Approximate k-NN Classifier
+=============================
+Purpose:
+    A drop-in for ``KNeighborsClassifier`` backed by an HNSW graph
+    (``hnswlib``), for the ensemble in ``gui_workflow.build_model`` once
+    the training set is large.
+
+LOGIC NOTE:
+    Exact k-NN on dense feature vectors is a brute-force distance scan
+    (KD/ball trees do not help at these dimensions), so every query costs
+    O(N · d).  An HNSW query visits O(log N) nodes at ~99 % recall with
+    the default ``ef``.  Below a few tens of thousands of vectors the
+    BLAS scan is as fast, which is why the caller only switches here for
+    large N.
+
+    Probabilities are the neighbour vote fractions – the same as
+    ``KNeighborsClassifier(weights="uniform")`` – so soft voting weighs
+    this member exactly as before.
+
+    The class lives in a package module (not in the GUI script) so that a
+    pickled ensemble can be loaded by the API without importing Tk.
+"""
+
+import numpy as np
+from sklearn.base import BaseEstimator, ClassifierMixin
+
+
+class HNSWClassifier(ClassifierMixin, BaseEstimator):
+    """
+    k-NN classifier over an ``hnswlib`` index (L2 distance).
+
+    Parameters
+    ----------
+    n_neighbors : int
+    ef_construction, M : int – HNSW build parameters (graph quality /
+        out-degree).
+    ef : int – query-time candidate list size; raised to ``n_neighbors``
+        if smaller.
+    """
+
+    def __init__(self, n_neighbors=5, ef_construction=200, M=16, ef=50):
+        self.n_neighbors = n_neighbors
+        self.ef_construction = ef_construction
+        self.M = M
+        self.ef = ef
+
+    def fit(self, X, y):
+        import hnswlib
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        self.classes_, self._y = np.unique(y, return_inverse=True)
+        self.index_ = hnswlib.Index(space="l2", dim=X.shape[1])
+        self.index_.init_index(max_elements=len(X), ef_construction=self.ef_construction,
+                               M=self.M)
+        self.index_.add_items(X, num_threads=-1)
+        self.index_.set_ef(max(self.ef, self.n_neighbors))
+        self.n_features_in_ = X.shape[1]
+        return self
+
+    def predict_proba(self, X):
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        k = min(self.n_neighbors, len(self._y))
+        neighbours, _ = self.index_.knn_query(X, k=k, num_threads=-1)
+        proba = np.zeros((len(X), len(self.classes_)))
+        np.add.at(proba, (np.arange(len(X))[:, None], self._y[neighbours]), 1.0)
+        proba /= k
+        return proba
+
+    def predict(self, X):
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
@@ -75,9 +75,9 @@ def detect_anomalies(
     Returns
     -------
     dict with keys:
-        anomalies      : list[int]    — indices of anomalous samples
-        scores         : list[float]  — anomaly score per sample
-        labels         : list[int]    — 1 = normal, -1 = anomaly
+        anomalies      : np.ndarray   — indices of anomalous samples
+        scores         : np.ndarray   — anomaly score per sample
+        labels         : np.ndarray   — 1 = normal, -1 = anomaly
         model_path     : str          — where the model was saved
         method         : str
         stats          : dict         — summary statistics
@@ -128,12 +128,14 @@ def detect_anomalies(
     labels = model.predict(X_scaled)           # 1 = normal, -1 = anomaly
     scores = model.decision_function(X_scaled)  # higher = more normal
 
-    anomaly_indices = [int(i) for i, lbl in enumerate(labels) if lbl == -1]
+    anomaly_indices = np.flatnonzero(labels == -1)
 
+    # LOGIC NOTE: arrays are returned as-is – the endpoint serialises
+    # them with orjson (OPT_SERIALIZE_NUMPY), so no .tolist() copy.
     return {
         "anomalies": anomaly_indices,
-        "scores": scores.tolist(),
-        "labels": labels.tolist(),
+        "scores": scores,
+        "labels": labels,
         "model_path": model_path,
         "method": method,
         "stats": {
@@ -176,8 +178,8 @@ def cluster_audio(
     Returns
     -------
     dict with keys:
-        cluster_labels    : list[int]     — cluster id per sample
-        cluster_centers   : list[list]    — centroid coordinates (KMeans only)
+        cluster_labels    : np.ndarray    — cluster id per sample
+        cluster_centers   : np.ndarray    — centroid coordinates (KMeans only)
         n_clusters_found  : int
         silhouette_score  : float         — quality metric (-1 to 1)
         cluster_sizes     : dict[int,int] — samples per cluster
@@ -218,7 +220,7 @@ def cluster_audio(
             random_state=42,
         )
         labels = model.fit_predict(X_scaled)
-        centers = model.cluster_centers_.tolist()
+        centers = model.cluster_centers_
 
     # Compute quality metric
     unique_labels = set(labels)
@@ -231,12 +233,11 @@ def cluster_audio(
         silhouette = float(silhouette_score(X_scaled, labels))
 
     # Cluster sizes
-    cluster_sizes = {}
-    for lbl in labels:
-        cluster_sizes[int(lbl)] = cluster_sizes.get(int(lbl), 0) + 1
+    ids, counts = np.unique(labels, return_counts=True)
+    cluster_sizes = dict(zip(ids.tolist(), counts.tolist()))
 
     return {
-        "cluster_labels": labels.tolist(),
+        "cluster_labels": labels,
         "cluster_centers": centers,
         "n_clusters_found": n_found,
         "silhouette_score": silhouette,
@@ -319,14 +320,9 @@ def analyze_scene(
             from M2_processing.dataset_preparation.feature_extraction import (
                 extract_features, FeatureConfig,
             )
-            import tempfile
-            import soundfile as sf
-
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                sf.write(tmp.name, audio, sr)
-                cfg = FeatureConfig(**model_bundle.get("config", {}))
-                feat = extract_features(tmp.name, config=cfg)
-                os.unlink(tmp.name)
+
+            cfg = FeatureConfig(**model_bundle.get("config", {}))
+            feat = extract_features((audio, sr), config=cfg)
 
             if feat is not None:
                 clf = model_bundle["model"]
@@ -1,16 +1,42 @@
 import os
+from functools import lru_cache
+
 import joblib
 from dotenv import load_dotenv
 
 load_dotenv()
 
 MODEL_FILE = os.getenv("SOUND_MODEL")
-if not MODEL_FILE:
-    raise EnvironmentError("SOUND_MODEL environment variable not defined.")
+
+
+def _is_uncompressed(path):
+    """True if ``path`` is a plain joblib pickle (starts with a PROTO opcode)."""
+    with open(path, "rb") as f:
+        return f.read(1) == b"\x80"
+
 
 def load_model():
-    """Loads the ML model from disk."""
+    """
+    Loads the ML model from disk.
+
+    Uncompressed models are memory-mapped, so the forest's node arrays are
+    shared page cache across forked API workers instead of one copy each.
+    joblib cannot mmap a compressed file (it warns and ignores the flag),
+    so compressed models – what ``build_model`` saves – load normally.
+    """
+    if not MODEL_FILE:
+        raise EnvironmentError("SOUND_MODEL environment variable not defined.")
     print("Loading model...")
-    model = joblib.load(MODEL_FILE)
+    mmap_mode = "r" if _is_uncompressed(MODEL_FILE) else None
+    model = joblib.load(MODEL_FILE, mmap_mode=mmap_mode)
     print("Model loaded successfully.")
     return model
+
+
+@lru_cache(maxsize=1)
+def get_model():
+    """
+    Process-wide model singleton – loaded on first use, not at import,
+    so importing this module never blocks startup.
+    """
+    return load_model()
@@ -7,22 +7,46 @@ inherits from ``AudioSource`` and implements four methods:
     read_chunk – return (N, C) numpy float32 array
     stop     – release resources
     get_info – diagnostic dict
+
+``async_stream`` is provided for asyncio consumers (WebSocket handlers).
+Sources that capture on their own thread / callback set
+``PUSHES_FRAMES = True`` and call ``_publish`` with every captured block,
+so the event loop never waits on the device; any other source is polled
+with ``read_chunk`` in the default executor.
 """
 
+import asyncio
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator, List, Tuple
 import numpy as np
 
 
+def _offer(queue: asyncio.Queue, block) -> None:
+    """Runs on the consumer's loop: enqueue, dropping if it is full."""
+    try:
+        queue.put_nowait(block)
+    except asyncio.QueueFull:
+        pass  # slow consumer – drop the block rather than stall capture
+
+
 class AudioSource(ABC):
     """Abstract base class for all audio capture sources."""
 
+    #: True if the source calls ``_publish`` from its capture thread.
+    PUSHES_FRAMES = False
+
     def __init__(self, sample_rate: int = 44100, channels: int = 1,
                  dtype: np.dtype = np.float32):
         self.sample_rate = sample_rate
         self.channels = channels
         self.dtype = dtype
         self.is_running = False
+        # (loop, queue) per live async_stream; replaced, never mutated,
+        # so the capture thread can iterate it without a lock
+        self._subscribers: List[Tuple[asyncio.AbstractEventLoop,
+                                      asyncio.Queue]] = []
+        self._subscribers_lock = threading.Lock()
 
     # ---- lifecycle ---------------------------------------------------
     @abstractmethod
@@ -53,6 +77,86 @@ class AudioSource(ABC):
         """Return a JSON-serialisable dict with device diagnostics."""
         ...
 
+    # ---- async streaming ---------------------------------------------
+    async def async_stream(self, frames: int = 1024,
+                           max_queued: int = 64) -> AsyncIterator[np.ndarray]:
+        """
+        Yield ``(frames, channels)`` float32 chunks until the source stops.
+
+        Each call gets its own queue, so several WebSocket clients can
+        share one open device.  A consumer that falls more than
+        ``max_queued`` captured blocks behind loses blocks instead of
+        back-pressuring the capture thread.
+        """
+        loop = asyncio.get_running_loop()
+        if not self.PUSHES_FRAMES:
+            while self.is_running:
+                try:
+                    chunk = await loop.run_in_executor(None, self.read_chunk,
+                                                       frames)
+                except RuntimeError:
+                    if self.is_running:
+                        raise
+                    return  # stopped while the read was in flight
+                yield chunk
+            return
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_queued)
+        sub = (loop, queue)
+        with self._subscribers_lock:
+            self._subscribers = self._subscribers + [sub]
+        try:
+            # Re-block the capture-sized pieces into ``frames``-sized chunks
+            chunk = np.empty((frames, self.channels), dtype=np.float32)
+            filled = 0
+            while self.is_running:
+                block = await queue.get()
+                if block is None:
+                    return
+                pos = 0
+                while pos < len(block):
+                    k = min(frames - filled, len(block) - pos)
+                    chunk[filled:filled + k] = block[pos:pos + k]
+                    filled += k
+                    pos += k
+                    if filled == frames:
+                        yield chunk
+                        chunk = np.empty_like(chunk)
+                        filled = 0
+        finally:
+            with self._subscribers_lock:
+                self._subscribers = [s for s in self._subscribers
+                                     if s is not sub]
+
+    def _publish(self, frames: np.ndarray, scale=None) -> None:
+        """
+        Hand a captured block to every ``async_stream`` consumer.
+
+        Called from the capture thread / callback.  ``frames`` may be a
+        reused buffer, so it is copied (and scaled to float32 if
+        ``scale`` is given) once and shared by all consumers.
+        """
+        subs = self._subscribers
+        if not subs:
+            return
+        if scale is not None:
+            block = np.multiply(frames, scale, dtype=np.float32)
+        else:
+            block = np.array(frames, dtype=np.float32)
+        for loop, queue in subs:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, block)
+            except RuntimeError:
+                pass  # consumer's loop already closed
+
+    def _end_streams(self) -> None:
+        """Wake every ``async_stream`` consumer so it can finish; call from stop()."""
+        for loop, queue in self._subscribers:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, None)
+            except RuntimeError:
+                pass
+
     # ---- helpers -----------------------------------------------------
     def __enter__(self):
         self.connect()
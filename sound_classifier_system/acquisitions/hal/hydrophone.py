@@ -4,12 +4,18 @@ Hydrophone / Standard USB Microphone / Bluetooth Audio Source
 Uses ``sounddevice`` (PortAudio) to capture from any OS-enumerated
 audio input device – USB hydrophones, built-in mics, Bluetooth
 headsets, or ASIO interfaces (Windows, with SDK installed).
+
+Capture is callback-driven: PortAudio pushes each block into an
+internal ring buffer, and ``read_chunk`` pulls from that ring without
+ever blocking on the device.
 """
 
 import numpy as np
 import sounddevice as sd
 from typing import Dict, Any, Optional
 from .base import AudioSource
+from .ring_buffer import RingBuffer
+from .rt_logging import rt_logger
 
 
 class HydrophoneSource(AudioSource):
@@ -26,16 +32,27 @@ class HydrophoneSource(AudioSource):
     channels : int
         Number of input channels.
     blocksize : int
-        Frames per read (passed to sounddevice).
+        Frames per callback (passed to sounddevice).
+    buffer_seconds : float
+        Ring-buffer length in seconds between the PortAudio callback
+        and ``read_chunk``.
     """
 
+    PUSHES_FRAMES = True
+
     def __init__(self, device_id: Optional[int] = None,
                  sample_rate: int = 44100, channels: int = 1,
-                 blocksize: int = 1024):
+                 blocksize: int = 1024, buffer_seconds: float = 2.0):
         super().__init__(sample_rate=sample_rate, channels=channels)
         self.device_id = device_id
         self.blocksize = blocksize
         self._stream: Optional[sd.InputStream] = None
+        self._buffer = RingBuffer(int(sample_rate * buffer_seconds), channels)
+        self._overflows: int = 0           # bumped by the callback only
+        self._reported_overflows: int = 0  # consumer-side bookkeeping
+        self._underflows: int = 0
+        # True when the most recent read_chunk had to zero-pad
+        self.last_read_underflowed: bool = False
 
     # ------------------------------------------------------------------
     def connect(self) -> None:
@@ -45,17 +62,36 @@ class HydrophoneSource(AudioSource):
             channels=self.channels,
             dtype="float32",
             blocksize=self.blocksize,
+            callback=self._audio_cb,
         )
-        self._stream.start()
         self.is_running = True
+        self._stream.start()
+
+    def _audio_cb(self, indata: np.ndarray, frames: int,
+                  time_info, status: sd.CallbackFlags) -> None:
+        """PortAudio callback – runs on the audio thread, must not block."""
+        if status.input_overflow:
+            self._overflows += 1
+        self._buffer.write(indata)
+        self._publish(indata)
 
     def read_chunk(self, frames: int = 1024) -> np.ndarray:
         if self._stream is None or not self.is_running:
             raise RuntimeError("Source not connected. Call connect() first.")
-        data, overflowed = self._stream.read(frames)
-        if overflowed:
-            print("[HydrophoneSource] ⚠ buffer overflow – frames dropped")
-        return data  # shape (frames, channels), float32
+        overflows = self._overflows
+        if overflows != self._reported_overflows:
+            rt_logger.warning("[HydrophoneSource] ⚠ buffer overflow – frames "
+                              "dropped (%d callback(s))",
+                              overflows - self._reported_overflows)
+            self._reported_overflows = overflows
+
+        # Zero-padded on underflow; shape (frames, channels), float32
+        out = np.zeros((frames, self.channels), dtype=np.float32)
+        n = self._buffer.read_into(out)
+        self.last_read_underflowed = n < frames
+        if self.last_read_underflowed:
+            self._underflows += 1
+        return out
 
     def stop(self) -> None:
         if self._stream is not None:
@@ -63,6 +99,7 @@ class HydrophoneSource(AudioSource):
             self._stream.close()
             self._stream = None
         self.is_running = False
+        self._end_streams()
 
     def get_info(self) -> Dict[str, Any]:
         dev = sd.query_devices(self.device_id, kind="input")
@@ -73,6 +110,8 @@ class HydrophoneSource(AudioSource):
             "sample_rate": self.sample_rate,
             "channels": self.channels,
             "host_api": dev.get("hostapi"),
+            "buffer_len": len(self._buffer),
+            "underflows": self._underflows,
         }
 
     # ------------------------------------------------------------------
@@ -0,0 +1,99 @@
+"""
+Hardware Abstraction Layer – Frame Ring Buffer
+===============================================
+Fixed-size ``(frames, channels)`` float32 ring shared between one
+producer (a capture thread or PortAudio callback) and one consumer
+(``read_chunk``).  Writes and reads are at most two ``np.copyto``
+calls each – no per-frame Python work and no allocation on the
+producer side.
+
+The capacity is rounded up to a power of two so positions wrap with a
+bit-mask.  ``_w`` and ``_r`` are monotonically increasing frame counts;
+only the producer advances ``_w`` and only the consumer advances ``_r``.
+When the producer laps the consumer the oldest frames are discarded,
+matching the old ``deque(maxlen=...)`` behaviour.
+"""
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Single-producer / single-consumer ring of audio frames.
+
+    Parameters
+    ----------
+    frames : int
+        Minimum capacity in frames (rounded up to a power of two).
+    channels : int
+        Number of channels per frame.
+    """
+
+    def __init__(self, frames: int, channels: int, dtype=np.float32):
+        size = 1 << max(0, int(frames) - 1).bit_length()
+        self._ring = np.zeros((size, channels), dtype=dtype)
+        self._size = size
+        self._mask = size - 1
+        self._w = 0
+        self._r = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return min(self._w - self._r, self._size)
+
+    # ------------------------------------------------------------------
+    def write(self, frames: np.ndarray, scale=None) -> None:
+        """
+        Append ``(n, channels)`` frames, overwriting the oldest on overflow.
+
+        If ``scale`` is given, frames are multiplied by it on the way in
+        (e.g. int16 → float32 normalisation) with the ring slice as the
+        ``out`` array, so no converted temporary is allocated.
+        """
+        n = frames.shape[0]
+        if n > self._size:
+            # Only the newest ``size`` frames can survive anyway.
+            self._w += n - self._size
+            frames = frames[n - self._size:]
+            n = self._size
+
+        N = self._size
+        w = self._w & self._mask
+        first = min(n, N - w)
+        if scale is None:
+            np.copyto(self._ring[w:w + first], frames[:first])
+            if n > first:
+                np.copyto(self._ring[:n - first], frames[first:])
+        else:
+            np.multiply(frames[:first], scale, out=self._ring[w:w + first])
+            if n > first:
+                np.multiply(frames[first:], scale, out=self._ring[:n - first])
+        self._w += n
+
+    def read_into(self, out: np.ndarray) -> int:
+        """
+        Move up to ``len(out)`` of the oldest frames into ``out``.
+
+        Returns the number of frames copied; the remainder of ``out``
+        is left untouched.
+        """
+        w = self._w
+        if w - self._r > self._size:
+            # Producer lapped us – skip to the oldest frame still intact.
+            self._r = w - self._size
+
+        n = min(out.shape[0], w - self._r)
+        if n <= 0:
+            return 0
+
+        N = self._size
+        r = self._r & self._mask
+        first = min(n, N - r)
+        np.copyto(out[:first], self._ring[r:r + first])
+        if n > first:
+            np.copyto(out[first:n], self._ring[:n - first])
+        self._r += n
+        return n
@@ -0,0 +1,43 @@
+"""
+Hardware Abstraction Layer – Realtime-safe Logging
+===================================================
+Capture threads and PortAudio callbacks must never block on stdio: a
+``print`` takes the stdout lock and may wait on a slow pipe or
+terminal, which shows up as dropped packets / buffer overruns.
+
+``rt_logger`` only enqueues the record (non-blocking, dropped if the
+queue is full).  A ``QueueListener`` thread started at import does the
+formatting and the actual write to stderr.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=1024)
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of blocking or raising."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Same process – hand over the record as-is and let the listener
+        # thread do the message formatting.
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass  # never block the audio thread on logging
+
+
+rt_logger = logging.getLogger("acquisitions.hal.rt")
+rt_logger.setLevel(logging.INFO)
+rt_logger.addHandler(_NonBlockingQueueHandler(_log_queue))
+rt_logger.propagate = False
+
+_listener = QueueListener(_log_queue, logging.StreamHandler())
+_listener.start()
+atexit.register(_listener.stop)
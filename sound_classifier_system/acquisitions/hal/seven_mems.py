@@ -11,6 +11,7 @@ import numpy as np
 import sounddevice as sd
 from typing import Dict, Any, Optional
 from .base import AudioSource
+from .rt_logging import rt_logger
 
 
 class SevenMEMSSource(AudioSource):
@@ -57,7 +58,7 @@ class SevenMEMSSource(AudioSource):
             raise RuntimeError("Source not connected. Call connect() first.")
         data, overflowed = self._stream.read(frames)
         if overflowed:
-            print("[SevenMEMSSource] ⚠ buffer overflow")
+            rt_logger.warning("[SevenMEMSSource] ⚠ buffer overflow")
         # data is already (frames, 7) float32 from sounddevice
         return data
 
@@ -12,16 +12,36 @@ Each UDP datagram is assumed to be raw bytes:
     [4 bytes: sample_count   (uint32)] +
     [remaining: interleaved int16 samples for 16 channels]
 
+At 48 kHz × 16 ch × int16 the stream is ~1.5 MB/s, i.e. ~1000 datagrams/s
+with a standard 1500-byte MTU.  With ``jumbo_frames=True`` the Orange Pi
+should be configured to send ~9000-byte datagrams (``ip link set <if> mtu
+9000`` on both ends and on any switch in between); that cuts the packet
+rate – and the number of receive/decode calls – roughly 6×.
+
 If your Orange Pi sends a different format, override ``_decode_packet``.
+It may return int16 frames (scaled to [-1, 1) as they are written into
+the ring buffer) or already-normalised float32 frames.
 """
 
+import os
 import socket
+import selectors
 import struct
 import threading
-import collections
 import numpy as np
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Set, Tuple, Union
 from .base import AudioSource
+from .ring_buffer import RingBuffer
+from .rt_logging import rt_logger
+
+# int16 full-scale → [-1, 1).  Kept as a float32 scalar so the scaling
+# multiply stays a pure float32 loop (a Python float would be float64).
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+# One interleaved frame as a sub-array dtype: ``np.frombuffer`` with these
+# yields an (n_frames, 16) array directly, so no reshape is needed.
+_FRAME_I16 = np.dtype((np.int16, (16,)))
+_FRAME_F32 = np.dtype((np.float32, (16,)))
 
 
 class SixteenMEMSSource(AudioSource):
@@ -40,32 +60,78 @@ class SixteenMEMSSource(AudioSource):
         Ring-buffer length in seconds (to absorb network jitter).
     sample_format : str
         ``"int16"`` or ``"float32"``  – how the Orange Pi encodes samples.
+    jumbo_frames : bool
+        Set when the producer and network use a 9000-byte MTU.  The
+        kernel receive buffer is enlarged so a burst of jumbo datagrams
+        is not dropped before the receive thread drains it.
+    cpu_affinity : set of int or None
+        CPU core(s) to pin the receive thread to (Linux only).  Pick a
+        core the rest of the process does not keep busy.
+    rt_priority : int or None
+        If set, run the receive thread under ``SCHED_FIFO`` at this
+        priority (1–99, Linux only).  Needs ``CAP_SYS_NICE``; without it
+        we fall back to nice -10, and failing that to normal priority.
     """
 
     CHANNELS = 16
-    HEADER_SIZE = 8  # seq (4) + sample_count (4)
+    PUSHES_FRAMES = True
+    _HDR = struct.Struct("<II")  # seq (uint32) + sample_count (uint32)
+    HEADER_SIZE = _HDR.size
+    MAX_DATAGRAM = 65535  # receive scratch size – largest possible UDP payload
+    JUMBO_MTU = 9000
+    JUMBO_RCVBUF = 64 * JUMBO_MTU  # kernel queue for ~64 jumbo datagrams
 
     def __init__(self, host: str = "0.0.0.0", port: int = 5000,
                  sample_rate: int = 48000, buffer_seconds: float = 2.0,
-                 sample_format: str = "int16"):
+                 sample_format: str = "int16", jumbo_frames: bool = False,
+                 cpu_affinity: Optional[Set[int]] = None,
+                 rt_priority: Optional[int] = None):
         super().__init__(sample_rate=sample_rate, channels=self.CHANNELS)
         self.host = host
         self.port = port
         self.sample_format = sample_format
+        self.jumbo_frames = jumbo_frames
+        self.cpu_affinity = cpu_affinity
+        self.rt_priority = rt_priority
+        self._sched_policy: str = "default"
 
         buf_frames = int(sample_rate * buffer_seconds)
-        self._buffer: collections.deque = collections.deque(maxlen=buf_frames)
+        self._buffer = RingBuffer(buf_frames, self.CHANNELS)
         self._sock: Optional[socket.socket] = None
         self._recv_thread: Optional[threading.Thread] = None
+        # The receive thread blocks in select() on the UDP socket and the
+        # read end of this pair; stop() writes one byte to wake it.
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wake_r: Optional[socket.socket] = None
+        self._wake_w: Optional[socket.socket] = None
         self._last_seq: int = -1
         self._dropped_packets: int = 0
+        # Receive scratch, allocated once in connect() and reused for
+        # every datagram so the realtime thread never allocates per packet.
+        self._rxbuf: Optional[bytearray] = None
+        self._rxview: Optional[memoryview] = None
 
     # ------------------------------------------------------------------
     def connect(self) -> None:
+        self._rxbuf = bytearray(self.MAX_DATAGRAM)
+        self._rxview = memoryview(self._rxbuf)
         self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if self.jumbo_frames:
+            # The default receive buffer (~200 KB on Linux) only holds a
+            # couple of dozen jumbo datagrams once per-packet overhead is
+            # counted.  The kernel may clamp this to net.core.rmem_max.
+            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF,
+                                  self.JUMBO_RCVBUF)
         self._sock.bind((self.host, self.port))
-        self._sock.settimeout(1.0)
+        self._sock.setblocking(False)
+
+        # socketpair rather than os.pipe: select() on Windows only
+        # accepts sockets
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._sock, selectors.EVENT_READ)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
         self.is_running = True
 
         self._recv_thread = threading.Thread(target=self._recv_loop,
@@ -73,75 +139,127 @@ class SixteenMEMSSource(AudioSource):
         self._recv_thread.start()
         print(f"[SixteenMEMSSource] Listening on {self.host}:{self.port}")
 
-    def _recv_loop(self) -> None:
-        while self.is_running:
+    def _tune_recv_thread(self) -> None:
+        """
+        Pin the calling (receive) thread and raise its priority so other
+        CPU-bound work in the process cannot starve it long enough for
+        the kernel UDP queue to overflow.  Every step is best-effort.
+        """
+        # pid 0 = the calling thread for these Linux scheduler calls
+        if self.cpu_affinity and hasattr(os, "sched_setaffinity"):
             try:
-                data, addr = self._sock.recvfrom(65535)
-                frames = self._decode_packet(data)
+                os.sched_setaffinity(0, self.cpu_affinity)
+            except OSError as e:
+                rt_logger.warning("[SixteenMEMSSource] ⚠ cannot pin to CPUs "
+                                  "%s: %s", sorted(self.cpu_affinity), e)
+
+        if self.rt_priority is None or not hasattr(os, "sched_setscheduler"):
+            return
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO,
+                                  os.sched_param(self.rt_priority))
+            self._sched_policy = f"SCHED_FIFO:{self.rt_priority}"
+            return
+        except (OSError, ValueError) as e:
+            rt_logger.warning("[SixteenMEMSSource] ⚠ SCHED_FIFO unavailable "
+                              "(%s); falling back to nice -10", e)
+        try:
+            os.setpriority(os.PRIO_PROCESS, 0, -10)
+            self._sched_policy = "nice:-10"
+        except OSError as e:
+            rt_logger.warning("[SixteenMEMSSource] ⚠ cannot raise priority: %s",
+                              e)
+
+    def _recv_loop(self) -> None:
+        self._tune_recv_thread()
+        sock, wake_r = self._sock, self._wake_r
+        while True:
+            for key, _ in self._selector.select():
+                if key.fileobj is wake_r:
+                    return  # stop() requested shutdown
+
+            # Drain every queued datagram before going back to select()
+            while True:
+                try:
+                    nbytes, addr = sock.recvfrom_into(self._rxbuf)
+                except BlockingIOError:
+                    break  # socket drained
+                except OSError as e:
+                    rt_logger.error("[SixteenMEMSSource] ✖ receive failed: %s",
+                                    e)
+                    return
+                frames = self._decode_packet(self._rxview[:nbytes])
                 if frames is not None:
-                    for frame in frames:
-                        self._buffer.append(frame)
-            except socket.timeout:
-                continue
-            except OSError:
-                break
-
-    def _decode_packet(self, raw: bytes) -> Optional[np.ndarray]:
-        """Decode a single UDP datagram into (N, 16) float32 array."""
-        if len(raw) < self.HEADER_SIZE:
+                    # int16 is scaled straight into the ring slice
+                    scale = _INT16_SCALE if frames.dtype == np.int16 else None
+                    self._buffer.write(frames, scale)
+                    self._publish(frames, scale)
+
+    def _decode_packet(self, raw: Union[bytes, memoryview]
+                       ) -> Optional[np.ndarray]:
+        """
+        Decode a single UDP datagram into an (N, 16) frame array.
+
+        Returns raw int16 frames or normalised float32 frames.  The
+        result may be a zero-copy view of ``raw`` – which is the shared
+        receive scratch – so it is only valid until the next
+        ``recvfrom_into``; the receive loop copies it into the ring
+        buffer straight away.
+        """
+        # Slice views only – no bytes copies for the header or payload
+        mv = memoryview(raw)
+        if mv.nbytes < self.HEADER_SIZE:
             return None
 
-        seq, n_samples = struct.unpack("<II", raw[:self.HEADER_SIZE])
+        seq, n_samples = self._HDR.unpack_from(mv, 0)
 
         # Packet-loss detection
         if self._last_seq >= 0 and seq != self._last_seq + 1:
             gap = seq - self._last_seq - 1
             self._dropped_packets += gap
-            print(f"[SixteenMEMSSource] ⚠ {gap} packet(s) dropped "
-                  f"(total: {self._dropped_packets})")
+            rt_logger.warning("[SixteenMEMSSource] ⚠ %d packet(s) dropped "
+                              "(total: %d)", gap, self._dropped_packets)
         self._last_seq = seq
 
-        payload = raw[self.HEADER_SIZE:]
-        if self.sample_format == "int16":
-            samples = np.frombuffer(payload, dtype=np.int16)
-            samples = samples.astype(np.float32) / 32768.0
-        else:
-            samples = np.frombuffer(payload, dtype=np.float32)
-
-        # Reshape to (n_frames, 16)
-        n_frames = len(samples) // self.CHANNELS
+        payload = mv[self.HEADER_SIZE:]
+        frame_dt = _FRAME_I16 if self.sample_format == "int16" else _FRAME_F32
+        n_frames = payload.nbytes // frame_dt.itemsize
         if n_frames == 0:
             return None
-        return samples[:n_frames * self.CHANNELS].reshape(n_frames,
-                                                          self.CHANNELS)
+        # (n_frames, 16) view of the payload; a trailing partial frame
+        # is ignored
+        return np.frombuffer(payload, dtype=frame_dt, count=n_frames)
 
     # ------------------------------------------------------------------
     def read_chunk(self, frames: int = 1024) -> np.ndarray:
         if not self.is_running:
             raise RuntimeError("Source not connected. Call connect() first.")
 
-        available = len(self._buffer)
-        n = min(frames, available)
-        if n == 0:
-            return np.zeros((frames, self.CHANNELS), dtype=np.float32)
-
-        out = np.array([self._buffer.popleft() for _ in range(n)])
-        # If we got fewer frames than requested, zero-pad
-        if out.shape[0] < frames:
-            pad = np.zeros((frames - out.shape[0], self.CHANNELS),
-                           dtype=np.float32)
-            out = np.vstack([out, pad])
+        # If fewer frames are buffered than requested, the tail stays
+        # zero-padded
+        out = np.zeros((frames, self.CHANNELS), dtype=np.float32)
+        self._buffer.read_into(out)
         return out
 
     def stop(self) -> None:
         self.is_running = False
-        if self._sock is not None:
-            self._sock.close()
-            self._sock = None
+        self._end_streams()
+        if self._wake_w is not None:
+            self._wake_w.send(b"\0")
         if self._recv_thread is not None:
             self._recv_thread.join(timeout=2)
             self._recv_thread = None
 
+        # Only tear down the sockets once the thread has left select()
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        for attr in ("_sock", "_wake_r", "_wake_w"):
+            sock = getattr(self, attr)
+            if sock is not None:
+                sock.close()
+                setattr(self, attr, None)
+
     def get_info(self) -> Dict[str, Any]:
         return {
             "type": "16mems_orange_pi",
@@ -152,4 +270,6 @@ class SixteenMEMSSource(AudioSource):
             "buffer_len": len(self._buffer),
             "dropped_packets": self._dropped_packets,
             "sample_format": self.sample_format,
+            "jumbo_frames": self.jumbo_frames,
+            "recv_thread_sched": self._sched_policy,
         }
@@ -21,21 +21,33 @@ ARCHITECTURE NOTE:
 import os
 import io
 import json
+import asyncio
+import errno
 import base64
+import hashlib
 import tempfile
 import uuid
 import logging
-from typing import Optional, List
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from queue import Queue, Empty, Full
+from typing import Optional, List, Dict, Tuple
 from pathlib import Path
 
 import numpy as np
 import librosa
+import orjson
+import soundfile as sf
 import matplotlib
 matplotlib.use("Agg")          # non-interactive backend for headless
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
 
-from fastapi import APIRouter, UploadFile, File, Form, WebSocket, WebSocketDisconnect
-from fastapi.responses import JSONResponse
+from fastapi import (APIRouter, UploadFile, File, Form, Request, WebSocket,
+                     WebSocketDisconnect)
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
 
 # ---- internal imports ------------------------------------------------
@@ -43,17 +55,16 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from M2_processing.dataset_preparation.feature_extraction import (
-    extract_features, FeatureConfig
+    extract_features, FeatureConfig, list_feature_files, load_feature_file
 )
+from M2_processing.audio_io import load_audio, write_audio
 from M2_processing.doa import estimate_doa, gcc_phat, estimate_doa_array
 from acquisitions.hal.hydrophone import HydrophoneSource
 
 # Doppler & frequency-band analysis (new)
-from doppler.doppler import (
-    calculate_velocity as doppler_velocity,
-    full_doppler_analysis,
-)
+from doppler.doppler import full_doppler_analysis
 from M2_processing.frequency_filter import (
+    DEFAULT_BANDS,
     frequency_band_energy,
     hybrid_classify,
 )
@@ -64,11 +75,13 @@ from M2_processing.dataset_preparation.metadata_based_class_creation import (
 # Filtering & augmentation
 from M2_processing.augmentation.filtering_augmentation import (
     filter_dataset, augment_dataset, FilterConfig, AugmentConfig,
+    _noise_inject_file, _time_stretch_file,
 )
 # Individual augmentation modules (called by frontend augmentationService.ts)
 from M2_processing.augmentation.adjust_pitch import (
     adjust_pitch_and_volume as pitch_shift_files,
     process_all_files as pitch_shift_batch,
+    reduce_strong_noise,
 )
 from M2_processing.augmentation.adjust_volume import (
     adjust_volume as volume_adjust_file,
@@ -105,6 +118,129 @@ os.makedirs(DATA_DIR, exist_ok=True)
 
 router = APIRouter()
 
+UPLOAD_CHUNK = 1 << 20  # bytes per read when spooling uploads to disk
+
+
+async def _spool_upload(file: UploadFile, suffix: str = ".wav") -> str:
+    """
+    Copy an upload to a named temp file in ``UPLOAD_CHUNK`` pieces.
+
+    Peak memory stays at one chunk instead of the whole file.  The
+    caller owns the returned path and must ``os.unlink`` it.
+    """
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+        while True:
+            chunk = await file.read(UPLOAD_CHUNK)
+            if not chunk:
+                break
+            tmp.write(chunk)
+        return tmp.name
+
+
+def _figure_png(fig: Figure) -> bytes:
+    """
+    Render ``fig`` once on an Agg canvas and return palette-PNG bytes.
+
+    Unlike ``savefig(bbox_inches="tight")`` this draws a single time, and
+    the 256-colour palette PNG is several times smaller than RGBA –
+    plots here use only a handful of colours.
+    """
+    canvas = fig.canvas
+    if not isinstance(canvas, FigureCanvasAgg):
+        canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+    w, h = canvas.get_width_height()
+    img = Image.frombuffer("RGBA", (w, h), canvas.buffer_rgba(),
+                           "raw", "RGBA", 0, 1).convert("RGB").quantize(256)
+    out = io.BytesIO()
+    img.save(out, "PNG")
+    return out.getvalue()
+
+
+def _wants_png(request: Request) -> bool:
+    """
+    True if the client asked for the raw image (``Accept: image/png``).
+
+    Plot endpoints then return the PNG bytes directly – no Base64 (+33 %)
+    and no JSON wrapper; everything else gets the JSON form.
+    """
+    return "image/png" in request.headers.get("accept", "")
+
+
+# Bar colours for the band-energy plot, precomputed for the default bands
+_BAND_COLORS = matplotlib.colormaps["viridis"](
+    np.linspace(0.2, 0.8, len(DEFAULT_BANDS)))
+
+
+# Idle figures per plot layout.  Reusing a Figure keeps its Agg buffer,
+# axes and layout instead of rebuilding them on every request.
+_FIG_POOL: Dict[str, Queue] = {
+    "doppler": Queue(maxsize=4),
+    "spec": Queue(maxsize=4),
+    "wave": Queue(maxsize=4),
+}
+
+
+@contextmanager
+def _borrow_fig(kind: str, figsize: Tuple[float, float], dpi: int):
+    """
+    Lend a Figure for ``kind`` from the pool (or create one).
+
+    A reused figure keeps the axes it was built with – callers create
+    them only when ``fig.axes`` is empty.  Axes are cleared on return.
+    """
+    pool = _FIG_POOL[kind]
+    try:
+        fig = pool.get_nowait()
+    except Empty:
+        fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(fig)
+    try:
+        yield fig
+    finally:
+        for ax in fig.axes:
+            ax.cla()
+        try:
+            pool.put_nowait(fig)
+        except Full:
+            pass
+
+
+# Containers libsndfile may not decode – these still go via a temp file
+# so librosa can hand them to audioread/ffmpeg.
+_TEMPFILE_SUFFIXES = {".mp3", ".m4a", ".aac", ".mp4", ".wma"}
+
+
+async def _upload_source(file: UploadFile):
+    """
+    Return something ``librosa.load`` can open for this upload.
+
+    WAV/FLAC/OGG come back as the upload's own spooled file object,
+    rewound – soundfile reads it in place, so the body is never copied
+    into a ``bytes`` object.  Other containers are spooled to a named
+    temp file and its path is returned – the caller must ``os.unlink``
+    a ``str`` result.
+    """
+    suffix = Path(file.filename or "").suffix.lower()
+    if suffix in _TEMPFILE_SUFFIXES:
+        return await _spool_upload(file, suffix=suffix)
+    await file.seek(0)
+    return file.file
+
+
+async def _load_upload(file: UploadFile, sr: Optional[int] = None):
+    """
+    Decode an upload to mono float32 ``(audio, sr)``.
+
+    ``sr=None`` keeps the native rate.
+    """
+    source = await _upload_source(file)
+    try:
+        return load_audio(source, sr=sr)
+    finally:
+        if isinstance(source, str):
+            os.unlink(source)
+
 
 # =====================================================================
 #  Schemas
@@ -129,7 +265,7 @@ class FeatureConfigRequest(BaseModel):
 
 class TrainRequest(BaseModel):
     data_path: str
-    model_type: str = "random_forest"  # random_forest | svm | knn
+    model_type: str = "random_forest"  # random_forest | svm | knn | hgbt
     feature_config: FeatureConfigRequest = FeatureConfigRequest()
     test_split: float = 0.2
     normalize: bool = True
@@ -210,18 +346,17 @@ async def api_extract_features(
     cfg_dict = json.loads(config_json)
     cfg = FeatureConfig(**cfg_dict)
 
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp.write(await file.read())
-        tmp_path = tmp.name
-
+    # Decode once; extract_features takes the (audio, sr) pair directly
     try:
-        features = extract_features(tmp_path, config=cfg)
-        if features is None:
-            return JSONResponse(status_code=400,
-                                content={"error": "Feature extraction failed"})
-        return {"features": features.tolist(), "length": len(features)}
-    finally:
-        os.unlink(tmp_path)
+        audio, sr = await _load_upload(file)
+    except Exception as e:
+        return JSONResponse(status_code=400,
+                            content={"error": f"Could not decode audio: {e}"})
+    features = extract_features((audio, sr), config=cfg)
+    if features is None:
+        return JSONResponse(status_code=400,
+                            content={"error": "Feature extraction failed"})
+    return {"features": features.tolist(), "length": len(features)}
 
 
 # =====================================================================
@@ -238,30 +373,35 @@ async def api_doa(
     """
     Estimate Direction of Arrival from a multi-channel audio file.
     """
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp.write(await file.read())
-        tmp_path = tmp.name
-
+    # WAV/FLAC/OGG decode straight from the upload; other containers go
+    # through a temp file and load_audio's librosa fallback.
+    source = await _upload_source(file)
     try:
-        audio, sr = librosa.load(tmp_path, sr=None, mono=False)
-        if audio.ndim == 1:
-            return JSONResponse(status_code=400,
-                                content={"error": "Need multi-channel audio"})
+        audio, sr = load_audio(source, mono=False)
+    except Exception as e:
+        return JSONResponse(status_code=400,
+                            content={"error": f"Could not decode audio: {e}"})
+    finally:
+        if isinstance(source, str):
+            os.unlink(source)
+    if audio.ndim == 1 or audio.shape[1] == 1:
+        return JSONResponse(status_code=400,
+                            content={"error": "Need multi-channel audio"})
 
-        sig1 = audio[channel_a]
-        sig2 = audio[channel_b]
+    # (channels, samples), each channel contiguous for the FFTs in gcc_phat
+    audio = np.ascontiguousarray(audio.T)
+    sig1 = audio[channel_a]
+    sig2 = audio[channel_b]
 
-        angle = estimate_doa(sig1, sig2, sr, mic_distance, speed_of_sound)
-        tau, cc = gcc_phat(sig1, sig2, sr, max_tau=mic_distance / speed_of_sound)
+    angle = estimate_doa(sig1, sig2, sr, mic_distance, speed_of_sound)
+    tau, cc = gcc_phat(sig1, sig2, sr, max_tau=mic_distance / speed_of_sound)
 
-        return {
-            "angle_deg": angle,
-            "tdoa_seconds": tau,
-            "sample_rate": sr,
-            "channels_used": [channel_a, channel_b],
-        }
-    finally:
-        os.unlink(tmp_path)
+    return {
+        "angle_deg": angle,
+        "tdoa_seconds": tau,
+        "sample_rate": sr,
+        "channels_used": [channel_a, channel_b],
+    }
 
 
 # =====================================================================
@@ -293,23 +433,29 @@ async def api_doppler_analysis(
     cfg = json.loads(config_json)
     req = DopplerRequest(**cfg)
 
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp.write(await file.read())
-        tmp_path = tmp.name
-
+    analyse = partial(
+        full_doppler_analysis,
+        source_frequency=req.source_frequency_hz,
+        speed_of_sound=req.speed_of_sound,
+        distance_m=req.distance_m,
+        frame_length_s=req.frame_length_s,
+        hop_length_s=req.hop_length_s,
+    )
+    # Read the upload block by block rather than decoding it whole – long
+    # recordings stay at bounded memory.
+    source = await _upload_source(file)
     try:
-        audio, sr = librosa.load(tmp_path, sr=None)
-        result = full_doppler_analysis(
-            audio, sr,
-            source_frequency=req.source_frequency_hz,
-            speed_of_sound=req.speed_of_sound,
-            distance_m=req.distance_m,
-            frame_length_s=req.frame_length_s,
-            hop_length_s=req.hop_length_s,
-        )
-        return result
+        try:
+            return await asyncio.to_thread(analyse, source, None)
+        except RuntimeError:
+            # libsndfile can't decode this container – decode in full
+            if hasattr(source, "seek"):
+                source.seek(0)
+            audio, sr = load_audio(source)
+            return await asyncio.to_thread(analyse, audio, sr)
     finally:
-        os.unlink(tmp_path)
+        if isinstance(source, str):
+            os.unlink(source)
 
 
 # =====================================================================
@@ -321,16 +467,9 @@ async def api_frequency_bands(file: UploadFile = File(...)):
     Compute normalised energy per frequency band for a single audio file.
     Useful for understanding the spectral signature before classification.
     """
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp.write(await file.read())
-        tmp_path = tmp.name
-
-    try:
-        audio, sr = librosa.load(tmp_path, sr=None)
-        bands = frequency_band_energy(audio, sr)
-        return {"bands": bands, "sample_rate": sr}
-    finally:
-        os.unlink(tmp_path)
+    audio, sr = await _load_upload(file)
+    bands = frequency_band_energy(audio, sr)
+    return {"bands": bands, "sample_rate": sr}
 
 
 # =====================================================================
@@ -353,30 +492,23 @@ async def api_hybrid_classify(
     cfg = json.loads(config_json)
     doppler_cfg = DopplerRequest(**cfg)
 
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp.write(await file.read())
-        tmp_path = tmp.name
+    audio, sr = await _load_upload(file)
 
-    try:
-        audio, sr = librosa.load(tmp_path, sr=None)
-
-        # Run Doppler analysis to get motion context
-        doppler_result = full_doppler_analysis(
-            audio, sr,
-            source_frequency=doppler_cfg.source_frequency_hz,
-            speed_of_sound=doppler_cfg.speed_of_sound,
-            distance_m=doppler_cfg.distance_m,
-        )
+    # Run Doppler analysis to get motion context
+    doppler_result = full_doppler_analysis(
+        audio, sr,
+        source_frequency=doppler_cfg.source_frequency_hz,
+        speed_of_sound=doppler_cfg.speed_of_sound,
+        distance_m=doppler_cfg.distance_m,
+    )
 
-        # Hybrid classification using frequency bands + Doppler context
-        result = hybrid_classify(
-            audio, sr,
-            doppler_result=doppler_result["summary"],
-        )
-        result["doppler_summary"] = doppler_result["summary"]
-        return result
-    finally:
-        os.unlink(tmp_path)
+    # Hybrid classification using frequency bands + Doppler context
+    result = hybrid_classify(
+        audio, sr,
+        doppler_result=doppler_result["summary"],
+    )
+    result["doppler_summary"] = doppler_result["summary"]
+    return result
 
 
 # =====================================================================
@@ -384,6 +516,7 @@ async def api_hybrid_classify(
 # =====================================================================
 @router.post("/visualize/doppler")
 async def api_doppler_plot(
+    request: Request,
     file: UploadFile = File(...),
     config_json: str = Form("{}"),
 ):
@@ -394,31 +527,32 @@ async def api_doppler_plot(
     3. Frequency-band energy bar chart
 
     Returns a Base64-encoded PNG suitable for direct embedding in
-    an <img> tag on the frontend.
+    an <img> tag on the frontend.  With ``Accept: image/png`` the raw
+    PNG is returned and the summary is sent as JSON in the
+    ``X-Doppler-Summary`` header.
     """
     cfg = json.loads(config_json)
     req = DopplerRequest(**cfg)
 
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp.write(await file.read())
-        tmp_path = tmp.name
-
-    try:
-        audio, sr = librosa.load(tmp_path, sr=None)
+    audio, sr = await _load_upload(file)
 
-        # Doppler analysis
-        doppler = full_doppler_analysis(
-            audio, sr,
-            source_frequency=req.source_frequency_hz,
-            speed_of_sound=req.speed_of_sound,
-            distance_m=req.distance_m,
-        )
+    # Doppler analysis
+    doppler = full_doppler_analysis(
+        audio, sr,
+        source_frequency=req.source_frequency_hz,
+        speed_of_sound=req.speed_of_sound,
+        distance_m=req.distance_m,
+    )
 
-        # Frequency bands
-        bands = frequency_band_energy(audio, sr)
+    # Frequency bands
+    bands = frequency_band_energy(audio, sr)
 
-        # Create figure with 3 subplots
-        fig, axes = plt.subplots(3, 1, figsize=(12, 10))
+    with _borrow_fig("doppler", (12, 10), 120) as fig:
+        if not fig.axes:
+            fig.subplots(3, 1)
+            fig.subplots_adjust(left=0.1, right=0.97, top=0.93, bottom=0.06,
+                                hspace=0.45)
+        axes = fig.axes
         fig.suptitle("Doppler & Frequency Analysis", fontsize=14, fontweight="bold")
 
         # 1. Frequency track
@@ -434,9 +568,9 @@ async def api_doppler_plot(
         # 2. Velocity
         ax2 = axes[1]
         vels = doppler["velocities"]
-        colors = ["#4CAF50" if d == "approaching" else
-                  "#F44336" if d == "receding" else "#9E9E9E"
-                  for d in doppler["directions"]]
+        dirs = np.asarray(doppler["directions"])
+        colors = np.select([dirs == "approaching", dirs == "receding"],
+                           ["#4CAF50", "#F44336"], "#9E9E9E")
         ax2.bar(times, vels, width=req.hop_length_s * 0.8, color=colors, alpha=0.7)
         ax2.axhline(y=0, color="black", linewidth=0.5)
         ax2.set_ylabel("Velocity (m/s)")
@@ -448,25 +582,22 @@ async def api_doppler_plot(
         ax3 = axes[2]
         band_names = [b["name"] for b in bands]
         energies = [b["energy"] for b in bands]
-        bar_colors = plt.cm.viridis(np.linspace(0.2, 0.8, len(bands)))
+        bar_colors = (_BAND_COLORS if len(bands) == len(_BAND_COLORS) else
+                      matplotlib.colormaps["viridis"](np.linspace(0.2, 0.8, len(bands))))
         ax3.barh(band_names, energies, color=bar_colors)
         ax3.set_xlabel("Normalised Energy")
         ax3.set_title("Frequency Band Energy Distribution")
 
-        plt.tight_layout()
+        png = _figure_png(fig)
 
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", bbox_inches="tight", dpi=120)
-        plt.close(fig)
-        buf.seek(0)
-
-        return {
-            "image_base64": base64.b64encode(buf.read()).decode("utf-8"),
-            "content_type": "image/png",
-            "doppler_summary": doppler["summary"],
-        }
-    finally:
-        os.unlink(tmp_path)
+    if _wants_png(request):
+        return Response(content=png, media_type="image/png", headers={
+            "X-Doppler-Summary": json.dumps(doppler["summary"])})
+    return {
+        "image_base64": base64.b64encode(png).decode("utf-8"),
+        "content_type": "image/png",
+        "doppler_summary": doppler["summary"],
+    }
 
 
 # =====================================================================
@@ -485,7 +616,8 @@ async def api_homogenise(req: HomogeniseRequest):
     and copy files into class-organised directories.
     """
     try:
-        counts = homogenise_dataset(
+        counts = await asyncio.to_thread(
+            homogenise_dataset,
             base_path=req.base_path,
             output_path=req.output_path,
             metadata_file=req.metadata_file,
@@ -504,6 +636,46 @@ async def api_homogenise(req: HomogeniseRequest):
 # =====================================================================
 #  Filter + Augment Pipeline (NEW)
 # =====================================================================
+def _run_key(input_dir: str, params: dict) -> str:
+    """
+    Fingerprint a dataset run: the ``input_dir/<class>/<file>`` listing
+    (with size + mtime, so edited files count as changes) plus the
+    request parameters.
+    """
+    entries = []
+    with os.scandir(input_dir) as classes:
+        for cls in classes:
+            if not cls.is_dir():
+                continue
+            with os.scandir(cls.path) as files:
+                for f in files:
+                    if f.is_file():
+                        st = f.stat()
+                        entries.append((cls.name, f.name, st.st_size,
+                                        st.st_mtime_ns))
+    entries.sort()
+    blob = json.dumps({"in": entries, "cfg": params}, sort_keys=True)
+    return hashlib.blake2b(blob.encode(), digest_size=16).hexdigest()
+
+
+def _manifest_path(output_dir: str, key: str) -> str:
+    return os.path.join(output_dir, f".manifest-{key}.json")
+
+
+def _load_manifest(output_dir: str, key: str) -> Optional[dict]:
+    try:
+        with open(_manifest_path(output_dir, key)) as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_manifest(output_dir: str, key: str, result: dict) -> None:
+    os.makedirs(output_dir, exist_ok=True)
+    with open(_manifest_path(output_dir, key), "w") as fh:
+        json.dump(result, fh, default=str)
+
+
 class FilterAugmentRequest(BaseModel):
     input_dir: str = "../../sampled_data"
     filtered_dir: str = "../../sampled_data_filtered"
@@ -519,6 +691,7 @@ class FilterAugmentRequest(BaseModel):
     target_samples_per_class: int = 500
     enable_pitch_shift: bool = True
     enable_noise_injection: bool = True
+    force: bool = False  # re-run even if a matching manifest exists
 
 
 @router.post("/data/filter-augment")
@@ -543,13 +716,26 @@ async def api_filter_augment(req: FilterAugmentRequest):
     )
 
     try:
-        filter_report = filter_dataset(req.input_dir, req.filtered_dir, filt_cfg)
-        augment_report = augment_dataset(req.filtered_dir, req.augmented_dir, aug_cfg)
-        return {
+        # LOGIC NOTE: re-running with the same inputs and config would
+        # just rewrite identical files – return the recorded report.
+        key = await asyncio.to_thread(
+            _run_key, req.input_dir, req.dict(exclude={"force"}))
+        if not req.force:
+            cached = _load_manifest(req.augmented_dir, key)
+            if cached is not None:
+                return {**cached, "cached": True}
+
+        filter_report = await asyncio.to_thread(
+            filter_dataset, req.input_dir, req.filtered_dir, filt_cfg)
+        augment_report = await asyncio.to_thread(
+            augment_dataset, req.filtered_dir, req.augmented_dir, aug_cfg)
+        result = {
             "status": "success",
             "filter_report": filter_report,
             "augment_report": augment_report,
         }
+        _save_manifest(req.augmented_dir, key, result)
+        return result
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": str(e)})
 
@@ -595,6 +781,7 @@ class TimeStretchRequest(BaseModel):
     input_dir: str
     output_dir: str
     rates: List[float] = [0.8, 0.9, 1.1, 1.2]
+    backend: str = "librosa"  # librosa | rubberband
 
 class AugPipelineRequest(BaseModel):
     """Run the unified class-balanced augmentation pipeline."""
@@ -605,6 +792,8 @@ class AugPipelineRequest(BaseModel):
     enable_noise_injection: bool = True
     enable_volume_scale: bool = True
     target_samples_per_class: int = 500
+    backend: str = "librosa"  # librosa | rubberband (pitch shift + time stretch)
+    force: bool = False  # re-run even if a matching manifest exists
 
 
 @router.post("/m3-augmentation/pitch-shift")
@@ -612,8 +801,8 @@ async def api_pitch_shift(req: PitchShiftRequest):
     """Apply pitch shifts to all audio files in input_dir."""
     try:
         os.makedirs(req.output_dir, exist_ok=True)
-        pitch_shift_batch(req.input_dir, req.output_dir, req.pitch_changes)
-        count = sum(1 for f in Path(req.output_dir).rglob("*") if f.is_file())
+        count = await asyncio.to_thread(
+            pitch_shift_batch, req.input_dir, req.output_dir, req.pitch_changes)
         return {"status": "success", "output_dir": req.output_dir,
                 "files_created": count}
     except Exception as e:
@@ -625,8 +814,8 @@ async def api_volume_adjust(req: VolumeAdjustRequest):
     """Create volume-adjusted variants (louder + quieter) of all files."""
     try:
         os.makedirs(req.output_dir, exist_ok=True)
-        volume_adjust_batch(req.input_dir, req.output_dir, req.decibel_changes)
-        count = sum(1 for f in Path(req.output_dir).rglob("*") if f.is_file())
+        count = await asyncio.to_thread(
+            volume_adjust_batch, req.input_dir, req.output_dir, req.decibel_changes)
         return {"status": "success", "output_dir": req.output_dir,
                 "files_created": count}
     except Exception as e:
@@ -638,37 +827,68 @@ async def api_reverse_audio(req: ReverseAudioRequest):
     """Create time-reversed copies of all audio files."""
     try:
         os.makedirs(req.output_dir, exist_ok=True)
-        reverse_batch(req.input_dir, req.output_dir)
-        count = sum(1 for f in Path(req.output_dir).rglob("*") if f.is_file())
+        count = await asyncio.to_thread(
+            reverse_batch, req.input_dir, req.output_dir)
         return {"status": "success", "output_dir": req.output_dir,
                 "files_created": count}
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": str(e)})
 
 
+def _iter_files(root: str):
+    """
+    Yield ``DirEntry`` objects for every regular file under ``root``.
+
+    LOGIC NOTE: ``os.scandir`` gets the file type from ``readdir`` itself,
+    so unlike ``Path.rglob`` + ``is_file()`` there is no ``stat`` per entry.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
+def _count_files(root: str) -> int:
+    return sum(1 for _ in _iter_files(root))
+
+
+def _audio_files(input_dir: str) -> List[str]:
+    audio_exts = {".wav", ".mp3", ".flac", ".ogg"}
+    return sorted(e.path for e in _iter_files(input_dir)
+                  if os.path.splitext(e.name)[1].lower() in audio_exts)
+
+
+def _map_audio_files(worker, input_dir: str) -> int:
+    """
+    Run ``worker(path)`` for every audio file under ``input_dir`` on a
+    process pool, summing the returned file counts.  The per-file
+    load → augment → write work is independent, so it scales with the
+    number of cores.  Blocking – call via ``asyncio.to_thread``.
+    """
+    files = _audio_files(input_dir)
+    if not files:
+        return 0
+    n_workers = min(os.cpu_count() or 1, len(files))
+    chunksize = max(1, len(files) // (4 * n_workers))
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        return sum(pool.map(worker, files, chunksize=chunksize))
+
+
 @router.post("/m3-augmentation/noise-injection")
 async def api_noise_inject(req: NoiseInjectionRequest):
     """Inject Gaussian noise at various SNR levels into all audio files."""
     try:
-        from M2_processing.augmentation.filtering_augmentation import _inject_noise
-        import soundfile as sf
-
-        src = Path(req.input_dir)
         dst = Path(req.output_dir)
         dst.mkdir(parents=True, exist_ok=True)
-        created = 0
-        audio_exts = {".wav", ".mp3", ".flac", ".ogg"}
-
-        for f in src.rglob("*"):
-            if f.suffix.lower() not in audio_exts:
-                continue
-            audio, sr = librosa.load(str(f), sr=None)
-            base = f.stem
-            for snr in req.snr_db_levels:
-                aug = _inject_noise(audio, snr)
-                out_name = f"{base}_noise{snr:.0f}dB.wav"
-                sf.write(str(dst / out_name), aug, sr)
-                created += 1
+        created = await asyncio.to_thread(
+            _map_audio_files,
+            partial(_noise_inject_file, dst_dir=str(dst),
+                    snr_levels=req.snr_db_levels),
+            req.input_dir)
 
         return {"status": "success", "output_dir": req.output_dir,
                 "files_created": created}
@@ -680,25 +900,13 @@ async def api_noise_inject(req: NoiseInjectionRequest):
 async def api_time_stretch(req: TimeStretchRequest):
     """Time-stretch all audio files at given rate factors."""
     try:
-        from M2_processing.augmentation.filtering_augmentation import _time_stretch
-        import soundfile as sf
-
-        src = Path(req.input_dir)
         dst = Path(req.output_dir)
         dst.mkdir(parents=True, exist_ok=True)
-        created = 0
-        audio_exts = {".wav", ".mp3", ".flac", ".ogg"}
-
-        for f in src.rglob("*"):
-            if f.suffix.lower() not in audio_exts:
-                continue
-            audio, sr = librosa.load(str(f), sr=None)
-            base = f.stem
-            for rate in req.rates:
-                aug = _time_stretch(audio, rate)
-                out_name = f"{base}_ts{rate:.1f}.wav"
-                sf.write(str(dst / out_name), aug, sr)
-                created += 1
+        created = await asyncio.to_thread(
+            _map_audio_files,
+            partial(_time_stretch_file, dst_dir=str(dst), rates=req.rates,
+                    backend=req.backend),
+            req.input_dir)
 
         return {"status": "success", "output_dir": req.output_dir,
                 "files_created": created}
@@ -720,9 +928,20 @@ async def api_augmentation_pipeline(req: AugPipelineRequest):
             enable_noise_injection=req.enable_noise_injection,
             enable_volume_scale=req.enable_volume_scale,
             target_samples_per_class=req.target_samples_per_class,
+            backend=req.backend,
         )
-        report = augment_dataset(req.input_dir, req.output_dir, aug_cfg)
-        return {"status": "success", "augmentation_report": report}
+        key = await asyncio.to_thread(
+            _run_key, req.input_dir, req.dict(exclude={"force"}))
+        if not req.force:
+            cached = _load_manifest(req.output_dir, key)
+            if cached is not None:
+                return {**cached, "cached": True}
+
+        report = await asyncio.to_thread(
+            augment_dataset, req.input_dir, req.output_dir, aug_cfg)
+        result = {"status": "success", "augmentation_report": report}
+        _save_manifest(req.output_dir, key, result)
+        return result
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": str(e)})
 
@@ -749,62 +968,106 @@ async def api_list_chunks(req: ListChunksRequest):
     Returns a flat list of {path, filename, class_name} objects.
     Used by the ManualFilter frontend component.
     """
-    import glob
-
     source = Path(req.source_dir)
     if not source.is_dir():
         return JSONResponse(status_code=400,
                             content={"error": f"Directory not found: {req.source_dir}"})
 
-    audio_exts = {".wav", ".mp3", ".flac", ".ogg", ".m4a"}
-    files = []
-
-    # Scan subdirectories (each subfolder = class name)
-    for class_dir in sorted(source.iterdir()):
-        if class_dir.is_dir():
-            for f in sorted(class_dir.iterdir()):
-                if f.suffix.lower() in audio_exts:
-                    files.append({
-                        "path": str(f),
-                        "filename": f.name,
-                        "class_name": class_dir.name,
-                    })
-
-    # Also scan top-level files (unclassified)
-    for f in sorted(source.iterdir()):
-        if f.is_file() and f.suffix.lower() in audio_exts:
-            files.append({
-                "path": str(f),
-                "filename": f.name,
-                "class_name": "unclassified",
-            })
+    # Extensions without the dot – matched against rpartition(".")[2]
+    audio_exts = {"wav", "mp3", "flac", "ogg", "m4a"}
+    classified, unclassified = [], []
+
+    # One scandir pass: subfolders are classes, top-level files are
+    # unclassified.  DirEntry type flags come from the dirent, so no
+    # per-entry stat() on most filesystems.
+    with os.scandir(str(source)) as top:
+        for entry in top:
+            if entry.is_dir(follow_symlinks=False):
+                with os.scandir(entry.path) as inner:
+                    for f in inner:
+                        if f.name.rpartition(".")[2].lower() in audio_exts:
+                            classified.append({
+                                "path": f.path,
+                                "filename": f.name,
+                                "class_name": entry.name,
+                            })
+            elif (entry.is_file(follow_symlinks=False)
+                  and entry.name.rpartition(".")[2].lower() in audio_exts):
+                unclassified.append({
+                    "path": entry.path,
+                    "filename": entry.name,
+                    "class_name": "unclassified",
+                })
+
+    classified.sort(key=lambda d: (d["class_name"], d["filename"]))
+    unclassified.sort(key=lambda d: d["filename"])
+    files = classified + unclassified
 
     return {"files": files, "total": len(files)}
 
 
+# copy_file_range errors that mean "not supported here", not "bad file"
+_COPY_RANGE_UNSUPPORTED = {errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP}
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """
+    Copy ``src`` → ``dst`` in the kernel, keeping metadata like copy2.
+
+    ``shutil.copy2`` already uses ``sendfile`` on Linux; ``copy_file_range``
+    additionally lets the filesystem share extents (reflink on btrfs /
+    XFS, server-side copy on NFS) instead of moving the bytes at all.
+    Falls back to ``shutil.copy2`` where it is unavailable.
+
+    The source is opened first – a missing source raises before
+    anything is created – and ``dst``'s directory is only made once it
+    is open.
+    """
+    import shutil
+
+    with open(src, "rb") as fi:
+        os.makedirs(os.path.dirname(dst) or ".", exist_ok=True)
+        if hasattr(os, "copy_file_range"):
+            try:
+                with open(dst, "wb") as fo:
+                    remaining = os.fstat(fi.fileno()).st_size
+                    while remaining > 0:
+                        n = os.copy_file_range(fi.fileno(), fo.fileno(), remaining)
+                        if n == 0:
+                            break
+                        remaining -= n
+                if not remaining:
+                    shutil.copystat(src, dst)
+                    return
+            except OSError as e:
+                # e.g. EXDEV on older kernels, or a filesystem without support
+                if e.errno not in _COPY_RANGE_UNSUPPORTED:
+                    raise
+    shutil.copy2(src, dst)
+
+
 @router.post("/data/keep-chunk")
 async def api_keep_chunk(req: KeepChunkRequest):
     """
     Keep an audio chunk: copy it from the source path to the
     destination directory, preserving class structure.
     """
-    import shutil
-
     src = Path(req.source_path)
-    if not src.is_file():
-        return JSONResponse(status_code=404,
-                            content={"error": f"File not found: {req.source_path}"})
-
     dest_base = Path(req.dest_dir)
     if req.class_name:
         dest_dir = dest_base / req.class_name
     else:
         dest_dir = dest_base
 
-    dest_dir.mkdir(parents=True, exist_ok=True)
     dest_path = dest_dir / src.name
 
-    shutil.copy2(str(src), str(dest_path))
+    # No separate is_file() check – opening the source is the check, and
+    # _fast_copy only creates dest_dir once the source is open.
+    try:
+        _fast_copy(str(src), str(dest_path))
+    except (FileNotFoundError, IsADirectoryError):
+        return JSONResponse(status_code=404,
+                            content={"error": f"File not found: {req.source_path}"})
     return {"status": "kept", "destination": str(dest_path)}
 
 
@@ -813,12 +1076,13 @@ async def api_delete_chunk(req: DeleteChunkRequest):
     """
     Delete an audio chunk permanently.
     """
-    fp = Path(req.file_path)
-    if not fp.is_file():
+    # Attempt the unlink and map failures, rather than stat-then-unlink
+    # (one syscall, and no race if the file vanishes in between)
+    try:
+        os.unlink(req.file_path)
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
         return JSONResponse(status_code=404,
                             content={"error": f"File not found: {req.file_path}"})
-
-    fp.unlink()
     return {"status": "deleted", "file": req.file_path}
 
 
@@ -827,65 +1091,62 @@ async def api_delete_chunk(req: DeleteChunkRequest):
 # =====================================================================
 @router.post("/visualize/spectrogram")
 async def api_spectrogram(
+    request: Request,
     file: UploadFile = File(...),
     n_fft: int = Form(2048),
     hop_length: int = Form(512),
 ):
-    """Return a Mel spectrogram as a Base64-encoded PNG image."""
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp.write(await file.read())
-        tmp_path = tmp.name
-
-    try:
-        audio, sr = librosa.load(tmp_path, sr=None)
-        S = librosa.feature.melspectrogram(y=audio, sr=sr,
-                                           n_fft=n_fft,
-                                           hop_length=hop_length)
-        S_dB = librosa.power_to_db(S, ref=np.max)
-
-        fig, ax = plt.subplots(figsize=(10, 4))
+    """Return a Mel spectrogram as a Base64-encoded PNG (raw PNG with ``Accept: image/png``)."""
+    audio, sr = await _load_upload(file)
+
+    S = librosa.feature.melspectrogram(y=audio, sr=sr,
+                                       n_fft=n_fft,
+                                       hop_length=hop_length)
+    S_dB = librosa.power_to_db(S, ref=np.max)
+
+    with _borrow_fig("spec", (10, 4), 100) as fig:
+        if not fig.axes:
+            fig.subplots()
+            fig.subplots_adjust(left=0.08, right=1.0, top=0.9, bottom=0.13)
+        ax = fig.axes[0]
         img = librosa.display.specshow(S_dB, sr=sr, hop_length=hop_length,
                                         x_axis="time", y_axis="mel", ax=ax)
-        fig.colorbar(img, ax=ax, format="%+2.0f dB")
+        if len(fig.axes) == 1:
+            fig.colorbar(img, ax=ax, format="%+2.0f dB")
+        else:
+            # colorbar axes from a previous use – draw into it, don't steal again
+            fig.colorbar(img, cax=fig.axes[1], format="%+2.0f dB")
         ax.set_title("Mel Spectrogram")
+        png = _figure_png(fig)
 
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", bbox_inches="tight", dpi=100)
-        plt.close(fig)
-        buf.seek(0)
-
-        return {
-            "image_base64": base64.b64encode(buf.read()).decode("utf-8"),
-            "content_type": "image/png",
-        }
-    finally:
-        os.unlink(tmp_path)
+    if _wants_png(request):
+        return Response(content=png, media_type="image/png")
+    return {
+        "image_base64": base64.b64encode(png).decode("utf-8"),
+        "content_type": "image/png",
+    }
 
 
 @router.post("/visualize/waveform")
-async def api_waveform(file: UploadFile = File(...)):
-    """Return a waveform plot as a Base64-encoded PNG image."""
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp.write(await file.read())
-        tmp_path = tmp.name
-
-    try:
-        audio, sr = librosa.load(tmp_path, sr=None)
-        fig, ax = plt.subplots(figsize=(10, 3))
+async def api_waveform(request: Request, file: UploadFile = File(...)):
+    """Return a waveform plot as a Base64-encoded PNG (raw PNG with ``Accept: image/png``)."""
+    audio, sr = await _load_upload(file)
+
+    with _borrow_fig("wave", (10, 3), 100) as fig:
+        if not fig.axes:
+            fig.subplots()
+            fig.subplots_adjust(left=0.07, right=0.98, top=0.88, bottom=0.16)
+        ax = fig.axes[0]
         librosa.display.waveshow(audio, sr=sr, ax=ax)
         ax.set_title("Waveform")
+        png = _figure_png(fig)
 
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", bbox_inches="tight", dpi=100)
-        plt.close(fig)
-        buf.seek(0)
-
-        return {
-            "image_base64": base64.b64encode(buf.read()).decode("utf-8"),
-            "content_type": "image/png",
-        }
-    finally:
-        os.unlink(tmp_path)
+    if _wants_png(request):
+        return Response(content=png, media_type="image/png")
+    return {
+        "image_base64": base64.b64encode(png).decode("utf-8"),
+        "content_type": "image/png",
+    }
 
 
 # =====================================================================
@@ -896,10 +1157,15 @@ async def api_train_model(req: TrainRequest):
     """
     Train a scikit-learn model on pre-extracted features.
     """
-    import pickle
+    # Loading + fitting is blocking; keep the event loop free meanwhile.
+    return await asyncio.to_thread(_do_train, req)
+
+
+def _do_train(req: TrainRequest) -> dict:
     from sklearn.model_selection import train_test_split
     from sklearn.preprocessing import StandardScaler
-    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.ensemble import (RandomForestClassifier,
+                                  HistGradientBoostingClassifier)
     from sklearn.svm import SVC
     from sklearn.neighbors import KNeighborsClassifier
     from sklearn.metrics import accuracy_score, classification_report
@@ -909,34 +1175,51 @@ async def api_train_model(req: TrainRequest):
 
     # Load pre-extracted features
     feature_dir = os.path.join(data_path, "features")
-    X, y = [], []
-    for pkl_file in os.listdir(feature_dir):
-        if pkl_file.endswith(".pkl"):
-            label = os.path.splitext(pkl_file)[0]
-            with open(os.path.join(feature_dir, pkl_file), "rb") as f:
-                feats = pickle.load(f)
-            X.extend(feats)
-            y.extend([label] * len(feats))
-
-    X = np.array(X)
-    y = np.array(y)
+    per_class = []
+    for label, path in list_feature_files(feature_dir).items():
+        feats = load_feature_file(path)
+        if len(feats):
+            per_class.append((label, feats))
+
+    # One float32 matrix filled class by class – no list-of-rows copy,
+    # and float32 halves the memory traffic for the scaler / classifier.
+    counts = [len(feats) for _, feats in per_class]
+    X = np.empty((sum(counts), per_class[0][1].shape[1]), dtype=np.float32)
+    offset = 0
+    for (_, feats), n in zip(per_class, counts):
+        X[offset:offset + n] = feats
+        offset += n
+    y = np.repeat([label for label, _ in per_class], counts)
 
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=req.test_split, random_state=42, stratify=y
     )
 
     if req.normalize:
-        scaler = StandardScaler()
-        X_train = scaler.fit_transform(X_train)
-        X_test = scaler.transform(X_test)
+        # Fit on the float32 split, then standardise both splits in
+        # place – fit_transform/transform would each allocate a float64
+        # copy of the matrix.
+        scaler = StandardScaler(copy=False)
+        scaler.fit(X_train)
+        mean = scaler.mean_.astype(np.float32)
+        scale = scaler.scale_.astype(np.float32)
+        for split in (X_train, X_test):
+            np.subtract(split, mean, out=split)
+            np.divide(split, scale, out=split)
 
     # Select classifier
     if req.model_type == "svm":
-        clf = SVC(kernel="rbf", probability=True)
+        # larger kernel cache avoids recomputing kernel rows
+        clf = SVC(kernel="rbf", probability=True, cache_size=1000)
     elif req.model_type == "knn":
-        clf = KNeighborsClassifier(n_neighbors=5)
+        clf = KNeighborsClassifier(n_neighbors=5, n_jobs=-1)
+    elif req.model_type == "hgbt":
+        # Histogram gradient boosting – usually much faster than RF on
+        # dense numeric features, multithreaded via OpenMP
+        clf = HistGradientBoostingClassifier(max_iter=200, random_state=42)
     else:
-        clf = RandomForestClassifier(n_estimators=100, random_state=42)
+        clf = RandomForestClassifier(n_estimators=100, random_state=42,
+                                     n_jobs=-1)
 
     clf.fit(X_train, y_train)
     y_pred = clf.predict(X_test)
@@ -964,55 +1247,102 @@ async def api_train_model(req: TrainRequest):
 # =====================================================================
 #  Classify Audio (preserved from original)
 # =====================================================================
+# path → (mtime, bundle); only the newest model is kept
+_MODEL_CACHE: Dict[str, Tuple[float, dict]] = {}
+_MODEL_LOCK = asyncio.Lock()
+
+
+async def _get_latest_model() -> Optional[dict]:
+    """
+    Return the newest ``model_*.joblib`` bundle, or None if there is none.
+
+    Each call only rescans the model directory; the bundle is unpickled
+    again only when a newer file (or a rewritten one) shows up.  The lock
+    keeps concurrent first requests from all loading the same file.
+    """
+    model_dir = os.path.join(DATA_DIR, "models")
+    newest, newest_mtime = None, -1.0
+    try:
+        with os.scandir(model_dir) as it:
+            for entry in it:
+                if entry.name.startswith("model_") and entry.name.endswith(".joblib"):
+                    mtime = entry.stat().st_mtime
+                    if mtime > newest_mtime:
+                        newest, newest_mtime = entry.path, mtime
+    except FileNotFoundError:
+        return None
+    if newest is None:
+        return None
+
+    async with _MODEL_LOCK:
+        cached = _MODEL_CACHE.get(newest)
+        if cached is not None and cached[0] == newest_mtime:
+            return cached[1]
+        import joblib
+        # Unpickle off the event loop – other requests keep being served
+        # while a new model loads (only model lookups wait on the lock).
+        bundle = await asyncio.to_thread(joblib.load, newest)
+        _MODEL_CACHE.clear()
+        _MODEL_CACHE[newest] = (newest_mtime, bundle)
+        return bundle
+
+
+def _predict_one(clf, X: np.ndarray) -> Tuple[object, float, Dict[str, float]]:
+    """
+    ``(prediction, confidence, class_probabilities)`` for a single-row
+    ``X``.  ``predict_proba`` is evaluated once and reused for both the
+    confidence and the per-class map.
+
+    LOGIC NOTE: the label still comes from ``predict`` – for SVC with
+    ``probability=True`` the Platt-scaled argmax can disagree with it.
+    """
+    prediction = clf.predict(X)[0]
+    if not hasattr(clf, "predict_proba"):
+        return prediction, 1.0, {}
+    probs = clf.predict_proba(X)[0]
+    class_probs = {}
+    if hasattr(clf, "classes_"):
+        class_probs = {str(c): float(p) for c, p in zip(clf.classes_, probs)}
+    return prediction, float(np.max(probs)), class_probs
+
+
 @router.post("/classify-audio/")
 async def classify_audio(
     file: UploadFile = File(...),
     sensor_id: str = Form("default"),
 ):
     """Classify a single audio file using the latest model."""
-    import joblib
-    model_dir = os.path.join(DATA_DIR, "models")
-    if not os.path.exists(model_dir):
+    bundle = await _get_latest_model()
+    if bundle is None:
         return JSONResponse(status_code=400,
                             content={"error": "No trained model found"})
 
-    # Load latest model
-    models = sorted(Path(model_dir).glob("model_*.joblib"))
-    if not models:
-        return JSONResponse(status_code=400,
-                            content={"error": "No trained model found"})
-
-    bundle = joblib.load(models[-1])
     clf = bundle["model"]
     scaler = bundle.get("scaler")
     cfg_dict = bundle.get("config", {})
     cfg = FeatureConfig(**cfg_dict)
 
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp.write(await file.read())
-        tmp_path = tmp.name
-
+    # Decode once; extract_features takes the (audio, sr) pair directly
     try:
-        features = extract_features(tmp_path, config=cfg)
-        if features is None:
-            return JSONResponse(status_code=400,
-                                content={"error": "Feature extraction failed"})
-        X = features.reshape(1, -1)
-        if scaler is not None:
-            X = scaler.transform(X)
-
-        prediction = clf.predict(X)[0]
-        confidence = 1.0
-        if hasattr(clf, "predict_proba"):
-            confidence = float(np.max(clf.predict_proba(X)))
+        audio, sr = await _load_upload(file)
+    except Exception as e:
+        return JSONResponse(status_code=400,
+                            content={"error": f"Could not decode audio: {e}"})
+    features = extract_features((audio, sr), config=cfg)
+    if features is None:
+        return JSONResponse(status_code=400,
+                            content={"error": "Feature extraction failed"})
+    X = features.reshape(1, -1)
+    if scaler is not None:
+        X = scaler.transform(X)
 
-        return {
-            "sensor_id": sensor_id,
-            "prediction": prediction,
-            "confidence": confidence,
-        }
-    finally:
-        os.unlink(tmp_path)
+    prediction, confidence, _ = _predict_one(clf, X)
+
+    return {
+        "sensor_id": sensor_id,
+        "prediction": prediction,
+        "confidence": confidence,
+    }
 
 
 # =====================================================================
@@ -1049,56 +1379,52 @@ async def api_m5_classify(
     M5 application-level audio classification.
     Wraps the classify-audio logic for the applicationService.ts frontend.
     """
-    import joblib as jl
-    model_dir = os.path.join(DATA_DIR, "models")
-    if not os.path.exists(model_dir):
-        return JSONResponse(status_code=400,
-                            content={"error": "No trained model found"})
-    models = sorted(Path(model_dir).glob("model_*.joblib"))
-    if not models:
+    bundle = await _get_latest_model()
+    if bundle is None:
         return JSONResponse(status_code=400,
                             content={"error": "No trained model found"})
 
-    bundle = jl.load(models[-1])
     clf = bundle["model"]
     scaler = bundle.get("scaler")
     cfg_dict = bundle.get("config", {})
     cfg = FeatureConfig(**cfg_dict)
 
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        tmp.write(await file.read())
-        tmp_path = tmp.name
-
+    # Decode once; extract_features takes the (audio, sr) pair directly
     try:
-        features = extract_features(tmp_path, config=cfg)
-        if features is None:
-            return JSONResponse(status_code=400,
-                                content={"error": "Feature extraction failed"})
-        X = features.reshape(1, -1)
-        if scaler is not None:
-            X = scaler.transform(X)
-
-        prediction = clf.predict(X)[0]
-        confidence = 1.0
-        if hasattr(clf, "predict_proba"):
-            confidence = float(np.max(clf.predict_proba(X)))
-
-        # Get all class probabilities if available
-        class_probs = {}
-        if hasattr(clf, "predict_proba") and hasattr(clf, "classes_"):
-            probs = clf.predict_proba(X)[0]
-            class_probs = {str(c): float(p) for c, p in zip(clf.classes_, probs)}
+        audio, sr = await _load_upload(file)
+    except Exception as e:
+        return JSONResponse(status_code=400,
+                            content={"error": f"Could not decode audio: {e}"})
+    features = extract_features((audio, sr), config=cfg)
+    if features is None:
+        return JSONResponse(status_code=400,
+                            content={"error": "Feature extraction failed"})
+    X = features.reshape(1, -1)
+    if scaler is not None:
+        X = scaler.transform(X)
 
-        return {
-            "classifications": [{
-                "label": prediction,
-                "confidence": confidence,
-                "class_probabilities": class_probs,
-            }],
-            "sensor_id": sensor_id,
-        }
-    finally:
-        os.unlink(tmp_path)
+    prediction, confidence, class_probs = _predict_one(clf, X)
+
+    return {
+        "classifications": [{
+            "label": prediction,
+            "confidence": confidence,
+            "class_probabilities": class_probs,
+        }],
+        "sensor_id": sensor_id,
+    }
+
+
+def _numpy_json(content: dict) -> Response:
+    """
+    Serialise with orjson: ndarrays / numpy scalars are written directly
+    (no ``.tolist()`` round-trip) and int dict keys are allowed.
+    """
+    return Response(
+        orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY
+                     | orjson.OPT_NON_STR_KEYS),
+        media_type="application/json",
+    )
 
 
 @router.post("/m5-application/anomaly-detection")
@@ -1113,7 +1439,7 @@ async def api_anomaly_detection(req: AnomalyDetectionRequest):
             contamination=req.contamination,
             model_path=req.model_path,
         )
-        return result
+        return _numpy_json(result)
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": str(e)})
 
@@ -1129,7 +1455,7 @@ async def api_clustering(req: ClusteringRequest):
             n_clusters=req.n_clusters,
             parameters=req.parameters,
         )
-        return result
+        return _numpy_json(result)
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": str(e)})
 
@@ -1142,18 +1468,13 @@ async def api_scene_analysis(
     """Combined scene analysis: frequency bands + anomaly + event detection."""
     try:
         params = json.loads(config_json)
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp.write(await file.read())
-            tmp_path = tmp.name
-
-        audio, sr = librosa.load(tmp_path, sr=None)
-        os.unlink(tmp_path)
+        audio, sr = await _load_upload(file)
 
         result = analyze_scene(
             audio, sr,
             time_resolution=params.get("time_resolution", 1.0),
         )
-        return result
+        return _numpy_json(result)
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": str(e)})
 
@@ -1189,8 +1510,9 @@ async def api_chunk_audio(req: ChunkAudioRequest):
     """Split audio files on click/silence boundaries."""
     try:
         os.makedirs(req.output_dir, exist_ok=True)
-        chunk_all_files(req.input_dir, req.output_dir)
-        count = sum(1 for f in Path(req.output_dir).rglob("*") if f.is_file())
+        await asyncio.to_thread(chunk_all_files, req.input_dir, req.output_dir,
+                                workers=os.cpu_count())
+        count = _count_files(req.output_dir)
         return {"status": "success", "output_dir": req.output_dir,
                 "files_created": count}
     except Exception as e:
@@ -1205,14 +1527,9 @@ async def api_sliding_window(
 ):
     """Segment a single audio file into overlapping windows."""
     try:
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp.write(await file.read())
-            tmp_path = tmp.name
+        audio, sr = await _load_upload(file, sr=SAMPLE_RATE)
 
-        audio, sr = librosa.load(tmp_path, sr=SAMPLE_RATE)
-        os.unlink(tmp_path)
-
-        windows = list(sliding_window(audio, window_size=window_size, step=step))
+        windows = sliding_window(audio, window_size=window_size, step=step)
         return {
             "n_windows": len(windows),
             "window_size_seconds": window_size,
@@ -1224,30 +1541,37 @@ async def api_sliding_window(
         return JSONResponse(status_code=500, content={"error": str(e)})
 
 
+def _noise_reduce_file(f: Path, src: Path, dst: Path) -> None:
+    audio, sr = load_audio(str(f), sr=None)
+    cleaned = reduce_strong_noise(audio, sr)
+    out = dst / f.relative_to(src)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    write_audio(str(out), cleaned, sr)
+
+
 @router.post("/data/noise-reduction")
 async def api_noise_reduction(req: NoiseReductionRequest):
     """Apply noise reduction to all audio files in a directory."""
     try:
-        from M2_processing.augmentation.adjust_pitch import reduce_strong_noise
-        import soundfile as sf
-
         src = Path(req.input_dir)
         dst = Path(req.output_dir)
         dst.mkdir(parents=True, exist_ok=True)
-        processed = 0
         audio_exts = {".wav", ".mp3", ".flac", ".ogg"}
-
-        for f in src.rglob("*"):
-            if f.suffix.lower() not in audio_exts:
-                continue
-            audio, sr = librosa.load(str(f), sr=None)
-            cleaned = reduce_strong_noise(audio, sr)
-            out_path = dst / f.name
-            sf.write(str(out_path), cleaned, sr)
-            processed += 1
-
+        files = [f for f in src.rglob("*") if f.suffix.lower() in audio_exts]
+
+        # LOGIC NOTE: load / STFT gating / write all release the GIL, so
+        # a thread pool overlaps disk I/O with the numpy work.  Outputs keep
+        # their path relative to input_dir: rglob finds same-named files in
+        # different class subdirs, and a flat dst / f.name would have the
+        # workers write the same file concurrently.
+        def run():
+            workers = min(32, (os.cpu_count() or 1) * 2)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(partial(_noise_reduce_file, src=src, dst=dst), files))
+
+        await asyncio.to_thread(run)
         return {"status": "success", "output_dir": req.output_dir,
-                "files_processed": processed}
+                "files_processed": len(files)}
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": str(e)})
 
@@ -1291,19 +1615,13 @@ class ListAudioDirsRequest(BaseModel):
 async def api_organize_splits(req: OrganizeSplitsRequest):
     """Split dataset into train/validation/test sets."""
     try:
-        organize_samples(
+        splits = await asyncio.to_thread(
+            organize_samples,
             req.input_dir, req.output_dir,
             test_size=req.test_size,
             val_size=req.val_size,
             random_state=req.random_state,
         )
-        # Count files per split
-        splits = {}
-        for split in ["train", "validation", "test"]:
-            split_dir = os.path.join(req.output_dir, split)
-            if os.path.exists(split_dir):
-                count = sum(1 for f in Path(split_dir).rglob("*") if f.is_file())
-                splits[split] = count
         return {"status": "success", "output_dir": req.output_dir,
                 "splits": splits}
     except Exception as e:
@@ -1339,34 +1657,48 @@ async def api_list_audio_dirs(req: ListAudioDirsRequest):
 async def api_source_separation(
     file: UploadFile = File(...),
     n_components: int = Form(2),
+    encoding: str = Form("wav"),  # wav | f32le
+    fast: bool = Form(False),
 ):
-    """Separate mixed audio into N sources using NMF."""
-    try:
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp.write(await file.read())
-            tmp_path = tmp.name
+    """
+    Separate mixed audio into N sources using NMF.
 
-        audio, sr = librosa.load(tmp_path, sr=None)
-        os.unlink(tmp_path)
+    ``fast=True`` runs the NMF at 16 kHz and resamples the sources back
+    to the upload's rate – several times faster on 44.1/48 kHz uploads,
+    at the cost of everything above 8 kHz.
 
-        sources = separate_sources(audio, n_components=n_components)
+    Each source comes back base64-encoded: as a WAV file by default, or
+    with ``encoding="f32le"`` as raw little-endian float32 samples – no
+    header to build or parse (``sample_rate`` / ``samples`` are in the
+    JSON) and the client can view it directly as a ``Float32Array``.
+    """
+    if encoding not in ("wav", "f32le"):
+        return JSONResponse(status_code=400,
+                            content={"error": "encoding must be 'wav' or 'f32le'"})
+    try:
+        audio, sr = await _load_upload(file)
+
+        sources = separate_sources(audio, n_components=n_components,
+                                   sr=sr, work_sr=16000 if fast else None)
 
-        # Return sources as base64-encoded WAV files
-        import soundfile as sf
         encoded_sources = []
         for i, src_audio in enumerate(sources):
-            buf = io.BytesIO()
-            sf.write(buf, src_audio, sr, format="WAV")
-            buf.seek(0)
+            if encoding == "f32le":
+                payload = np.ascontiguousarray(src_audio, dtype="<f4").tobytes()
+            else:
+                buf = io.BytesIO()
+                sf.write(buf, src_audio, sr, format="WAV")
+                payload = buf.getvalue()
             encoded_sources.append({
                 "index": i,
-                "audio_base64": base64.b64encode(buf.read()).decode(),
+                "audio_base64": base64.b64encode(payload).decode(),
                 "samples": len(src_audio),
             })
 
         return {
             "n_sources": len(sources),
             "sample_rate": sr,
+            "encoding": encoding,
             "sources": encoded_sources,
         }
     except Exception as e:
@@ -1384,10 +1716,19 @@ async def ws_stream(websocket: WebSocket, sensor_id: str):
     classification and optional DOA results.
     """
     await websocket.accept()
+    # Per-connection scratch buffer, grown only when a larger frame
+    # arrives – the steady-state loop allocates nothing for the samples
+    # and hands downstream code a writeable, aligned array.
+    scratch = np.empty(0, dtype=np.float32)
     try:
         while True:
             audio_bytes = await websocket.receive_bytes()
-            audio = np.frombuffer(audio_bytes, dtype=np.float32)
+            n = len(audio_bytes) // 4
+            if n > len(scratch):
+                scratch = np.empty(max(n, 2 * len(scratch)), dtype=np.float32)
+            audio = scratch[:n]
+            np.copyto(audio, np.frombuffer(audio_bytes, dtype=np.float32,
+                                           count=n))
 
             if len(audio) < 1024:
                 await websocket.send_json({
@@ -1396,13 +1737,10 @@ async def ws_stream(websocket: WebSocket, sensor_id: str):
                 })
                 continue
 
-            # Quick feature extraction (default config)
-            with tempfile.NamedTemporaryFile(suffix=".wav",
-                                             delete=False) as tmp:
-                import soundfile as sf
-                sf.write(tmp.name, audio, SAMPLE_RATE)
-                features = extract_features(tmp.name)
-                os.unlink(tmp.name)
+            # Quick feature extraction (default config) straight from
+            # the received samples – no temp WAV on the realtime path.
+            features = await asyncio.to_thread(
+                extract_features, (audio, SAMPLE_RATE))
 
             if features is not None:
                 await websocket.send_json({
@@ -19,6 +19,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Doppler-Summary"],  # raw-PNG doppler plot metadata
 )
 
 app.include_router(api_router, prefix="/api")
@@ -6,6 +6,11 @@ def check_audio_level(audio_data, threshold=DECIBEL_THRESHOLD):
     """
     Checks if the audio's RMS (converted to decibels) is above the threshold.
     """
-    rms = np.sqrt(np.mean(np.square(audio_data)))
+    samples = np.asarray(audio_data).ravel()
+    if samples.size == 0:
+        return False
+    # Sum of squares as one BLAS dot product – a single pass over the
+    # samples with no squared temporary.
+    rms = np.sqrt(np.dot(samples, samples) / samples.size)
     decibel = 20 * np.log10(rms + 1e-6)  # Avoid log(0)
     return decibel > threshold
@@ -10,14 +10,30 @@ def select_directory():
     directory = filedialog.askdirectory(title="Select Directory to Clean Up")
     return directory
 
+def _check_audio_file(file_path):
+    """
+    Raise if *file_path* is not a readable, non-empty audio file.
+
+    Only the header and the first block of frames are decoded – enough
+    to catch truncated or corrupt files without decoding the whole
+    recording.  Files libsndfile can't open fall back to a full
+    ``librosa.load`` (audioread), as before.
+    """
+    try:
+        with sf.SoundFile(file_path) as f:
+            if f.frames <= 0:
+                raise ValueError("no audio frames")
+            f.read(1024)
+    except sf.LibsndfileError:
+        librosa.load(file_path, sr=None)
+
 def clean_up_invalid_files(directory):
     for root, _, files in os.walk(directory):
         for file_name in files:
             if file_name.endswith('.wav'):
                 file_path = os.path.join(root, file_name)
                 try:
-                    # Attempt to load the audio file
-                    audio, sample_rate = librosa.load(file_path, res_type='kaiser_fast')
+                    _check_audio_file(file_path)
                 except Exception as e:
                     # Handle other exceptions
                     print(f"Error processing {file_path}: {e}")
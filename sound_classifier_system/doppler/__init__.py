@@ -4,6 +4,7 @@ Doppler & Frequency Analysis – __init__.py
 from .doppler import (
     dominant_frequency,
     frequency_track,
+    frequency_track_streaming,
     calculate_velocity,
     full_doppler_analysis,
 )
@@ -11,6 +12,7 @@ from .doppler import (
 __all__ = [
     "dominant_frequency",
     "frequency_track",
+    "frequency_track_streaming",
     "calculate_velocity",
     "full_doppler_analysis",
 ]
@@ -1,41 +1,24 @@
 import os
+import errno
 import shutil
+import hashlib
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog
 from tkinter import ttk
-import librosa
-import librosa.display
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
-from pytube import Playlist
-import pickle
-import joblib
-from sklearn.model_selection import train_test_split
-from sklearn.svm import SVC
-from sklearn.ensemble import RandomForestClassifier, VotingClassifier
-from sklearn.neighbors import KNeighborsClassifier
-from sklearn.metrics import accuracy_score
 import webbrowser
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 
 # File dialogs
 from tkinter.filedialog import askopenfilename, askdirectory
 
-# Import your actual modules (update with your real module paths)
-from acquisitions.dataset_download.unified import download_soundata_dataset
-from acquisitions.youtube.playlist import save_playlist_urls
-from acquisitions.youtube.download import download_audio
-from processing.dataset_preparation.feature_extraction import extract_features
-from processing.augmentation.adjust_pitch import process_all_files as process_pitch
-from processing.augmentation.adjust_volume import process_all_files as process_volume
-from processing.augmentation.reverse_audio import process_all_files as process_reverse
-from processing.segmentation.generate_chunks import process_all_files as generate_audio_chunks
-from cleanup.cleanup_invalid_files import clean_up_invalid_files as validate_audio_samples
-from processing.segmentation.sliding_window import sliding_window
-from processing.segmentation.source_separation import separate_sources
-from processing.dataset_preparation.metadata_based_class_creation import copy_files_to_class_directories, find_audio_files
-from processing.dataset_preparation.organize_sound_samples import organize_samples
-from processing.dataset_preparation.rename_class import copy_files_to_directory
+# Heavy dependencies (librosa → numba, matplotlib, sklearn, and the
+# acquisition / processing modules that pull them in) are imported inside
+# the callbacks that use them, so the window opens without paying for
+# them up front.  Python caches each module after its first import.
 #from reports.generate_reports import generate_sampled_data_report, generate_dataset_report
 
 # --- Directory Setup ---
@@ -49,9 +32,12 @@ SOUND_PROCESSED_DIR = os.path.join(BASE_DIR, "sound_data", "processed")
 SAMPLED_DATA_DIR = os.path.join(BASE_DIR, "sampled_data")
 SOUND_DATASET_DIR = os.path.join(BASE_DIR, "sound_dataset")
 
-for d in [BASE_DIR, SOUND_CHUNKED_DIR, SOUND_FILTERED_DIR, SOUND_PITCH_DIR, SOUND_VOLUME_DIR,
-          SOUND_REVERSED_DIR, SOUND_PROCESSED_DIR, SAMPLED_DATA_DIR, SOUND_DATASET_DIR]:
+@lru_cache(maxsize=None)
+def _ensure_dir(d):
+    """Create *d* the first time a step uses it (once per process) rather
+    than creating every directory at import; returns *d*."""
     os.makedirs(d, exist_ok=True)
+    return d
 
 # --- Tooltip Class for Button Explanations ---
 class CreateToolTip:
@@ -92,12 +78,28 @@ class CreateToolTip:
             tw.destroy()
 
 # --- Helper for Logging and Error Handling ---
+LOG_FLUSH_MS = 50
+_log_buffer = deque()
+_log_flush_scheduled = False
+
 def log_message(message, error=False):
-    """Insert a log message in the log panel."""
+    """Queue a log message for the log panel.  Messages are written in
+    batches every LOG_FLUSH_MS, so a burst of them costs one insert and
+    one scroll rather than one of each per line."""
+    global _log_flush_scheduled
     tag = "ERROR" if error else "INFO"
-    log_entry = f"[{tag}] {message}\n"
+    _log_buffer.append(f"[{tag}] {message}\n")
+    if not _log_flush_scheduled:
+        _log_flush_scheduled = True
+        log_text.after(LOG_FLUSH_MS, _flush_log)
+
+def _flush_log():
+    global _log_flush_scheduled
+    _log_flush_scheduled = False
+    entries = "".join(_log_buffer)
+    _log_buffer.clear()
     log_text.config(state="normal")
-    log_text.insert("end", log_entry)
+    log_text.insert("end", entries)
     log_text.see("end")
     log_text.config(state="disabled")
 
@@ -125,6 +127,7 @@ def download_dataset():
         messagebox.showwarning("Input Error", "You must select a directory to store the dataset.")
         return
 
+    from acquisitions.dataset_download.unified import download_soundata_dataset
     download_soundata_dataset(dataset_name, data_home)
     messagebox.showinfo("Acquisitions", f"{dataset_name} dataset downloaded to {data_home}")
 
@@ -141,6 +144,7 @@ def download_youtube_playlist():
         messagebox.showwarning("Input Error", "You must select an output file to save the URLs.")
         return
 
+    from acquisitions.youtube.playlist import save_playlist_urls
     save_playlist_urls(playlist_url, output_file)
 
 def download_youtube_video():
@@ -156,6 +160,7 @@ def download_youtube_video():
         messagebox.showwarning("Input Error", "You must select an output file to save the audio.")
         return
 
+    from acquisitions.youtube.download import download_audio
     download_audio(video_url, output_file)
     messagebox.showinfo("Acquisitions", "Video audio downloaded successfully.")
 
@@ -163,6 +168,7 @@ def process_feature_extraction_file():
     file_path = askopenfilename(title="Select Audio File for Feature Extraction", 
                                 filetypes=[("Audio Files", "*.wav *.mp3")])
     if file_path:
+        from processing.dataset_preparation.feature_extraction import extract_features
         feature = extract_features(file_path)
         if feature is not None:
             messagebox.showinfo("Processing", f"Feature extraction complete.\nFeature vector length: {len(feature)}")
@@ -172,22 +178,37 @@ def process_feature_extraction_file():
         messagebox.showwarning("Processing", "No file selected.")
 
 def process_augmentation():
-    process_pitch(SOUND_FILTERED_DIR, SOUND_PITCH_DIR)
-    process_volume(SOUND_FILTERED_DIR, SOUND_VOLUME_DIR)
-    process_reverse(SOUND_FILTERED_DIR, SOUND_REVERSED_DIR)
-    messagebox.showinfo("Processing", "Audio augmentation completed: pitch, volume, and reversal adjustments applied.")
+    from processing.augmentation.adjust_pitch import process_all_files as process_pitch
+    from processing.augmentation.adjust_volume import process_all_files as process_volume
+    from processing.augmentation.reverse_audio import process_all_files as process_reverse
+    # The three augmentations only read SOUND_FILTERED_DIR and write to
+    # separate folders, so they run side by side.  "spawn" keeps the
+    # workers from inheriting a forked copy of the Tk interpreter.
+    jobs = [(process_pitch, SOUND_PITCH_DIR),
+            (process_volume, SOUND_VOLUME_DIR),
+            (process_reverse, SOUND_REVERSED_DIR)]
+    with ProcessPoolExecutor(max_workers=len(jobs),
+                             mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = [pool.submit(fn, _ensure_dir(SOUND_FILTERED_DIR), out_dir) for fn, out_dir in jobs]
+        pitch, volume, reverse = (f.result() for f in futures)
+    messagebox.showinfo("Processing", "Audio augmentation completed: pitch, volume, and reversal adjustments applied "
+                        f"({pitch} pitch, {volume} volume, {reverse} reversed files).")
 
 def process_segmentation():
-    generate_audio_chunks(SOUND_FILTERED_DIR, SOUND_CHUNKED_DIR)
+    from processing.segmentation.generate_chunks import process_all_files as generate_audio_chunks
+    generate_audio_chunks(_ensure_dir(SOUND_FILTERED_DIR), _ensure_dir(SOUND_CHUNKED_DIR),
+                          workers=os.cpu_count())
     messagebox.showinfo("Processing", "Audio segmentation completed and stored in sound_data/chunked")
 
 def process_sliding_window_file():
     file_path = askopenfilename(title="Select Audio File for Sliding Window", 
                                 filetypes=[("Audio Files", "*.wav *.mp3")])
     if file_path:
-        y, sr = librosa.load(file_path, sr=44100)
-        windows = list(sliding_window(y))
-        messagebox.showinfo("Processing", f"Sliding window applied. {len(windows)} windows generated for {os.path.basename(file_path)}")
+        from processing.audio_io import load_audio
+        from processing.segmentation.sliding_window import sliding_window
+        y, sr = load_audio(file_path, sr=44100)
+        windows = sliding_window(y)  # (n_windows, samples) strided view, no copies
+        messagebox.showinfo("Processing", f"Sliding window applied. {windows.shape[0]} windows generated for {os.path.basename(file_path)}")
     else:
         messagebox.showwarning("Processing", "No file selected.")
 
@@ -195,13 +216,16 @@ def process_source_separation_file():
     file_path = askopenfilename(title="Select Audio File for Source Separation", 
                                 filetypes=[("Audio Files", "*.wav *.mp3")])
     if file_path:
-        y, _ = librosa.load(file_path, sr=44100)
+        from processing.audio_io import load_audio
+        from processing.segmentation.source_separation import separate_sources
+        y, _ = load_audio(file_path, sr=44100)
         sources = separate_sources(y)
         messagebox.showinfo("Processing", f"Source separation applied. {len(sources)} sources extracted for {os.path.basename(file_path)}")
     else:
         messagebox.showwarning("Processing", "No file selected.")
 
 def validate_samples():
+    from cleanup.cleanup_invalid_files import clean_up_invalid_files as validate_audio_samples
     validate_audio_samples()
     messagebox.showinfo("Validation", "Audio samples validated and cleaned in processing/cleanup")
 
@@ -226,15 +250,17 @@ def create_classes_from_metadata():
     if file_ext not in ['.wav', '.mp3']:
         messagebox.showerror("Data Preparation", "Invalid file extension.")
         return
+    from processing.dataset_preparation.metadata_based_class_creation import copy_files_to_class_directories, find_audio_files
     audio_files = find_audio_files(audio_base_dir, file_ext)
     if not audio_files:
         messagebox.showerror("Data Preparation", f"No audio files with extension {file_ext} found in {audio_base_dir}.")
         return
-    copy_files_to_class_directories(metadata_file, audio_files, SAMPLED_DATA_DIR)
+    copy_files_to_class_directories(metadata_file, audio_files, _ensure_dir(SAMPLED_DATA_DIR))
     messagebox.showinfo("Data Preparation", "Classes created based on metadata.")
 
 def organize_dataset():
-    organize_samples(SAMPLED_DATA_DIR, SOUND_DATASET_DIR)
+    from processing.dataset_preparation.organize_sound_samples import organize_samples
+    organize_samples(_ensure_dir(SAMPLED_DATA_DIR), _ensure_dir(SOUND_DATASET_DIR))
     messagebox.showinfo("Data Preparation", "Sound samples organized into training, validation, and test sets.")
 
 def rename_classes():
@@ -246,24 +272,65 @@ def rename_classes():
     if file_ext not in ['.wav', '.mp3']:
         messagebox.showerror("Data Preparation", "Invalid file extension.")
         return
-    copy_files_to_directory([source_dir], SAMPLED_DATA_DIR, file_ext)
+    from processing.dataset_preparation.rename_class import copy_files_to_directory
+    copy_files_to_directory([source_dir], _ensure_dir(SAMPLED_DATA_DIR), file_ext)
     messagebox.showinfo("Data Preparation", "Classes renamed and structured.")
 
 # --- New Functions for Model Building and API Connection ---
+ANN_MIN_SAMPLES = 20000  # below this, exact (BLAS brute-force) KNN is as fast as HNSW
+
+@lru_cache(maxsize=1)
+def _feature_memory():
+    """On-disk cache for stacked feature matrices, so rebuilding a model
+    over the same classes (e.g. to try another k) skips unpickling every
+    class file.  Cache hits come back memory-mapped, read-only."""
+    from joblib import Memory
+    return Memory(os.path.join(BASE_DIR, ".cache"), mmap_mode="r", verbose=0)
+
+def _load_class_features(feature_files):
+    """Stack the per-class feature files in *feature_files* – ``((path, mtime_ns), ...)``
+    – into ``(X, y)``, labelling each vector with its file's stem.
+
+    Each class's vectors are copied straight into one preallocated
+    ``(total, n_features)`` float32 matrix (``.npy`` classes straight from
+    their memory map)."""
+    from processing.dataset_preparation.feature_extraction import load_feature_file
+    names, per_class = [], []
+    for path, _ in feature_files:
+        per_class.append(load_feature_file(path))
+        names.append(os.path.splitext(os.path.basename(path))[0])
+    counts = [len(vectors) for vectors in per_class]
+    total = sum(counts)
+    if total == 0:
+        return np.array([]), np.array([])
+
+    n_features = next(vectors.shape[1] for vectors in per_class if len(vectors))
+    X = np.empty((total, n_features), dtype=np.float32)
+    offset = 0
+    for vectors, n in zip(per_class, counts):
+        if n:
+            X[offset:offset + n] = vectors
+        offset += n
+    return X, np.repeat(np.array(names), counts)
+
 def build_model():
     feature_folder = filedialog.askdirectory(title="Select Feature Folder")
     if not feature_folder:
         messagebox.showwarning("Model Building", "No feature folder selected.")
         return
 
-    class_files = [f for f in os.listdir(feature_folder) if f.endswith('.pkl')]
+    from processing.dataset_preparation.feature_extraction import list_feature_files
+    # The one listing of the folder: the numbered menu below and the
+    # selected indices both refer to it, and it is sorted by label to
+    # keep the numbering stable across runs.
+    class_files = list_feature_files(feature_folder)
     if not class_files:
-        messagebox.showerror("Model Building", "No feature files (.pkl) found in the selected folder.")
+        messagebox.showerror("Model Building", "No feature files (.npy / .pkl) found in the selected folder.")
         return
 
     classes_message = "Available classes:\n"
-    for idx, file in enumerate(class_files):
-        classes_message += f"{idx + 1}. {os.path.splitext(file)[0]}\n"
+    for idx, label in enumerate(class_files):
+        classes_message += f"{idx + 1}. {label}\n"
     messagebox.showinfo("Available Classes", classes_message)
 
     indices_str = simpledialog.askstring("Select Classes", "Enter the numbers of the classes to use (comma separated):")
@@ -276,26 +343,25 @@ def build_model():
         messagebox.showerror("Model Building", "Invalid input for class indices.")
         return
 
-    def load_features(feature_folder, selected_indices):
-        features = []
-        labels = []
-        class_files_local = [f for f in os.listdir(feature_folder) if f.endswith('.pkl')]
-        try:
-            filtered_files = [class_files_local[i] for i in selected_indices]
-        except IndexError:
-            messagebox.showerror("Model Building", "One or more class indices are out of range.")
-            return None, None
-        for file in filtered_files:
-            class_name = os.path.splitext(file)[0]
-            with open(os.path.join(feature_folder, file), 'rb') as f:
-                class_features = pickle.load(f)
-                features.extend(class_features)
-                labels.extend([class_name] * len(class_features))
-        return np.array(features), np.array(labels)
-
-    X, y = load_features(feature_folder, selected_indices)
-    if X is None or y is None:
+    try:
+        class_paths = list(class_files.values())
+        filtered_files = [class_paths[i] for i in selected_indices]
+    except IndexError:
+        messagebox.showerror("Model Building", "One or more class indices are out of range.")
         return
+    # mtimes are part of the key, so re-extracted features miss the cache
+    feature_files = tuple((path, os.stat(path).st_mtime_ns) for path in filtered_files)
+    X, y = _feature_memory().cache(_load_class_features)(feature_files)
+
+    import joblib
+    from sklearn.model_selection import train_test_split
+    from sklearn.svm import LinearSVC
+    from sklearn.calibration import CalibratedClassifierCV
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.ensemble import RandomForestClassifier, VotingClassifier
+    from sklearn.neighbors import KNeighborsClassifier
+    from sklearn.metrics import accuracy_score
 
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
@@ -305,21 +371,41 @@ def build_model():
     except:
         num_neighbors = 5
 
-    svm_clf = SVC(kernel='linear', probability=True)
-    rf_clf = RandomForestClassifier(n_estimators=100, random_state=42)
-    knn_clf = KNeighborsClassifier(n_neighbors=num_neighbors)
+    # liblinear instead of libsvm's O(n²) linear-kernel SVC; calibration
+    # supplies the probabilities soft voting needs.  Standardising keeps
+    # liblinear converging on raw (mixed-scale) audio features.
+    svm_clf = CalibratedClassifierCV(make_pipeline(StandardScaler(), LinearSVC(max_iter=2000)),
+                                     cv=3, n_jobs=-1)
+    rf_clf = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1)
+    try:
+        import hnswlib  # noqa: F401
+        use_ann = len(X_train) >= ANN_MIN_SAMPLES
+    except ImportError:
+        use_ann = False
+    if use_ann:
+        # Approximate (HNSW) neighbours: O(log N) per query instead of a scan
+        from M3_modelling.ann_knn import HNSWClassifier
+        knn_clf = HNSWClassifier(n_neighbors=num_neighbors)
+    else:
+        knn_clf = KNeighborsClassifier(n_neighbors=num_neighbors, n_jobs=-1)
 
     ensemble_clf = VotingClassifier(estimators=[
         ('svm', svm_clf),
         ('rf', rf_clf),
         ('knn', knn_clf)
-    ], voting='soft')
+    ], voting='soft', n_jobs=-1)
 
     ensemble_clf.fit(X_train, y_train)
     y_pred = ensemble_clf.predict(X_test)
     acc = accuracy_score(y_test, y_pred)
     msg = f"Ensemble classifier built with accuracy: {acc:.2f}\nModel will be saved as 'ensemble_model.joblib'."
-    joblib.dump(ensemble_clf, "ensemble_model.joblib")
+    # lz4 decompresses far faster than zlib; fall back to zlib without it
+    try:
+        import lz4  # noqa: F401
+        compress = ('lz4', 3)
+    except ImportError:
+        compress = ('zlib', 3)
+    joblib.dump(ensemble_clf, "ensemble_model.joblib", compress=compress, protocol=5)
     messagebox.showinfo("Model Building", msg)
 
 def connect_to_api():
@@ -331,13 +417,153 @@ def connect_to_api():
         messagebox.showerror("API Connection", f"Failed to open API documentation: {e}")
 
 # --- Manual Filtering GUI (unchanged) ---
+SPEC_LOOKAHEAD = 4  # spectrograms computed ahead of the one on screen
+SPEC_SR = 16000     # review spectrograms show 0–8 kHz
+SPEC_N_FFT = 1024
+SPEC_HOP = 256
+SPEC_POLL_MS = 20   # how often a pending spectrogram job is checked
+SPEC_MAX_SECONDS = 60  # only this much of a (mis-pointed) full track is decoded
+SPEC_CACHE_SIZE = 32   # recent spectrograms kept for Previous (≤ ~8 MB each at SPEC_MAX_SECONDS)
+
+DEDUP_PREFIX_BYTES = 64 * 1024
+
+def _content_key(path):
+    """
+    Cheap duplicate key for a chunk: file size plus a BLAKE2b digest of
+    its first 64 KB – same-size files with an identical header and
+    opening samples are treated as the same clip.
+    """
+    with open(path, "rb") as f:
+        digest = hashlib.blake2b(f.read(DEDUP_PREFIX_BYTES), digest_size=16).digest()
+        return os.fstat(f.fileno()).st_size, digest
+
+def _move_into(src, dst_dir):
+    """Move *src* into *dst_dir* (replacing a same-named file there) with a
+    single rename(2); only a cross-device move falls back to shutil's
+    copy + delete."""
+    dst = os.path.join(dst_dir, os.path.basename(src))
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+    return dst
+
+def _full_digest(path):
+    """BLAKE2b digest of the whole file, read in 1 MB blocks."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.digest()
+
+def _unique_files(paths):
+    """
+    Drop content duplicates from *paths*, keeping the first of each.
+    The cheap size + prefix key only nominates candidates; a file is
+    dropped only when its full-content digest matches an earlier one.
+    """
+    with ThreadPoolExecutor(max_workers=8) as pool:  # I/O bound
+        keys = list(pool.map(_content_key, paths))
+    seen = {}  # prefix key -> full digests of the files kept under it
+    first = {}  # prefix key -> first path kept, hashed lazily on collision
+    unique = []
+    for path, key in zip(paths, keys):
+        if key not in first:
+            first[key] = path
+            unique.append(path)
+            continue
+        kept = seen.get(key)
+        if kept is None:
+            kept = seen[key] = {_full_digest(first[key])}
+        digest = _full_digest(path)
+        if digest not in kept:
+            kept.add(digest)
+            unique.append(path)
+    return unique
+
+@lru_cache(maxsize=1)
+def _spec_librosa():
+    """
+    Import librosa for the filtering GUI, with pyfftw as its FFT backend
+    when installed: with the plan cache on, repeated same-length chunks
+    skip FFT planning.  Otherwise librosa keeps its default numpy FFT.
+    """
+    import librosa
+    try:
+        import pyfftw
+        import pyfftw.interfaces.numpy_fft
+        pyfftw.interfaces.cache.enable()
+        pyfftw.interfaces.cache.set_keepalive_time(60)
+        librosa.set_fftlib(pyfftw.interfaces.numpy_fft)
+    except ImportError:
+        pass
+    return librosa
+
+@lru_cache(maxsize=SPEC_CACHE_SIZE)
+def _compute_spec(path):
+    """
+    Decode *path* and return its log-magnitude STFT as ``(S_db, sr)``.
+
+    Memoised, so stepping back to a file (Previous, or the wrap-around
+    after the last one) redraws from memory instead of re-decoding.
+    """
+    from processing.audio_io import load_audio
+    from scipy.signal import resample_poly
+    librosa = _spec_librosa()
+    # libsndfile decode at the native rate (librosa.load fallback for MP3 etc.)
+    y, sr = load_audio(path, duration=SPEC_MAX_SECONDS)
+    if sr > SPEC_SR:
+        # Polyphase decimation (the ratio is gcd-reduced internally) – the
+        # STFT then covers a third of the samples of a 44.1/48 kHz file.
+        y = resample_poly(y, SPEC_SR, sr)
+        sr = SPEC_SR
+    # librosa.stft rather than scipy's ShortTimeFFT: the latter is several
+    # times slower here and returns complex128 for float32 input.
+    # float32 magnitude, reused in place below.  np.abs on complex64 is a
+    # vectorised hypot and beats forming re² + im² (strided real/imag views
+    # plus temporaries) even though the latter skips the sqrt; the log10
+    # costs the same either way.
+    S_db = np.abs(librosa.stft(y, n_fft=SPEC_N_FFT, hop_length=SPEC_HOP))
+    # Same result as librosa.amplitude_to_db(S, ref=np.max) (amin 1e-5,
+    # 80 dB floor) without its float64 power/temporary arrays.
+    ref = max(S_db.max(), 1e-5)
+    np.maximum(S_db, 1e-5, out=S_db)
+    S_db /= ref
+    np.log10(S_db, out=S_db)
+    S_db *= 20.0
+    np.maximum(S_db, -80.0, out=S_db)
+    return S_db, sr
+
 class AudioFilterGUI(tk.Toplevel):
     def __init__(self, master):
         super().__init__(master)
         self.title("Manual Audio Chunk Filtering")
         self.geometry("900x600")
-        self.audio_files = [os.path.join(SOUND_CHUNKED_DIR, f) for f in os.listdir(SOUND_CHUNKED_DIR) if f.endswith(('.wav', '.mp3'))]
+        with os.scandir(_ensure_dir(SOUND_CHUNKED_DIR)) as entries:
+            self.audio_files = [e.path for e in entries
+                                if e.name.endswith(('.wav', '.mp3')) and e.is_file()]
+        # Segmentation/augmentation can leave identical chunks behind; show
+        # each clip once (duplicates stay on disk, they're just not queued).
+        n_found = len(self.audio_files)
+        self.audio_files = _unique_files(self.audio_files)
+        if len(self.audio_files) < n_found:
+            log_message(f"Skipped {n_found - len(self.audio_files)} duplicate chunk(s) "
+                        f"in {SOUND_CHUNKED_DIR}")
         self.current_index = 0
+        # Reviewed (kept/deleted) files are masked out rather than deleted
+        # from the list, so Keep/Delete never shift the tail of a long list.
+        self._alive = bytearray(b"\x01") * len(self.audio_files)
+        self._n_alive = len(self.audio_files)
+        # Decode + STFT for the next few files run here while the user
+        # reviews the current one; the Tk thread only does the drawing.
+        self._pool = ThreadPoolExecutor(max_workers=min(SPEC_LOOKAHEAD, os.cpu_count() or 1))
+        self._spec_futures = {}  # path -> Future[(S_db, sr)]
+        # "Keep" moves run in the background so the next chunk shows at once
+        self._io_pool = ThreadPoolExecutor(max_workers=4)
+        self._pending_moves = []
+        self._closed = False
         self.setup_widgets()
         if self.audio_files:
             self.display_current_file()
@@ -346,38 +572,133 @@ class AudioFilterGUI(tk.Toplevel):
             self.destroy()
 
     def setup_widgets(self):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
         self.plot_frame = ttk.Frame(self)
         self.plot_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        # File name lives in a Tk label, outside the blitted axes area
+        self.file_label = ttk.Label(self.plot_frame, font=("Helvetica", 12))
+        self.file_label.pack(side=tk.TOP)
+        # One figure for the window's lifetime – navigation only swaps the
+        # image data, so there is no figure/colorbar/canvas rebuild per click.
+        self.fig = Figure(figsize=(8, 4))
+        self.ax = self.fig.add_subplot()
+        self.ax.set_xlabel("Time (s)")
+        self.ax.set_ylabel("Hz")
+        # S_db is referenced to its max with librosa's 80 dB floor, so the
+        # colour limits (and the colorbar) never need to change.  The image
+        # is "animated": full redraws skip it and _on_draw blits it on top.
+        self.img = self.ax.imshow(np.full((SPEC_N_FFT // 2 + 1, 1), -80.0), origin='lower', aspect='auto',
+                                  interpolation='nearest', cmap='magma', vmin=-80, vmax=0,
+                                  animated=True)
+        self.cbar = self.fig.colorbar(self.img, ax=self.ax, format="%+2.f dB")
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_frame)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self._bg = None  # axes background without the image, for blitting
+        self.canvas.mpl_connect("draw_event", self._on_draw)
         control_frame = ttk.Frame(self)
         control_frame.pack(side=tk.BOTTOM, pady=10)
+        btn_prev = ttk.Button(control_frame, text="Previous", command=safe_run(self.prev_file))
+        btn_prev.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
+        CreateToolTip(btn_prev, "Go back to the previous unreviewed audio chunk.")
         btn_keep = ttk.Button(control_frame, text="Keep", command=safe_run(self.keep_current))
-        btn_keep.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
+        btn_keep.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
         CreateToolTip(btn_keep, "Keep the current audio chunk.")
         btn_delete = ttk.Button(control_frame, text="Delete", command=safe_run(self.delete_current))
-        btn_delete.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
+        btn_delete.grid(row=0, column=2, padx=5, pady=5, sticky="ew")
         CreateToolTip(btn_delete, "Delete the current audio chunk.")
         btn_next = ttk.Button(control_frame, text="Next", command=safe_run(self.next_file))
-        btn_next.grid(row=0, column=2, padx=5, pady=5, sticky="ew")
+        btn_next.grid(row=0, column=3, padx=5, pady=5, sticky="ew")
         CreateToolTip(btn_next, "Move to the next audio chunk.")
+        self.buttons = (btn_prev, btn_keep, btn_delete, btn_next)
+
+    def _prefetch(self):
+        """Keep spectrogram jobs queued for the current file and the next
+        SPEC_LOOKAHEAD; results outside that window are dropped."""
+        idx = self.current_index
+        window = [self.audio_files[idx]]
+        for _ in range(SPEC_LOOKAHEAD):
+            idx = self._alive.find(1, idx + 1)
+            if idx == -1:
+                break
+            window.append(self.audio_files[idx])
+        for path in list(self._spec_futures):
+            if path not in window:
+                self._spec_futures.pop(path).cancel()
+        for path in window:
+            if path not in self._spec_futures:
+                self._spec_futures[path] = self._pool.submit(_compute_spec, path)
 
     def display_current_file(self):
-        for widget in self.plot_frame.winfo_children():
-            widget.destroy()
+        """
+        Show the current file's spectrogram without blocking the event
+        loop: if its background job hasn't finished, the buttons are
+        disabled (so nobody keeps or deletes a chunk they haven't seen)
+        and the job is polled with ``after`` until it has.
+        """
         current_file = self.audio_files[self.current_index]
-        y, sr = librosa.load(current_file, sr=None)
-        D = librosa.stft(y)
-        S_db = librosa.amplitude_to_db(np.abs(D), ref=np.max)
-        fig, ax = plt.subplots(figsize=(8, 4))
-        img = librosa.display.specshow(S_db, sr=sr, x_axis='time', y_axis='log', ax=ax)
-        ax.set_title(f"Spectrogram: {os.path.basename(current_file)}")
-        fig.colorbar(img, ax=ax, format="%+2.f dB")
-        canvas = FigureCanvasTkAgg(fig, master=self.plot_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        plt.close(fig)
+        self._prefetch()
+        future = self._spec_futures[current_file]
+        if not future.done():
+            for btn in self.buttons:
+                btn.state(["disabled"])
+            self.after(SPEC_POLL_MS, self._draw_when_ready, current_file, future)
+            return
+        self._draw_when_ready(current_file, future)
+
+    def _draw_when_ready(self, path, future):
+        if self._closed:
+            return
+        if not future.done():
+            self.after(SPEC_POLL_MS, self._draw_when_ready, path, future)
+            return
+        for btn in self.buttons:
+            btn.state(["!disabled"])
+        try:
+            S_db, sr = future.result()
+        except Exception as e:
+            log_message(f"Error in display_current_file: {e}", error=True)
+            return
+        # Plain imshow on a linear frequency axis: far cheaper to draw than
+        # specshow's log-frequency pcolormesh.
+        self.file_label.config(text=f"Spectrogram: {os.path.basename(path)}")
+        self.img.set_data(S_db)
+        extent = (0, S_db.shape[1] * SPEC_HOP / sr, 0, sr / 2)
+        if self._bg is None or extent != tuple(self.img.get_extent()):
+            # New duration / rate → the tick labels change: full redraw
+            # (its draw_event recaptures the background).
+            self.img.set_extent(extent)
+            self.canvas.draw_idle()
+        else:
+            # Same-length chunk: only re-raster the image over the axes.
+            self.canvas.restore_region(self._bg)
+            self.ax.draw_artist(self.img)
+            self.canvas.blit(self.ax.bbox)
+
+    def _on_draw(self, event):
+        """After every full redraw (first show, resize, new extent) save
+        the bare axes background, then paint the animated image over it."""
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.img)
+
+    def destroy(self):
+        self._closed = True
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._io_pool.shutdown(wait=True)  # let queued "Keep" moves finish
+        self._report_moves()
+        super().destroy()
+
+    def _report_moves(self):
+        """Log failed background moves (on the Tk thread) and forget finished ones."""
+        for fut in [f for f in self._pending_moves if f.done()]:
+            self._pending_moves.remove(fut)
+            if fut.exception() is not None:
+                log_message(f"Error in keep_current: {fut.exception()}", error=True)
 
     def keep_current(self):
-        shutil.move(self.audio_files[self.current_index], SOUND_FILTERED_DIR)
+        self._pending_moves.append(
+            self._io_pool.submit(_move_into, self.audio_files[self.current_index],
+                                 _ensure_dir(SOUND_FILTERED_DIR)))
         self.remove_current_file()
 
     def delete_current(self):
@@ -385,16 +706,29 @@ class AudioFilterGUI(tk.Toplevel):
         self.remove_current_file()
 
     def remove_current_file(self):
-        del self.audio_files[self.current_index]
-        if self.audio_files:
+        self._report_moves()
+        self._alive[self.current_index] = 0
+        self._n_alive -= 1
+        if self._n_alive:
+            # Next unreviewed file; after the last one, step back to the
+            # closest earlier one that was skipped with "Next".
+            nxt = self._alive.find(1, self.current_index + 1)
+            self.current_index = nxt if nxt != -1 else self._alive.rfind(1, 0, self.current_index)
             self.display_current_file()
         else:
             messagebox.showinfo("Done", "No more files to process.")
             self.destroy()
 
     def next_file(self):
-        if self.current_index < len(self.audio_files) - 1:
-            self.current_index += 1
+        nxt = self._alive.find(1, self.current_index + 1)
+        if nxt != -1:
+            self.current_index = nxt
+            self.display_current_file()
+
+    def prev_file(self):
+        prv = self._alive.rfind(1, 0, self.current_index)
+        if prv != -1:
+            self.current_index = prv
             self.display_current_file()
 
 # --- Main GUI Code with Enhanced UI, Reordered Tabs, and Log Panel ---